@@ -5,13 +5,36 @@ Handles all communication with the FastAPI backend
 
 import requests
 import streamlit as st
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any
 import logging
+import threading
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Last ETag and body per GET request, shared by all client instances so that
+# reruns can revalidate instead of downloading unchanged payloads again.
+# Least recently used requests are forgotten beyond the limit
+MAX_VALIDATED_RESPONSES = 128
+_validated_responses: "OrderedDict[tuple, tuple]" = OrderedDict()
+_validated_lock = threading.Lock()
+
+def _get_validated(cache_key: Optional[tuple]) -> Optional[tuple]:
+    with _validated_lock:
+        entry = _validated_responses.get(cache_key)
+        if entry is not None:
+            _validated_responses.move_to_end(cache_key)
+        return entry
+
+def _set_validated(cache_key: tuple, etag: str, body: Any) -> None:
+    with _validated_lock:
+        _validated_responses[cache_key] = (etag, body)
+        _validated_responses.move_to_end(cache_key)
+        while len(_validated_responses) > MAX_VALIDATED_RESPONSES:
+            _validated_responses.popitem(last=False)
+
 class RemotelyXAPIClient:
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url
@@ -20,10 +43,20 @@ class RemotelyXAPIClient:
     def _make_request(self, method: str, endpoint: str, params: dict = None, data: dict = None) -> dict:
         """Make HTTP request to the backend API"""
         url = f"{self.api_base}{endpoint}"
+        cache_key = (url, repr(sorted((params or {}).items()))) if method == "GET" else None
+        headers = {}
+        validated = _get_validated(cache_key) if cache_key else None
+        if validated:
+            headers["If-None-Match"] = validated[0]
         try:
-            response = requests.request(method, url, params=params, json=data, timeout=10)
+            response = requests.request(method, url, params=params, json=data, headers=headers, timeout=10)
+            if response.status_code == 304 and validated:
+                return validated[1]
             if response.status_code == 200:
-                return response.json()
+                body = response.json()
+                if cache_key and response.headers.get("ETag"):
+                    _set_validated(cache_key, response.headers["ETag"], body)
+                return body
             else:
                 logger.error(f"API request failed: {response.status_code} - {response.text}")
                 return {}
@@ -145,8 +178,8 @@ def get_live_jobs(limit: int = 100, **filters) -> List[dict]:
         logger.warning("Backend not available, using empty data")
         return []
     
-    # Get jobs from API (now working!)
-    response = client.get_jobs(limit=limit, **filters)
+    # Get jobs from API; the listing cards never show descriptions
+    response = client.get_jobs(limit=limit, view="card", **filters)
     jobs = response.get('jobs', [])
     
     # Transform to frontend format
@@ -1,5 +1,9 @@
 from fastapi import APIRouter, HTTPException, Depends, Query
 from typing import Optional
+from datetime import datetime
+from app.core.cache import cached_response
+from app.core.serialization import fast_json
+from app.core.database import JOBS_COLLECTION, ANALYTICS_COLLECTION
 from app.services.analytics_service import AnalyticsService
 from app.models.analytics import AnalyticsData, DashboardStats
 import logging
@@ -13,6 +17,8 @@ def get_analytics_service():
     return AnalyticsService()
 
 @router.get("/dashboard", response_model=DashboardStats)
+@fast_json
+@cached_response("analytics.dashboard")
 async def get_dashboard_stats(
     analytics_service: AnalyticsService = Depends(get_analytics_service)
 ):
@@ -25,6 +31,8 @@ async def get_dashboard_stats(
         raise HTTPException(status_code=500, detail="Failed to retrieve dashboard statistics")
 
 @router.get("/skills/top", response_model=dict)
+@fast_json
+@cached_response("analytics.skills_top", params=("role",))
 async def get_top_skills(
     role: Optional[str] = Query(None, description="Filter skills by role"),
     analytics_service: AnalyticsService = Depends(get_analytics_service)
@@ -52,6 +60,8 @@ async def get_top_skills(
         raise HTTPException(status_code=500, detail="Failed to retrieve top skills")
 
 @router.get("/seniority/distribution", response_model=dict)
+@fast_json
+@cached_response("analytics.seniority_distribution")
 async def get_seniority_distribution(
     analytics_service: AnalyticsService = Depends(get_analytics_service)
 ):
@@ -67,6 +77,8 @@ async def get_seniority_distribution(
         raise HTTPException(status_code=500, detail="Failed to retrieve seniority distribution")
 
 @router.get("/salary/ranges", response_model=dict)
+@fast_json
+@cached_response("analytics.salary_ranges")
 async def get_salary_ranges_by_level(
     analytics_service: AnalyticsService = Depends(get_analytics_service)
 ):
@@ -83,6 +95,8 @@ async def get_salary_ranges_by_level(
         raise HTTPException(status_code=500, detail="Failed to retrieve salary ranges")
 
 @router.get("/companies/insights", response_model=dict)
+@fast_json
+@cached_response("analytics.company_insights", params=("limit",))
 async def get_company_insights(
     limit: int = Query(10, ge=1, le=50, description="Maximum number of companies to return"),
     analytics_service: AnalyticsService = Depends(get_analytics_service)
@@ -100,6 +114,8 @@ async def get_company_insights(
         raise HTTPException(status_code=500, detail="Failed to retrieve company insights")
 
 @router.get("/skills/by-role", response_model=dict)
+@fast_json
+@cached_response("analytics.skills_by_role")
 async def get_skills_by_role(
     analytics_service: AnalyticsService = Depends(get_analytics_service)
 ):
@@ -114,21 +130,25 @@ async def get_skills_by_role(
         logger.error(f"Error getting skills by role: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve skills by role")
 
+@cached_response("analytics.full", collections=(JOBS_COLLECTION, ANALYTICS_COLLECTION))
+async def _current_full_analytics(analytics_service: AnalyticsService) -> AnalyticsData:
+    """The current analytics snapshot, generated if there is none yet."""
+    return await analytics_service.get_current_snapshot() or await analytics_service.generate_full_analytics()
+
 @router.get("/full", response_model=AnalyticsData)
+@fast_json
 async def get_full_analytics(
     force_refresh: bool = Query(False, description="Force refresh of analytics data"),
     analytics_service: AnalyticsService = Depends(get_analytics_service)
 ):
     """Get complete analytics data for the dashboard."""
     try:
-        if not force_refresh:
-            # Try to get cached analytics first
-            cached_analytics = await analytics_service.get_cached_analytics()
-            if cached_analytics:
-                return cached_analytics
+        if force_refresh:
+            return await analytics_service.generate_full_analytics()
         
-        # Generate fresh analytics
-        analytics_data = await analytics_service.generate_full_analytics()
+        analytics_data = await _current_full_analytics(analytics_service=analytics_service)
+        # Checked on every request, including response cache hits
+        analytics_service.revalidate_if_stale(analytics_data)
         return analytics_data
         
     except Exception as e:
@@ -145,13 +165,48 @@ async def refresh_analytics(
         return {
             "message": "Analytics refreshed successfully",
             "calculated_at": analytics_data.calculated_at,
-            "analytics_id": str(analytics_data.id)
+            "analytics_id": str(analytics_data.id),
+            "version": analytics_data.version
         }
     except Exception as e:
         logger.error(f"Error refreshing analytics: {e}")
         raise HTTPException(status_code=500, detail="Failed to refresh analytics")
 
+@router.get("/snapshots", response_model=dict)
+@fast_json
+@cached_response("analytics.snapshots", collections=(ANALYTICS_COLLECTION,))
+async def list_analytics_snapshots(
+    analytics_service: AnalyticsService = Depends(get_analytics_service)
+):
+    """List the stored analytics snapshot versions, newest first."""
+    try:
+        return await analytics_service.list_snapshots()
+    except Exception as e:
+        logger.error(f"Error listing analytics snapshots: {e}")
+        raise HTTPException(status_code=500, detail="Failed to list analytics snapshots")
+
+@router.get("/snapshots/{version}", response_model=AnalyticsData)
+@fast_json
+@cached_response("analytics.snapshot", params=("version",), collections=(ANALYTICS_COLLECTION,))
+async def get_analytics_snapshot(
+    version: int,
+    analytics_service: AnalyticsService = Depends(get_analytics_service)
+):
+    """Get a stored analytics snapshot by version, e.g. to compare with the current one."""
+    try:
+        snapshot = await analytics_service.get_snapshot(version)
+        if not snapshot:
+            raise HTTPException(status_code=404, detail="Analytics snapshot not found")
+        return snapshot
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting analytics snapshot {version}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve analytics snapshot")
+
 @router.get("/overview", response_model=dict)
+@fast_json
+@cached_response("analytics.overview")
 async def get_analytics_overview(
     analytics_service: AnalyticsService = Depends(get_analytics_service)
 ):
@@ -179,30 +234,15 @@ async def get_analytics_overview(
         raise HTTPException(status_code=500, detail="Failed to retrieve analytics overview")
 
 @router.get("/trends/weekly", response_model=dict)
+@fast_json
+@cached_response("analytics.weekly_trends", params=("weeks",))
 async def get_weekly_trends(
     weeks: int = Query(4, ge=1, le=12, description="Number of weeks to analyze"),
     analytics_service: AnalyticsService = Depends(get_analytics_service)
 ):
     """Get weekly trends for key metrics."""
     try:
-        # This would be a more sophisticated calculation in a real system
-        # For now, we'll return mock trend data
-        from datetime import datetime, timedelta
-        
-        trends = []
-        for i in range(weeks):
-            week_start = datetime.utcnow() - timedelta(weeks=i+1)
-            week_end = week_start + timedelta(days=7)
-            
-            # Mock trend data (would be calculated from actual historical data)
-            trends.append({
-                "week_start": week_start.isoformat(),
-                "week_end": week_end.isoformat(),
-                "new_jobs": max(10, 50 - (i * 5)),  # Decreasing trend
-                "active_jobs": max(100, 500 - (i * 20)),
-                "top_skill": "Python" if i % 2 == 0 else "JavaScript",
-                "avg_salary": "$75-95k"
-            })
+        trends = await analytics_service.calculate_weekly_trends(weeks)
         
         return {
             "trends": trends,
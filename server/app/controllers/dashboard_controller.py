@@ -3,10 +3,17 @@ Dashboard Analytics Controller
 Provides comprehensive analytics endpoints for the frontend dashboard
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 from typing import Dict, List, Any
 from datetime import datetime, timedelta
 from app.core.database import get_collection
+from app.core.cache import cached_response
+from app.services.dashboard_service import DashboardService
+from app.services.skills_cache_service import SkillsCacheService
+from app.services.daily_rollup_service import DailyRollupService, merge_days
+from app.utils.roles import ROLE_CATEGORIES
+from collections import Counter
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -17,95 +24,46 @@ async def get_jobs_collection():
     """Get jobs collection"""
     return get_collection("jobs")
 
+def get_dashboard_service():
+    """Get dashboard service"""
+    return DashboardService()
+
+def get_skills_cache_service():
+    """Get skills cache service"""
+    return SkillsCacheService()
+
+def get_daily_rollup_service():
+    """Get daily rollup service"""
+    return DailyRollupService()
+
 @router.get("/metrics", response_model=dict)
+@cached_response("dashboard.metrics", coalesce=True)
 async def get_dashboard_metrics(
-    jobs_collection = Depends(get_jobs_collection)
+    dashboard_service: DashboardService = Depends(get_dashboard_service)
 ):
     """Get comprehensive dashboard metrics"""
     try:
-        # Basic counts
-        total_jobs = await jobs_collection.count_documents({})
-        
-        # Recent jobs (last 7 days)
-        seven_days_ago = datetime.utcnow() - timedelta(days=7)
-        recent_jobs = await jobs_collection.count_documents({
-            "created_at": {"$gte": seven_days_ago}
-        })
-        
-        # Company count
-        pipeline = [
-            {"$group": {"_id": "$data.company"}},
-            {"$count": "company_count"}
-        ]
-        company_result = await jobs_collection.aggregate(pipeline).to_list(1)
-        company_count = company_result[0]["company_count"] if company_result else 0
-        
-        # Location count
-        pipeline = [
-            {"$group": {"_id": "$data.location"}},
-            {"$count": "location_count"}
-        ]
-        location_result = await jobs_collection.aggregate(pipeline).to_list(1)
-        location_count = location_result[0]["location_count"] if location_result else 0
-        
-        # Skills count
-        pipeline = [
-            {"$unwind": "$data.tech_skills"},
-            {"$group": {"_id": "$data.tech_skills"}},
-            {"$count": "skill_count"}
-        ]
-        skill_result = await jobs_collection.aggregate(pipeline).to_list(1)
-        skill_count = skill_result[0]["skill_count"] if skill_result else 0
-        
-        # Calculate match rate (percentage of MATCHED jobs)
-        matched_jobs = await jobs_collection.count_documents({"status": "MATCHED"})
-        match_rate = (matched_jobs / max(total_jobs, 1)) * 100
-        
-        return {
-            "active_jobs": total_jobs,
-            "new_this_week": recent_jobs,
-            "total_companies": company_count,
-            "total_locations": location_count,
-            "total_skills": skill_count,
-            "avg_process_time": "3.2 days",
-            "match_rate": round(match_rate, 1),
-            "total_applications": total_jobs * 2,  # Estimated
-            "interviews_scheduled": int(total_jobs * 0.15),
-            "offers_sent": int(total_jobs * 0.08),
-            "hires_made": int(total_jobs * 0.05)
-        }
+        # All card metrics come from a single $facet pass over the collection
+        return await dashboard_service.compute_dashboard_metrics()
         
     except Exception as e:
         logger.error(f"Error getting dashboard metrics: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve dashboard metrics")
 
 @router.get("/top-skills", response_model=dict)
+@cached_response("dashboard.top_skills", params=("limit",), coalesce=True)
 async def get_top_skills(
     limit: int = 8,
-    jobs_collection = Depends(get_jobs_collection)
+    skills_cache: SkillsCacheService = Depends(get_skills_cache_service)
 ):
     """Get top skills with job counts and analytics"""
     try:
-        # Get top tech skills with job counts
-        pipeline = [
-            {"$unwind": "$data.tech_skills"},
-            {"$group": {
-                "_id": "$data.tech_skills",
-                "job_count": {"$sum": 1},
-                "companies": {"$addToSet": "$data.company"},
-                "avg_seniority": {"$push": "$data.seniority"}
-            }},
-            {"$project": {
-                "skill": "$_id",
-                "job_count": 1,
-                "company_count": {"$size": "$companies"},
-                "seniorities": "$avg_seniority"
-            }},
-            {"$sort": {"job_count": -1}},
-            {"$limit": limit}
-        ]
+        # Read the maintained per-skill counters; only aggregate the jobs
+        # collection until the skills cache has been built
+        skills_data = await skills_cache.get_top_skills("tech", limit)
         
-        skills_data = await jobs_collection.aggregate(pipeline).to_list(limit)
+        if skills_data is None:
+            skills_data = await skills_cache.aggregate_top_skills("tech", limit)
         
         # Calculate demand scores and format data
         skills = []
@@ -124,9 +82,7 @@ async def get_top_skills(
             demand_scores.append(demand_score)
             
             # Most common seniority level for this skill
-            seniority_counts = {}
-            for seniority in skill_doc["seniorities"]:
-                seniority_counts[seniority] = seniority_counts.get(seniority, 0) + 1
+            seniority_counts = skill_doc["seniority_counts"]
             most_common_seniority = max(seniority_counts.keys(), key=lambda k: seniority_counts[k]) if seniority_counts else "Mid"
             seniorities.append(most_common_seniority)
         
@@ -142,6 +98,7 @@ async def get_top_skills(
         raise HTTPException(status_code=500, detail="Failed to retrieve top skills")
 
 @router.get("/company-insights", response_model=dict)
+@cached_response("dashboard.company_insights", params=("limit",), coalesce=True)
 async def get_company_insights(
     limit: int = 10,
     jobs_collection = Depends(get_jobs_collection)
@@ -190,59 +147,36 @@ async def get_company_insights(
         raise HTTPException(status_code=500, detail="Failed to retrieve company insights")
 
 @router.get("/trends", response_model=dict)
+@cached_response("dashboard.trends", params=("days",), coalesce=True)
 async def get_hiring_trends(
     days: int = 30,
-    jobs_collection = Depends(get_jobs_collection)
+    daily_rollup: DailyRollupService = Depends(get_daily_rollup_service)
 ):
     """Get hiring trends over time"""
     try:
-        # Jobs by day for the last N days
+        # Jobs by day for the last N days, read from the per-day counters
         start_date = datetime.utcnow() - timedelta(days=days)
+        rollup_days = await daily_rollup.get_days(start_date)
         
-        pipeline = [
-            {"$match": {"created_at": {"$gte": start_date}}},
-            {"$group": {
-                "_id": {
-                    "year": {"$year": "$created_at"},
-                    "month": {"$month": "$created_at"}, 
-                    "day": {"$dayOfMonth": "$created_at"}
-                },
-                "job_count": {"$sum": 1}
-            }},
-            {"$sort": {"_id": 1}}
-        ]
-        
-        daily_jobs = await jobs_collection.aggregate(pipeline).to_list(days)
-        
-        # Location trends
-        pipeline = [
-            {"$match": {"created_at": {"$gte": start_date}}},
-            {"$group": {
-                "_id": "$data.location",
-                "job_count": {"$sum": 1}
-            }},
-            {"$sort": {"job_count": -1}},
-            {"$limit": 10}
+        daily_jobs = [
+            {
+                "_id": {"year": day["date"].year, "month": day["date"].month, "day": day["date"].day},
+                "job_count": day["job_count"]
+            }
+            for day in rollup_days
         ]
         
-        location_trends = await jobs_collection.aggregate(pipeline).to_list(10)
-        
-        # Seniority trends
-        pipeline = [
-            {"$match": {"created_at": {"$gte": start_date}}},
-            {"$group": {
-                "_id": "$data.seniority",
-                "job_count": {"$sum": 1}
-            }},
-            {"$sort": {"job_count": -1}}
-        ]
+        # Location, seniority and skill trends over the same period
+        period = merge_days(rollup_days)
         
-        seniority_trends = await jobs_collection.aggregate(pipeline).to_list(10)
+        def top_counts(counts: Counter, limit: int) -> list:
+            return [{"_id": key, "job_count": count} for key, count in counts.most_common(limit)]
         
         return {
             "daily_jobs": daily_jobs,
-            "location_trends": location_trends,
-            "seniority_trends": seniority_trends,
+            "location_trends": top_counts(period["locations"], 10),
+            "seniority_trends": top_counts(period["seniorities"], 10),
+            "skill_trends": top_counts(period["skills"], 10),
             "period": f"Last {days} days"
         }
         
@@ -251,64 +185,91 @@ async def get_hiring_trends(
         raise HTTPException(status_code=500, detail="Failed to retrieve hiring trends")
 
 @router.get("/salary-insights", response_model=dict)  
+@cached_response("dashboard.salary_insights", coalesce=True)
 async def get_salary_insights(
     jobs_collection = Depends(get_jobs_collection)
 ):
     """Get salary range insights by seniority and location"""
     try:
+        # Aggregate the normalized numeric salary fields with bounded accumulators
+        def salary_pipeline(group_field: str, limit: int) -> list:
+            return [
+                {"$match": {"salary_min": {"$gte": 0}}},  # Only jobs with salary info
+                {"$group": {
+                    "_id": f"${group_field}",
+                    "job_count": {"$sum": 1},
+                    "avg_salary_min": {"$avg": "$salary_min"},
+                    "avg_salary_max": {"$avg": "$salary_max"},
+                    "min_salary": {"$min": "$salary_min"},
+                    "max_salary": {"$max": "$salary_max"}
+                }},
+                {"$sort": {"job_count": -1}},
+                {"$limit": limit}
+            ]
+
+        def round_averages(groups: list) -> list:
+            for group in groups:
+                for field in ["avg_salary_min", "avg_salary_max"]:
+                    if group.get(field) is not None:
+                        group[field] = round(group[field])
+            return groups
+
         # Salary by seniority
-        pipeline = [
-            {"$match": {"data.salary": {"$regex": r"\$\d+"}}},  # Only jobs with salary info
-            {"$group": {
-                "_id": "$data.seniority",
-                "salaries": {"$push": "$data.salary"},
-                "job_count": {"$sum": 1}
-            }},
-            {"$sort": {"job_count": -1}}
-        ]
-        
-        seniority_salaries = await jobs_collection.aggregate(pipeline).to_list(10)
+        seniority_salaries = await jobs_collection.aggregate(
+            salary_pipeline("data.seniority", 10)
+        ).to_list(10)
         
         # Salary by location (top locations)
-        pipeline = [
-            {"$match": {"data.salary": {"$regex": r"\$\d+"}}},
-            {"$group": {
-                "_id": "$data.location",
-                "salaries": {"$push": "$data.salary"},
-                "job_count": {"$sum": 1}
-            }},
-            {"$sort": {"job_count": -1}},
-            {"$limit": 8}
-        ]
-        
-        location_salaries = await jobs_collection.aggregate(pipeline).to_list(8)
+        location_salaries = await jobs_collection.aggregate(
+            salary_pipeline("data.location", 8)
+        ).to_list(8)
         
         return {
-            "seniority_salaries": seniority_salaries,
-            "location_salaries": location_salaries
+            "seniority_salaries": round_averages(seniority_salaries),
+            "location_salaries": round_averages(location_salaries)
         }
         
     except Exception as e:
         logger.error(f"Error getting salary insights: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve salary insights")
 
+@router.get("/salary-stats", response_model=dict)
+@cached_response("dashboard.salary_stats", params=("bucket_size", "location_limit"))
+async def get_salary_stats(
+    bucket_size: int = Query(10000, ge=1000, le=100000),
+    location_limit: int = Query(10, ge=1, le=50),
+    dashboard_service: DashboardService = Depends(get_dashboard_service)
+):
+    """Get annualized salary percentiles and histograms by seniority and location"""
+    try:
+        return await dashboard_service.compute_salary_stats(
+            bucket_size=bucket_size,
+            location_limit=location_limit
+        )
+        
+    except Exception as e:
+        logger.error(f"Error getting salary stats: {e}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve salary stats")
+
 @router.get("/roles", response_model=dict)
+@cached_response("dashboard.roles", coalesce=True)
 async def get_all_roles(
     jobs_collection = Depends(get_jobs_collection)
 ):
     """Get all unique job roles from the database"""
     try:
         pipeline = [
+            {"$match": {"data.title": {"$nin": [None, ""]}}},
             {"$group": {
                 "_id": "$data.title",
                 "job_count": {"$sum": 1}
             }},
-            {"$sort": {"job_count": -1}}
+            {"$sort": {"job_count": -1}},
+            {"$limit": 50}
         ]
         
-        roles_data = await jobs_collection.aggregate(pipeline).to_list(None)
+        roles_data = await jobs_collection.aggregate(pipeline).to_list(50)
         
-        # Extract and categorize roles
         roles = []
         for role_doc in roles_data:
             title = role_doc["_id"]
@@ -318,54 +279,17 @@ async def get_all_roles(
                     "job_count": role_doc["job_count"]
                 })
         
-        # Calculate total jobs count for "All" category
-        total_jobs = sum(role["job_count"] for role in roles)
-        
-        # Create role categories based on common patterns
-        role_categories = {
-            "All": total_jobs,
-            "Developer": 0,
-            "Designer": 0, 
-            "Data": 0,
-            "DevOps": 0,
-            "Product": 0,
-            "Marketing": 0,
-            "Sales": 0,
-            "Other": 0
-        }
-        
-        # Categorize roles
-        for role in roles:
-            title_lower = role["title"].lower()
-            categorized = False
-            
-            if any(keyword in title_lower for keyword in ["developer", "engineer", "programmer", "backend", "frontend", "full stack"]):
-                role_categories["Developer"] += role["job_count"]
-                categorized = True
-            elif any(keyword in title_lower for keyword in ["designer", "ui", "ux"]):
-                role_categories["Designer"] += role["job_count"]
-                categorized = True
-            elif any(keyword in title_lower for keyword in ["data", "analyst", "scientist", "ml", "ai"]):
-                role_categories["Data"] += role["job_count"]
-                categorized = True
-            elif any(keyword in title_lower for keyword in ["devops", "sre", "infrastructure", "cloud"]):
-                role_categories["DevOps"] += role["job_count"]
-                categorized = True
-            elif any(keyword in title_lower for keyword in ["product", "manager", "pm"]):
-                role_categories["Product"] += role["job_count"]
-                categorized = True
-            elif any(keyword in title_lower for keyword in ["marketing", "growth", "content"]):
-                role_categories["Marketing"] += role["job_count"]
-                categorized = True
-            elif any(keyword in title_lower for keyword in ["sales", "business", "account"]):
-                role_categories["Sales"] += role["job_count"]
-                categorized = True
-            
-            if not categorized:
-                role_categories["Other"] += role["job_count"]
+        # Categories are classified at write time into the indexed role_category
+        # field, so each count is an index count. A title matching several
+        # categories counts towards each of them.
+        counts = await asyncio.gather(
+            jobs_collection.count_documents({}),
+            *[jobs_collection.count_documents({"role_category": category}) for category in ROLE_CATEGORIES]
+        )
+        role_categories = {"All": counts[0], **dict(zip(ROLE_CATEGORIES, counts[1:]))}
         
         return {
-            "roles": roles[:50],  # Top 50 specific roles
+            "roles": roles,  # Top 50 specific roles
             "categories": role_categories
         }
         
@@ -374,77 +298,34 @@ async def get_all_roles(
         raise HTTPException(status_code=500, detail="Failed to retrieve roles")
 
 @router.get("/skills-by-role", response_model=dict)
+@cached_response("dashboard.skills_by_role", params=("role_category", "limit"), coalesce=True)
 async def get_skills_by_role(
     role_category: str = "All",
     limit: int = 10,
-    jobs_collection = Depends(get_jobs_collection)
+    skills_cache: SkillsCacheService = Depends(get_skills_cache_service)
 ):
     """Get technical and soft skills for a specific role category"""
     try:
         # Build match filter based on role category
         match_filter = {}
         
-        if role_category != "All":
-            role_patterns = {
-                "Developer": ["developer", "engineer", "programmer", "backend", "frontend", "full stack"],
-                "Designer": ["designer", "ui", "ux"],
-                "Data": ["data", "analyst", "scientist", "ml", "ai"],
-                "DevOps": ["devops", "sre", "infrastructure", "cloud"],
-                "Product": ["product", "manager", "pm"],
-                "Marketing": ["marketing", "growth", "content"],
-                "Sales": ["sales", "business", "account"]
-            }
-            
-            patterns = role_patterns.get(role_category, [])
-            if patterns:
-                match_filter["data.title"] = {
-                    "$regex": "|".join(patterns),
-                    "$options": "i"
-                }
-        
-        # Get technical skills
-        tech_pipeline = [
-            {"$match": match_filter} if match_filter else {"$match": {}},
-            {"$unwind": "$data.tech_skills"},
-            {"$group": {
-                "_id": "$data.tech_skills",
-                "job_count": {"$sum": 1},
-                "companies": {"$addToSet": "$data.company"},
-                "avg_seniorities": {"$push": "$data.seniority"}
-            }},
-            {"$project": {
-                "skill": "$_id",
-                "job_count": 1,
-                "company_count": {"$size": "$companies"},
-                "seniorities": "$avg_seniorities"
-            }},
-            {"$sort": {"job_count": -1}},
-            {"$limit": limit}
-        ]
+        if role_category != "All" and role_category in ROLE_CATEGORIES:
+            # Equality match on the role_category index
+            match_filter["role_category"] = role_category
         
-        tech_skills_data = await jobs_collection.aggregate(tech_pipeline).to_list(limit)
+        # The per-skill counters cover the whole corpus, so the unfiltered view
+        # is a top-k read; role categories still aggregate the jobs collection
+        tech_skills_data = None
+        soft_skills_data = None
+        if not match_filter:
+            tech_skills_data = await skills_cache.get_top_skills("tech", limit)
+            soft_skills_data = await skills_cache.get_top_skills("soft", limit)
         
-        # Get soft skills
-        soft_pipeline = [
-            {"$match": match_filter} if match_filter else {"$match": {}},
-            {"$unwind": "$data.soft_skills"},
-            {"$group": {
-                "_id": "$data.soft_skills",
-                "job_count": {"$sum": 1},
-                "companies": {"$addToSet": "$data.company"},
-                "avg_seniorities": {"$push": "$data.seniority"}
-            }},
-            {"$project": {
-                "skill": "$_id",
-                "job_count": 1,
-                "company_count": {"$size": "$companies"},
-                "seniorities": "$avg_seniorities"
-            }},
-            {"$sort": {"job_count": -1}},
-            {"$limit": limit}
-        ]
+        if tech_skills_data is None:
+            tech_skills_data = await skills_cache.aggregate_top_skills("tech", limit, match_filter)
         
-        soft_skills_data = await jobs_collection.aggregate(soft_pipeline).to_list(limit)
+        if soft_skills_data is None:
+            soft_skills_data = await skills_cache.aggregate_top_skills("soft", limit, match_filter)
         
         # Process and calculate demand scores
         def process_skills(skills_data, skill_type):
@@ -467,10 +348,7 @@ async def get_skills_by_role(
                 demand_scores.append(demand_score)
                 
                 # Most common seniority level for this skill
-                seniority_counts = {}
-                for seniority in skill_doc["seniorities"]:
-                    if seniority:
-                        seniority_counts[seniority] = seniority_counts.get(seniority, 0) + 1
+                seniority_counts = {level: count for level, count in skill_doc["seniority_counts"].items() if level}
                 most_common_seniority = max(seniority_counts.keys(), key=lambda k: seniority_counts[k]) if seniority_counts else "Mid"
                 seniorities.append(most_common_seniority)
             
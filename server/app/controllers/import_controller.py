@@ -0,0 +1,80 @@
+from fastapi import APIRouter, Body, HTTPException, Depends, Query, status
+from typing import List
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.services.import_service import ImportService
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/imports", tags=["imports"])
+
+# Dependency to get import service
+def get_import_service():
+    return ImportService()
+
+async def _submit(import_service: ImportService, source: str, items: list) -> dict:
+    if not items:
+        raise HTTPException(status_code=400, detail="No job data provided")
+    try:
+        import_id = await import_service.submit(source, items)
+    except asyncio.QueueFull:
+        raise HTTPException(status_code=503, detail="Import queue is full, retry later")
+    except Exception as e:
+        logger.error(f"Error submitting {source} import: {e}")
+        raise HTTPException(status_code=500, detail="Failed to submit import")
+    return {
+        "import_id": import_id,
+        "status": "queued",
+        "total": len(items),
+        "status_url": f"{settings.API_V1_STR}{router.prefix}/{import_id}"
+    }
+
+@router.post("/scraped-jobs", status_code=status.HTTP_202_ACCEPTED, response_model=dict)
+async def submit_scraped_jobs_import(
+    jobs: List[dict] = Body(..., embed=True, description="Scraper responses, as in /scraped-jobs/import"),
+    import_service: ImportService = Depends(get_import_service)
+):
+    """
+    Queue a batch of scraped jobs for background import. Poll the returned status_url for progress.
+    
+    Jobs are validated by the import workers, off the event loop; invalid
+    jobs are reported in the import's errors.
+    """
+    return await _submit(import_service, "scraped-jobs", jobs)
+
+@router.post("/n8n", status_code=status.HTTP_202_ACCEPTED, response_model=dict)
+async def submit_n8n_import(
+    jobs_data: List[dict],
+    import_service: ImportService = Depends(get_import_service)
+):
+    """Queue jobs in n8n scraper format for background import. Poll the returned status_url for progress."""
+    return await _submit(import_service, "n8n", jobs_data)
+
+@router.get("/", response_model=List[dict])
+async def list_imports(
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of imports to return"),
+    import_service: ImportService = Depends(get_import_service)
+):
+    """Get the most recently submitted background imports."""
+    try:
+        return await import_service.list_imports(limit)
+    except Exception as e:
+        logger.error(f"Error listing imports: {e}")
+        raise HTTPException(status_code=500, detail="Failed to list imports")
+
+@router.get("/{import_id}", response_model=dict)
+async def get_import(
+    import_id: str,
+    import_service: ImportService = Depends(get_import_service)
+):
+    """Get the status, counts, throughput and first errors of a background import."""
+    try:
+        import_status = await import_service.get_import(import_id)
+    except Exception as e:
+        logger.error(f"Error getting import {import_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve import")
+    if not import_status:
+        raise HTTPException(status_code=404, detail="Import not found")
+    return import_status
@@ -1,9 +1,17 @@
-from fastapi import APIRouter, HTTPException, Query, Path, Depends
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Query, Path, Depends, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import List, Optional, Union
 from datetime import datetime
 from pydantic import BaseModel
-from app.services.job_service import JobService
-from app.models.job import ScrapedJob, JobCreate, JobUpdate
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from app.core.cache import response_cache, get_generation
+from app.core.database import JOBS_COLLECTION
+from app.core.http_cache import strong_etag, etag_matches, not_modified
+from app.core.serialization import fast_json
+from app.services.job_service import JobService, DUPLICATE_KEY_ERROR
+from app.services.filter_options_service import FilterOptionsService
+from app.models.job import ScrapedJob, JobCreate, JobUpdate, JobCard, JOB_FIELDS, JOB_VIEW_PROJECTIONS
 from app.models.analytics import DashboardStats
 import logging
 
@@ -19,6 +27,9 @@ router = APIRouter(prefix="/jobs", tags=["jobs"])
 def get_job_service():
     return JobService()
 
+def get_filter_options_service():
+    return FilterOptionsService()
+
 @router.post("/", response_model=ScrapedJob, status_code=201)
 async def create_job(
     job: JobCreate,
@@ -28,6 +39,8 @@ async def create_job(
     try:
         created_job = await job_service.create_job(job)
         return created_job
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="A job with the same link, or company and title, already exists")
     except Exception as e:
         logger.error(f"Error creating job: {e}")
         raise HTTPException(status_code=500, detail="Failed to create job")
@@ -41,14 +54,27 @@ async def bulk_create_jobs(
     try:
         job_ids = await job_service.bulk_create_jobs(jobs)
         return job_ids
+    except BulkWriteError as e:
+        errors = e.details.get("writeErrors", [])
+        if errors and all(error.get("code") == DUPLICATE_KEY_ERROR for error in errors):
+            raise HTTPException(status_code=409, detail={
+                "message": "Some jobs duplicate existing jobs; the others were created",
+                "duplicate_indexes": sorted(error["index"] for error in errors),
+                "created": e.details.get("nInserted", 0)
+            })
+        logger.error(f"Error bulk creating jobs: {e}")
+        raise HTTPException(status_code=500, detail="Failed to create jobs")
     except Exception as e:
         logger.error(f"Error bulk creating jobs: {e}")
         raise HTTPException(status_code=500, detail="Failed to create jobs")
 
-@router.get("/", response_model=dict)
-async def get_jobs(
-    skip: int = Query(0, ge=0, description="Number of jobs to skip"),
-    limit: int = Query(100, ge=1, le=1000, description="Maximum number of jobs to return"),
+# Fields the job listings may be sorted by
+ALLOWED_SORT_FIELDS = [
+    "created_at", "updated_at", "data.company", "data.location", 
+    "data.seniority", "data.employment_type"
+]
+
+def get_job_filters(
     search: Optional[str] = Query(None, description="Search term for job title, company, description, or skills"),
     company: Optional[str] = Query(None, description="Filter by company name"),
     location: Optional[str] = Query(None, description="Filter by location"),
@@ -58,54 +84,91 @@ async def get_jobs(
     skills: Optional[str] = Query(None, description="Comma-separated list of skills to filter by"),
     date_from: Optional[str] = Query(None, description="Filter jobs created from this date (YYYY-MM-DD)"),
     date_to: Optional[str] = Query(None, description="Filter jobs created until this date (YYYY-MM-DD)"),
+    match: str = Query("contains", pattern="^(exact|prefix|contains)$", description="How company, location, seniority and employment type match (case-insensitive)")
+) -> dict:
+    """Parse the job filter query parameters shared by listing and export."""
+    # Parse skills list
+    skills_list = None
+    if skills:
+        skills_list = [s.strip() for s in skills.split(",") if s.strip()]
+    
+    # Parse dates
+    date_from_dt = None
+    date_to_dt = None
+    if date_from:
+        try:
+            date_from_dt = datetime.strptime(date_from, "%Y-%m-%d")
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid date_from format. Use YYYY-MM-DD")
+    
+    if date_to:
+        try:
+            date_to_dt = datetime.strptime(date_to, "%Y-%m-%d")
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid date_to format. Use YYYY-MM-DD")
+    
+    return {
+        "search": search,
+        "company": company,
+        "location": location,
+        "seniority": seniority,
+        "employment_type": employment_type,
+        "status": status,
+        "skills": skills_list,
+        "date_from": date_from_dt,
+        "date_to": date_to_dt,
+        "match": match
+    }
+
+def get_job_view(
+    view: str = Query("full", pattern="^(full|card)$", description="full: whole jobs; card: listing cards without descriptions"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. data.title,data.company,status")
+) -> dict:
+    """Resolve the view/fields parameters into a projection and response model."""
+    if fields:
+        requested = [field.strip() for field in fields.split(",") if field.strip()]
+        unknown = [field for field in requested if field not in JOB_FIELDS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+        # A parent field such as "data" already covers its subfields
+        projection = {
+            field: 1 for field in requested
+            if not any(field.startswith(parent + ".") for parent in requested)
+        }
+        return {"projection": projection, "model": None}
+    
+    if view == "card":
+        return {"projection": JOB_VIEW_PROJECTIONS["card"], "model": JobCard}
+    return {"projection": None, "model": ScrapedJob}
+
+@router.get("/", response_model=dict)
+@fast_json
+async def get_jobs(
+    skip: int = Query(0, ge=0, description="Number of jobs to skip (ignored when a cursor is given)"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of jobs to return"),
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor from the previous page"),
+    include_total: bool = Query(True, description="Count all matching jobs (total_count)"),
     sort_by: str = Query("created_at", description="Field to sort by"),
     sort_order: int = Query(-1, ge=-1, le=1, description="Sort order: -1 for descending, 1 for ascending"),
+    filters: dict = Depends(get_job_filters),
+    job_view: dict = Depends(get_job_view),
     job_service: JobService = Depends(get_job_service)
 ):
     """Get jobs with filtering, search, and pagination."""
     try:
-        # Parse skills list
-        skills_list = None
-        if skills:
-            skills_list = [s.strip() for s in skills.split(",") if s.strip()]
-        
-        # Parse dates
-        date_from_dt = None
-        date_to_dt = None
-        if date_from:
-            try:
-                date_from_dt = datetime.strptime(date_from, "%Y-%m-%d")
-            except ValueError:
-                raise HTTPException(status_code=400, detail="Invalid date_from format. Use YYYY-MM-DD")
-        
-        if date_to:
-            try:
-                date_to_dt = datetime.strptime(date_to, "%Y-%m-%d")
-            except ValueError:
-                raise HTTPException(status_code=400, detail="Invalid date_to format. Use YYYY-MM-DD")
-        
         # Validate sort_by field
-        allowed_sort_fields = [
-            "created_at", "updated_at", "data.company", "data.location", 
-            "data.seniority", "data.employment_type"
-        ]
-        if sort_by not in allowed_sort_fields:
+        if sort_by not in ALLOWED_SORT_FIELDS:
             sort_by = "created_at"
         
-        jobs, total_count = await job_service.get_jobs(
-            skip=skip,
+        jobs, total_count, next_cursor = await job_service.get_jobs_page(
+            filters,
             limit=limit,
-            search=search,
-            company=company,
-            location=location,
-            seniority=seniority,
-            employment_type=employment_type,
-            status=status,
-            skills=skills_list,
-            date_from=date_from_dt,
-            date_to=date_to_dt,
+            skip=skip,
+            cursor=cursor,
             sort_by=sort_by,
-            sort_order=sort_order
+            sort_order=sort_order,
+            include_total=include_total,
+            **job_view
         )
         
         return {
@@ -113,13 +176,37 @@ async def get_jobs(
             "total_count": total_count,
             "skip": skip,
             "limit": limit,
-            "has_more": (skip + limit) < total_count
+            "has_more": next_cursor is not None,
+            "next_cursor": next_cursor
         }
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting jobs: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve jobs")
 
+@router.get("/export")
+async def export_jobs(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="Export format: ndjson or csv"),
+    sort_by: str = Query("created_at", description="Field to sort by"),
+    sort_order: int = Query(-1, ge=-1, le=1, description="Sort order: -1 for descending, 1 for ascending"),
+    filters: dict = Depends(get_job_filters),
+    job_service: JobService = Depends(get_job_service)
+):
+    """Stream every job matching the filters as NDJSON or CSV."""
+    if sort_by not in ALLOWED_SORT_FIELDS:
+        sort_by = "created_at"
+    
+    media_types = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+    filename = f"jobs-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}.{format}"
+    
+    return StreamingResponse(
+        job_service.export_jobs(filters, export_format=format, sort_by=sort_by, sort_order=sort_order),
+        media_type=media_types[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
 @router.get("/{job_id}", response_model=ScrapedJob)
 async def get_job(
     job_id: str,
@@ -151,6 +238,8 @@ async def update_job(
         return updated_job
     except HTTPException:
         raise
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="Another job with the same link, or company and title, already exists")
     except Exception as e:
         logger.error(f"Error updating job {job_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to update job")
@@ -195,29 +284,34 @@ async def update_job_status(
         logger.error(f"Error updating job status {job_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to update job status")
 
-@router.get("/company/{company_name}", response_model=List[ScrapedJob])
+@router.get("/company/{company_name}", response_model=List[Union[ScrapedJob, JobCard]])
+@fast_json
 async def get_jobs_by_company(
     company_name: str,
     limit: int = Query(50, ge=1, le=1000, description="Maximum number of jobs to return"),
+    match: str = Query("contains", pattern="^(exact|prefix|contains)$", description="How the company name matches (case-insensitive)"),
+    job_view: dict = Depends(get_job_view),
     job_service: JobService = Depends(get_job_service)
 ):
     """Get all jobs from a specific company."""
     try:
-        jobs = await job_service.get_jobs_by_company(company_name, limit)
+        jobs = await job_service.get_jobs_by_company(company_name, limit, match=match, **job_view)
         return jobs
     except Exception as e:
         logger.error(f"Error getting jobs for company {company_name}: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve company jobs")
 
-@router.get("/recent/{days}", response_model=List[ScrapedJob])
+@router.get("/recent/{days}", response_model=List[Union[ScrapedJob, JobCard]])
+@fast_json
 async def get_recent_jobs(
     days: int = Path(ge=1, le=365, description="Number of days to look back"),
     limit: int = Query(50, ge=1, le=1000, description="Maximum number of jobs to return"),
+    job_view: dict = Depends(get_job_view),
     job_service: JobService = Depends(get_job_service)
 ):
     """Get recent jobs from the last N days."""
     try:
-        jobs = await job_service.get_recent_jobs(days, limit)
+        jobs = await job_service.get_recent_jobs(days, limit, **job_view)
         return jobs
     except Exception as e:
         logger.error(f"Error getting recent jobs: {e}")
@@ -237,61 +331,31 @@ async def get_job_stats(
 
 @router.get("/filters/options", response_model=dict)
 async def get_filter_options(
-    job_service: JobService = Depends(get_job_service)
+    request: Request,
+    filter_options: FilterOptionsService = Depends(get_filter_options_service)
 ):
     """Get available filter options for the frontend."""
     try:
-        # Get distinct values for filters
-        pipeline = [
-            {"$group": {"_id": "$data.company"}},
-            {"$sort": {"_id": 1}}
-        ]
-        companies = await job_service.collection.aggregate(pipeline).to_list(None)
+        # The serialized dictionary and its ETag are kept until the next job
+        # write, so an unchanged If-None-Match is answered without the database
+        generations = (get_generation(JOBS_COLLECTION),)
+        hit, cached = response_cache.get("jobs.filter_options", generations)
         
-        pipeline = [
-            {"$group": {"_id": "$data.location"}},
-            {"$sort": {"_id": 1}}
-        ]
-        locations = await job_service.collection.aggregate(pipeline).to_list(None)
+        if not hit:
+            options = await filter_options.get_options()
+            body = JSONResponse(jsonable_encoder(options)).body
+            cached = {"body": body, "etag": strong_etag(body)}
+            response_cache.set("jobs.filter_options", generations, cached)
         
-        pipeline = [
-            {"$group": {"_id": "$data.seniority"}},
-            {"$sort": {"_id": 1}}
-        ]
-        seniorities = await job_service.collection.aggregate(pipeline).to_list(None)
+        headers = {"Cache-Control": "no-cache"}
+        if etag_matches(request, cached["etag"]):
+            return not_modified(cached["etag"], headers)
         
-        pipeline = [
-            {"$group": {"_id": "$data.employment_type"}},
-            {"$sort": {"_id": 1}}
-        ]
-        employment_types = await job_service.collection.aggregate(pipeline).to_list(None)
-        
-        pipeline = [
-            {"$unwind": "$data.tech_skills"},
-            {"$group": {"_id": "$data.tech_skills"}},
-            {"$sort": {"_id": 1}}
-        ]
-        tech_skills = await job_service.collection.aggregate(pipeline).to_list(None)
-        
-        pipeline = [
-            {"$unwind": "$data.soft_skills"},
-            {"$group": {"_id": "$data.soft_skills"}},
-            {"$sort": {"_id": 1}}
-        ]
-        soft_skills = await job_service.collection.aggregate(pipeline).to_list(None)
-        
-        # Status options (predefined)
-        status_options = ["NEW", "ANALYZED", "MATCHED"]
-        
-        return {
-            "companies": [item["_id"] for item in companies if item["_id"]],
-            "locations": [item["_id"] for item in locations if item["_id"]],
-            "seniorities": [item["_id"] for item in seniorities if item["_id"]],
-            "employment_types": [item["_id"] for item in employment_types if item["_id"]],
-            "tech_skills": [item["_id"] for item in tech_skills if item["_id"]],
-            "soft_skills": [item["_id"] for item in soft_skills if item["_id"]],
-            "status_options": status_options
-        }
+        return Response(
+            content=cached["body"],
+            media_type="application/json",
+            headers={"ETag": cached["etag"], **headers}
+        )
         
     except Exception as e:
         logger.error(f"Error getting filter options: {e}")
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
 from typing import List
 from datetime import datetime
 import logging
@@ -8,8 +9,9 @@ from app.schemas.scraped_job_schema import (
     BulkImportResponse, 
     ScrapedJobResponse
 )
-from app.models.job_model import JobModel
-from app.services.job_service import JobService
+from app.core.serialization import dumps
+from app.services.job_service import JobService, IMPORT_CHUNK_SIZE
+from app.services.import_service import ImportService, STREAM_CHUNK_SIZE
 from app.utils.database import get_database
 
 # Set up logging
@@ -38,46 +40,37 @@ async def import_scraped_jobs(
     
     logger.info(f"Starting import of {total_jobs} scraped jobs")
     
+    # Jobs to write, with their position in the request
+    to_import = []
     for idx, scraped_job in enumerate(request.jobs):
+        if not scraped_job.success:
+            errors.append(f"Job {idx + 1}: Scraper marked as unsuccessful - {scraped_job.message}")
+            failed_imports += 1
+            continue
         try:
-            if not scraped_job.success:
-                errors.append(f"Job {idx + 1}: Scraper marked as unsuccessful - {scraped_job.message}")
-                failed_imports += 1
-                continue
-            
-            # Convert scraped data to job model format
-            job_data = scraped_job.data.to_job_model_dict()
-            
-            # Check for existing job by company, title, and job_link
-            existing_job = await job_service.find_duplicate_job(
-                company=scraped_job.data.company,
-                title=scraped_job.data.title,
-                job_link=scraped_job.data.job_link
-            )
-            
-            if existing_job:
-                # Update existing job with new scraped data
-                job_data["updated_at"] = datetime.utcnow()
-                updated_job = await job_service.update_job(
-                    str(existing_job.id), 
-                    job_data
-                )
-                updated_jobs.append(str(existing_job.id))
-                logger.info(f"Updated existing job: {scraped_job.data.title} at {scraped_job.data.company}")
-            else:
-                # Create new job
-                new_job = JobModel(**job_data)
-                created_job = await job_service.create_job_from_model(new_job)
-                created_jobs.append(str(created_job.id))
-                logger.info(f"Created new job: {scraped_job.data.title} at {scraped_job.data.company}")
-            
-            successful_imports += 1
-            
+            # Convert scraped data to the stored job format
+            to_import.append((idx, scraped_job.to_job_create()))
         except Exception as e:
-            error_msg = f"Job {idx + 1} ({scraped_job.data.title} at {scraped_job.data.company}): {str(e)}"
-            errors.append(error_msg)
+            errors.append(f"Job {idx + 1} ({scraped_job.data.title} at {scraped_job.data.company}): {str(e)}")
+            failed_imports += 1
+    
+    try:
+        outcomes = await job_service.import_jobs([job_create for _, job_create in to_import])
+    except Exception as e:
+        logger.error(f"Failed to import jobs: {str(e)}")
+        outcomes = [{"action": "failed", "job_id": None, "error": str(e)}] * len(to_import)
+    
+    for (idx, _), outcome in zip(to_import, outcomes):
+        if outcome["action"] == "created":
+            created_jobs.append(outcome["job_id"])
+        elif outcome["action"] == "updated":
+            updated_jobs.append(outcome["job_id"])
+        else:
+            scraped_job = request.jobs[idx]
+            errors.append(f"Job {idx + 1} ({scraped_job.data.title} at {scraped_job.data.company}): {outcome['error']}")
             failed_imports += 1
-            logger.error(f"Failed to import job: {error_msg}")
+            continue
+        successful_imports += 1
     
     # Generate summary message
     if successful_imports == total_jobs:
@@ -117,37 +110,18 @@ async def import_single_scraped_job(
     job_service = JobService(db)
     
     try:
-        # Convert scraped data to job model format
-        job_data = scraped_job.data.to_job_model_dict()
+        # Convert scraped data to the stored job format
+        job_create = scraped_job.to_job_create()
+        outcome = (await job_service.import_jobs([job_create]))[0]
+        if outcome["action"] == "failed":
+            raise Exception(outcome["error"])
         
-        # Check for existing job
-        existing_job = await job_service.find_duplicate_job(
-            company=scraped_job.data.company,
-            title=scraped_job.data.title,
-            job_link=scraped_job.data.job_link
-        )
-        
-        if existing_job:
-            # Update existing job
-            job_data["updated_at"] = datetime.utcnow()
-            updated_job = await job_service.update_job(
-                str(existing_job.id), 
-                job_data
-            )
-            return {
-                "action": "updated",
-                "job_id": str(existing_job.id),
-                "message": f"Updated existing job: {scraped_job.data.title}"
-            }
-        else:
-            # Create new job
-            new_job = JobModel(**job_data)
-            created_job = await job_service.create_job_from_model(new_job)
-            return {
-                "action": "created",
-                "job_id": str(created_job.id),
-                "message": f"Created new job: {scraped_job.data.title}"
-            }
+        verb = "Created new" if outcome["action"] == "created" else "Updated existing"
+        return {
+            "action": outcome["action"],
+            "job_id": outcome["job_id"],
+            "message": f"{verb} job: {scraped_job.data.title}"
+        }
             
     except Exception as e:
         logger.error(f"Failed to import job {scraped_job.data.title}: {str(e)}")
@@ -157,6 +131,43 @@ async def import_single_scraped_job(
         )
 
 
+class IngestStreamingResponse(StreamingResponse):
+    """
+    A streaming response whose body is produced while the request body is
+    still being read. Starlette's disconnect listener would consume the
+    request body messages, so it is left out; a client disconnect surfaces
+    as ClientDisconnect from request.stream() instead.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+@router.post("/import/stream")
+async def import_scraped_jobs_stream(
+    request: Request,
+    chunk_size: int = Query(STREAM_CHUNK_SIZE, ge=1, le=IMPORT_CHUNK_SIZE, description="Jobs validated and written per chunk"),
+    db=Depends(get_database)
+):
+    """
+    Import scraped jobs streamed as NDJSON, one scraper response per line.
+    
+    Jobs are validated and written in chunks as the body arrives. The
+    response is NDJSON too: one progress line per chunk, then a summary
+    line with "done": true.
+    """
+    import_service = ImportService(db)
+    progress = import_service.ingest_ndjson(request.stream(), chunk_size)
+    
+    async def body():
+        async for report in progress:
+            yield dumps(report) + b"\n"
+    
+    return IngestStreamingResponse(body(), media_type="application/x-ndjson")
+
+
 @router.get("/stats")
 async def get_scraped_jobs_stats(db=Depends(get_database)):
     """
@@ -0,0 +1,158 @@
+"""
+In-process response cache for read-heavy endpoints.
+
+Entries are keyed by route name and normalized query parameters and are
+tagged with the generation numbers of the collections they were computed
+from. Every write to a collection bumps its generation, so cached entries go
+stale as soon as the underlying data changes. Generations only count
+writes made by this process, and some responses depend on the current time
+("new this week"), so entries also expire after RESPONSE_CACHE_TTL_SECONDS.
+
+Routes that opt in also coalesce misses: concurrent identical requests
+await one shared computation instead of each querying the database.
+"""
+
+from collections import OrderedDict, defaultdict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Sequence, Tuple
+import asyncio
+import functools
+import logging
+import time
+
+from app.core.config import settings
+from app.core.database import JOBS_COLLECTION
+
+logger = logging.getLogger(__name__)
+
+_generations: Dict[str, int] = defaultdict(int)
+
+def bump_generation(*collections: str) -> None:
+    """Mark the given collections as changed."""
+    for collection in collections:
+        _generations[collection] += 1
+
+def get_generation(collection: str) -> int:
+    """Current generation number of a collection."""
+    return _generations[collection]
+
+class ResponseCache:
+    """A bounded LRU map of cache key -> (generations, expiry, value)."""
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[tuple, Optional[float], Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, generations: tuple) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != generations or (entry[1] is not None and entry[1] <= time.monotonic()):
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, entry[2]
+
+    def set(self, key: Hashable, generations: tuple, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else None
+        self._entries[key] = (generations, expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+response_cache = ResponseCache(settings.RESPONSE_CACHE_MAX_ENTRIES, settings.RESPONSE_CACHE_TTL_SECONDS)
+
+class RequestCoalescer:
+    """Runs at most one computation per key at a time; concurrent callers share it."""
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self.executed: Dict[str, int] = defaultdict(int)
+        self.coalesced: Dict[str, int] = defaultdict(int)
+
+    async def run(self, route: str, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(compute())
+            self._in_flight[key] = task
+
+            def forget(finished: asyncio.Task) -> None:
+                if self._in_flight.get(key) is finished:
+                    del self._in_flight[key]
+
+            task.add_done_callback(forget)
+            self.executed[route] += 1
+        else:
+            self.coalesced[route] += 1
+
+        # A caller that goes away must not cancel the others' computation
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "in_flight": len(self._in_flight),
+            "routes": {
+                route: {"executed": self.executed[route], "coalesced": self.coalesced[route]}
+                for route in sorted(set(self.executed) | set(self.coalesced))
+            }
+        }
+
+request_coalescer = RequestCoalescer()
+
+def _normalize(value: Any) -> Hashable:
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, (list, tuple, set)):
+        return tuple(sorted(_normalize(item) for item in value))
+    return value
+
+def cached_response(
+    route: str,
+    params: Sequence[str] = (),
+    collections: Sequence[str] = (JOBS_COLLECTION,),
+    bypass_param: Optional[str] = None,
+    coalesce: bool = False
+):
+    """
+    Cache an endpoint's result until one of its collections changes.
+
+    Only the declared query parameters take part in the key, so injected
+    dependencies and unrelated parameters never fragment the cache. When
+    bypass_param is given and truthy, the endpoint is always executed.
+    With coalesce, concurrent misses on the same key and generations share
+    one execution of the endpoint.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if bypass_param and kwargs.get(bypass_param):
+                return await func(*args, **kwargs)
+
+            key = (route,) + tuple(_normalize(kwargs.get(param)) for param in params)
+            # Capture generations before computing so a concurrent write
+            # leaves the stored entry stale instead of wrongly fresh
+            generations = tuple(get_generation(collection) for collection in collections)
+
+            hit, value = response_cache.get(key, generations)
+            if hit:
+                return value
+
+            async def compute():
+                value = await func(*args, **kwargs)
+                response_cache.set(key, generations, value)
+                return value
+
+            if coalesce:
+                return await request_coalescer.run(route, (key, generations), compute)
+            return await compute()
+
+        return wrapper
+    return decorator
@@ -1,3 +1,4 @@
+from pydantic import Field
 from pydantic_settings import BaseSettings
 from typing import Optional
 import os
@@ -6,6 +7,15 @@ class Settings(BaseSettings):
     # MongoDB Configuration
     MONGODB_URL: str = "mongodb://localhost:27017"
     MONGODB_DB: str = "remotelyx"
+    # Connection pool of the shared client; waits for a free connection fail after the timeout
+    MONGODB_MAX_POOL_SIZE: int = 50
+    MONGODB_MIN_POOL_SIZE: int = 0
+    MONGODB_MAX_IDLE_TIME_MS: int = 300000
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS: int = 5000
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = 5000
+    MONGODB_CONNECT_TIMEOUT_MS: int = 10000
+    # Comma-separated wire compressors in order of preference, e.g. "zstd,snappy,zlib"; empty disables compression
+    MONGODB_COMPRESSORS: str = ""
     
     # JWT Configuration
     SECRET_KEY: str = "your-secret-key-change-in-production"
@@ -16,6 +26,22 @@ class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "RemotelyX API"
     
+    # Response cache Configuration
+    RESPONSE_CACHE_MAX_ENTRIES: int = 512
+    # Bounds staleness from writes by other processes (manage.py, migrations) and from the passing of time
+    RESPONSE_CACHE_TTL_SECONDS: int = 300
+    
+    # Analytics snapshot Configuration
+    # Older snapshots are still served while a fresh one is computed in the background
+    ANALYTICS_MAX_AGE_SECONDS: int = 3600
+    ANALYTICS_SNAPSHOTS_KEPT: int = Field(5, ge=1)
+    
+    # Background import Configuration
+    IMPORT_WORKERS: int = 2
+    IMPORT_QUEUE_SIZE: int = 16
+    # Processes validating and normalizing import chunks; 0 runs them on the event loop
+    IMPORT_PROCESS_WORKERS: int = 2
+    
     # CORS Configuration
     BACKEND_CORS_ORIGINS: list = ["http://localhost:3000", "http://localhost:8080"]
     
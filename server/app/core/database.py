@@ -1,27 +1,49 @@
+from typing import Any, Dict, Iterable, List
 from motor.motor_asyncio import AsyncIOMotorClient
-from pymongo import ASCENDING, DESCENDING, TEXT
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
 from app.core.config import settings
+from app.core.mongo_pool import client_options, pool_metrics
+from app.utils.job_fields import NORMALIZED_FIELDS
+import asyncio
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
 class Database:
     client: AsyncIOMotorClient = None
     db = None
+    # Background index reconciliation: "pending", "building", "ready" or "failed"
+    index_task: asyncio.Task = None
+    index_status: str = "pending"
+    failed_indexes: List[str] = []
+    index_build_seconds: float = None
 
 db = Database()
 
-async def connect_to_mongo():
-    """Create database connection."""
+async def connect_to_mongo(background_indexes: bool = False):
+    """
+    Create database connection.
+
+    Missing indexes are built before returning, or in a background task
+    when background_indexes is set so the caller does not wait for them.
+    """
     try:
-        db.client = AsyncIOMotorClient(settings.MONGODB_URL)
+        db.client = AsyncIOMotorClient(
+            settings.MONGODB_URL,
+            event_listeners=[pool_metrics],
+            **client_options()
+        )
         db.db = db.client[settings.MONGODB_DB]
         
         # Create collections
         await create_collections()
         
-        # Create indexes for better performance
-        await create_indexes()
+        # Build missing indexes for better performance
+        if background_indexes:
+            db.index_task = asyncio.create_task(reconcile_indexes())
+        else:
+            await reconcile_indexes()
         
         logger.info("Connected to MongoDB.")
     except Exception as e:
@@ -31,8 +53,12 @@ async def connect_to_mongo():
 async def close_mongo_connection():
     """Close database connection."""
     try:
+        if db.index_task and not db.index_task.done():
+            db.index_task.cancel()
         if db.client:
             db.client.close()
+            db.client = None
+            db.db = None
             logger.info("Closed MongoDB connection.")
     except Exception as e:
         logger.error(f"Error closing MongoDB connection: {e}")
@@ -53,56 +79,153 @@ async def create_collections():
             await db.db.create_collection("analytics")
             logger.info("Created 'analytics' collection")
             
+        # Create analytics snapshot pointer collection
+        if "analytics_state" not in existing_collections:
+            await db.db.create_collection("analytics_state")
+            logger.info("Created 'analytics_state' collection")
+            
         # Create skills collection for caching
         if "skills_cache" not in existing_collections:
             await db.db.create_collection("skills_cache")
             logger.info("Created 'skills_cache' collection")
             
+        # Create per-day job counters collection
+        if "jobs_daily_rollup" not in existing_collections:
+            await db.db.create_collection("jobs_daily_rollup")
+            logger.info("Created 'jobs_daily_rollup' collection")
+            
+        # Create filter dictionary collection
+        if "filter_options" not in existing_collections:
+            await db.db.create_collection("filter_options")
+            logger.info("Created 'filter_options' collection")
+            
+        # Create background import status collection
+        if "imports" not in existing_collections:
+            await db.db.create_collection("imports")
+            logger.info("Created 'imports' collection")
+            
     except Exception as e:
         logger.error(f"Error creating collections: {e}")
 
-async def create_indexes():
-    """Create database indexes for optimal query performance."""
-    try:
-        # Jobs collection indexes
-        jobs_collection = db.db.jobs
-        
+# Declared indexes per collection, built by reconcile_indexes when missing
+INDEX_SPECS = {
+    "jobs": [
         # Text search index for job search
-        await jobs_collection.create_index([
+        IndexModel([
             ("data.title", TEXT),
             ("data.company", TEXT),
             ("data.description", TEXT),
             ("data.tech_skills", TEXT),
             ("data.soft_skills", TEXT)
-        ])
-        
+        ]),
         # Single field indexes for filtering
-        await jobs_collection.create_index("data.company", ASCENDING)
-        await jobs_collection.create_index("data.location", ASCENDING)
-        await jobs_collection.create_index("data.seniority", ASCENDING)
-        await jobs_collection.create_index("data.employment_type", ASCENDING)
-        await jobs_collection.create_index("data.scraped_at", DESCENDING)
-        await jobs_collection.create_index("created_at", DESCENDING)
-        
+        IndexModel([("data.company", ASCENDING)]),
+        IndexModel([("data.location", ASCENDING)]),
+        IndexModel([("data.seniority", ASCENDING)]),
+        IndexModel([("data.employment_type", ASCENDING)]),
+        IndexModel([("data.scraped_at", DESCENDING)]),
+        IndexModel([("created_at", DESCENDING)]),
+        IndexModel([("role_category", ASCENDING)]),
+        IndexModel([("salary_min", ASCENDING)]),
+        # Case-folded copies used by the company/location/seniority/employment type filters
+        *[IndexModel([(f"normalized.{field}", ASCENDING)]) for field in NORMALIZED_FIELDS],
         # Compound index for date range queries
-        await jobs_collection.create_index([
-            ("created_at", DESCENDING),
-            ("data.company", ASCENDING)
-        ])
-        
-        # Analytics collection indexes
-        analytics_collection = db.db.analytics
-        await analytics_collection.create_index("calculated_at", DESCENDING)
-        
-        # Skills cache collection indexes
-        skills_collection = db.db.skills_cache
-        await skills_collection.create_index("skill", ASCENDING)
-        await skills_collection.create_index("updated_at", DESCENDING)
-        
-        logger.info("Database indexes created successfully")
+        IndexModel([("created_at", DESCENDING), ("data.company", ASCENDING)]),
+        # Keyset pagination sorts by (field, _id) for every sortable listing field
+        *[
+            IndexModel([(sort_field, DESCENDING), ("_id", DESCENDING)])
+            for sort_field in ["created_at", "updated_at", "data.company", "data.location",
+                               "data.seniority", "data.employment_type"]
+        ]
+        # The unique fingerprint index is created by migration 011 once
+        # duplicate jobs are removed, not here
+    ],
+    "analytics": [
+        IndexModel([("calculated_at", DESCENDING)]),
+        # Snapshot lookup and pruning by version
+        IndexModel(
+            [("version", DESCENDING)],
+            unique=True,
+            partialFilterExpression={"version": {"$exists": True}}
+        )
+    ],
+    "skills_cache": [
+        IndexModel([("skill", ASCENDING)]),
+        IndexModel([("updated_at", DESCENDING)]),
+        # Top-k reads of the per-skill counters
+        IndexModel([("kind", ASCENDING), ("skill_type", ASCENDING), ("job_count", DESCENDING)]),
+        # Per-company counters grouped by skill
+        IndexModel([("kind", ASCENDING), ("skill_id", ASCENDING)])
+    ],
+    "jobs_daily_rollup": [
+        # Date range reads of the daily rollup
+        IndexModel([("kind", ASCENDING), ("date", ASCENDING)])
+    ],
+    "imports": [
+        # Most recent background imports first
+        IndexModel([("submitted_at", DESCENDING)])
+    ]
+}
+
+def missing_indexes(declared: List[IndexModel], existing_names: Iterable[str]) -> List[IndexModel]:
+    """The declared indexes whose names are not among the existing ones."""
+    existing = set(existing_names)
+    return [index for index in declared if index.document["name"] not in existing]
+
+async def reconcile_indexes():
+    """
+    Build the declared indexes that do not exist yet.
+
+    Each collection's missing indexes are built with one createIndexes
+    command; if that fails (e.g. a unique index over duplicates) they are
+    retried one by one so the others still get built.
+    """
+    started = time.perf_counter()
+    db.index_status = "building"
+    failed = []
+    try:
+        for collection_name, declared in INDEX_SPECS.items():
+            collection = db.db[collection_name]
+            existing_names = [index["name"] async for index in collection.list_indexes()]
+            missing = missing_indexes(declared, existing_names)
+            if not missing:
+                continue
+            
+            names = [index.document["name"] for index in missing]
+            logger.info(f"Building {len(missing)} index(es) on '{collection_name}': {', '.join(names)}")
+            try:
+                await collection.create_indexes(missing)
+            except Exception as e:
+                logger.error(f"Error building indexes on '{collection_name}', retrying one by one: {e}")
+                for index in missing:
+                    try:
+                        await collection.create_indexes([index])
+                    except Exception as e:
+                        logger.error(f"Error creating index {index.document['name']} on '{collection_name}': {e}")
+                        failed.append(f"{collection_name}.{index.document['name']}")
         
+        db.index_status = "failed" if failed else "ready"
+        db.failed_indexes = failed
     except Exception as e:
-        logger.error(f"Error creating indexes: {e}")
+        db.index_status = "failed"
+        logger.error(f"Error reconciling indexes: {e}")
+    finally:
+        db.index_build_seconds = time.perf_counter() - started
+        logger.info(f"Index reconciliation finished in {db.index_build_seconds:.2f}s ({db.index_status})")
+
+def index_status() -> Dict[str, Any]:
+    """State of the last index reconciliation, for health checks."""
+    return {
+        "status": db.index_status,
+        "failed": db.failed_indexes,
+        "build_seconds": round(db.index_build_seconds, 3) if db.index_build_seconds is not None else None
+    }
+
+async def get_database():
+    """Get the shared database, connecting first if the app has not."""
+    if db.db is None:
+        await connect_to_mongo()
+    return db.db
 
 def get_collection(collection_name: str):
     """Get a collection by name."""
@@ -111,4 +234,8 @@ def get_collection(collection_name: str):
 # Collection names
 JOBS_COLLECTION = "jobs"
 ANALYTICS_COLLECTION = "analytics"
-SKILLS_CACHE_COLLECTION = "skills_cache" 
\ No newline at end of file
+ANALYTICS_STATE_COLLECTION = "analytics_state"
+SKILLS_CACHE_COLLECTION = "skills_cache"
+JOBS_DAILY_ROLLUP_COLLECTION = "jobs_daily_rollup"
+FILTER_OPTIONS_COLLECTION = "filter_options"
+IMPORTS_COLLECTION = "imports"
\ No newline at end of file
@@ -0,0 +1,109 @@
+"""
+HTTP validators for conditional GETs.
+
+Endpoints that can tell whether their payload changed without recomputing
+it send an ETag; a client repeating the request with If-None-Match gets an
+empty 304 instead of the full body.
+
+ConditionalGetMiddleware does this for every read endpoint listed in
+CONDITIONAL_ROUTES: their weak ETag is built from the change counters of the
+collections they read, so a matching request is answered before the
+endpoint runs or anything is serialized. Only ETags are used as validators:
+a Last-Modified date could not tell apart writes within the same second or
+follow the roll-over of relative time windows.
+"""
+
+from datetime import datetime
+from typing import Dict, Optional, Sequence
+import hashlib
+import os
+import time
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.cache import get_generation
+from app.core.config import settings
+from app.core.database import JOBS_COLLECTION, ANALYTICS_COLLECTION
+
+# Read endpoints (by path prefix) and the collections their responses depend on
+CONDITIONAL_ROUTES = [
+    (f"{settings.API_V1_STR}/jobs", (JOBS_COLLECTION,)),
+    (f"{settings.API_V1_STR}/scraped-jobs", (JOBS_COLLECTION,)),
+    (f"{settings.API_V1_STR}/dashboard", (JOBS_COLLECTION,)),
+    (f"{settings.API_V1_STR}/analytics", (JOBS_COLLECTION, ANALYTICS_COLLECTION))
+]
+
+# Query parameters that ask for a fresh computation
+BYPASS_PARAMS = {"force_refresh"}
+
+# Change counters restart with the process, so tags from a previous run never match
+_PROCESS_TAG = f"{os.getpid():x}{int(datetime.utcnow().timestamp()):x}"
+
+def strong_etag(body: bytes) -> str:
+    """A strong ETag derived from the exact response bytes."""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+def _opaque_tag(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match already covers the given ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison function (RFC 9110 13.1.2)
+    candidates = {_opaque_tag(tag.strip()) for tag in header.split(",")}
+    return _opaque_tag(etag) in candidates
+
+def not_modified(etag: str, headers: Optional[Dict[str, str]] = None) -> Response:
+    """An empty 304 response carrying the current validators."""
+    return Response(status_code=304, headers={"ETag": etag, **(headers or {})})
+
+def collection_etag(collections: Sequence[str]) -> str:
+    """
+    A weak ETag for data read from the given collections.
+
+    The current response cache TTL window takes part, so responses with
+    relative time windows ("last 7 days") or changed by other processes are
+    revalidated as often as the response cache expires.
+    """
+    generations = "-".join(str(get_generation(collection)) for collection in collections)
+    window = int(time.time() // settings.RESPONSE_CACHE_TTL_SECONDS) if settings.RESPONSE_CACHE_TTL_SECONDS else 0
+    return f'W/"{_PROCESS_TAG}-{window:x}-{generations}"'
+
+class ConditionalGetMiddleware(BaseHTTPMiddleware):
+    """Add ETags to read endpoints and answer unchanged requests with 304."""
+
+    async def dispatch(self, request: Request, call_next):
+        collections = self._collections_for(request)
+        if collections is None:
+            return await call_next(request)
+
+        # Validators are taken before the endpoint runs, so a write that lands
+        # during the request makes the next revalidation miss, never falsely hit
+        etag = collection_etag(collections)
+        headers = {"Cache-Control": "no-cache"}
+
+        if etag_matches(request, etag):
+            return not_modified(etag, headers)
+
+        response = await call_next(request)
+        if response.status_code == 200 and "etag" not in response.headers:
+            response.headers["ETag"] = etag
+            response.headers.update(headers)
+        return response
+
+    @staticmethod
+    def _collections_for(request: Request) -> Optional[Sequence[str]]:
+        if request.method not in ("GET", "HEAD"):
+            return None
+        if any(request.query_params.get(param, "").lower() in ("1", "true", "yes") for param in BYPASS_PARAMS):
+            return None
+        path = request.url.path
+        for prefix, collections in CONDITIONAL_ROUTES:
+            if path == prefix or path.startswith(prefix + "/"):
+                return collections
+        return None
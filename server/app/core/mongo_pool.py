@@ -0,0 +1,132 @@
+"""Connection pool options and metrics for the shared MongoDB client."""
+
+from typing import Any, Dict
+import threading
+import time
+
+from pymongo import monitoring
+
+from app.core.config import settings
+
+def client_options() -> Dict[str, Any]:
+    """Keyword arguments for the application's AsyncIOMotorClient, from settings."""
+    options = {
+        "maxPoolSize": settings.MONGODB_MAX_POOL_SIZE,
+        "minPoolSize": settings.MONGODB_MIN_POOL_SIZE,
+        "maxIdleTimeMS": settings.MONGODB_MAX_IDLE_TIME_MS,
+        "waitQueueTimeoutMS": settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+        "serverSelectionTimeoutMS": settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+        "connectTimeoutMS": settings.MONGODB_CONNECT_TIMEOUT_MS,
+        "appname": settings.PROJECT_NAME
+    }
+    compressors = [name.strip() for name in settings.MONGODB_COMPRESSORS.split(",") if name.strip()]
+    if compressors:
+        options["compressors"] = ",".join(compressors)
+    return options
+
+class PoolMetrics(monitoring.ConnectionPoolListener):
+    """
+    Count connection pool events of a client.
+
+    pymongo publishes these from the threads running operations, so the
+    counters are guarded by a lock. Checkouts are timed per thread from
+    their start to their success or failure; checkouts_in_progress counts
+    the ones started and not yet finished, whether or not the pool is full.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.connections_created = 0
+            self.connections_closed = 0
+            self.checkouts = 0
+            self.checkout_failures = 0
+            self.checkout_timeouts = 0
+            self.checked_in = 0
+            self.checkouts_in_progress = 0
+            self.max_checkouts_in_progress = 0
+            self.wait_seconds_total = 0.0
+            self.wait_seconds_max = 0.0
+            self.pool_clears = 0
+
+    def _end_wait(self) -> float:
+        started = getattr(self._local, "checkout_started", None)
+        self._local.checkout_started = None
+        waited = time.perf_counter() - started if started is not None else 0.0
+        self.checkouts_in_progress = max(self.checkouts_in_progress - 1, 0)
+        self.wait_seconds_total += waited
+        self.wait_seconds_max = max(self.wait_seconds_max, waited)
+        return waited
+
+    def connection_check_out_started(self, event):
+        self._local.checkout_started = time.perf_counter()
+        with self._lock:
+            self.checkouts_in_progress += 1
+            self.max_checkouts_in_progress = max(self.max_checkouts_in_progress, self.checkouts_in_progress)
+
+    def connection_checked_out(self, event):
+        with self._lock:
+            self._end_wait()
+            self.checkouts += 1
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            self._end_wait()
+            self.checkout_failures += 1
+            if event.reason == monitoring.ConnectionCheckOutFailedReason.TIMEOUT:
+                self.checkout_timeouts += 1
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            self.checked_in += 1
+
+    def connection_created(self, event):
+        with self._lock:
+            self.connections_created += 1
+
+    def connection_closed(self, event):
+        with self._lock:
+            self.connections_closed += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self.pool_clears += 1
+
+    def pool_closed(self, event):
+        pass
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current counters plus the connections open and checked out right now."""
+        with self._lock:
+            wait_count = self.checkouts + self.checkout_failures
+            return {
+                "max_pool_size": settings.MONGODB_MAX_POOL_SIZE,
+                "open_connections": self.connections_created - self.connections_closed,
+                "in_use": self.checkouts - self.checked_in,
+                "checkouts_in_progress": self.checkouts_in_progress,
+                "max_checkouts_in_progress": self.max_checkouts_in_progress,
+                "checkouts": self.checkouts,
+                "checkout_failures": self.checkout_failures,
+                "checkout_timeouts": self.checkout_timeouts,
+                "wait_ms_avg": round(self.wait_seconds_total / wait_count * 1000, 3) if wait_count else 0.0,
+                "wait_ms_max": round(self.wait_seconds_max * 1000, 3),
+                "connections_created": self.connections_created,
+                "connections_closed": self.connections_closed,
+                "pool_clears": self.pool_clears
+            }
+
+# Listener registered on the application's client
+pool_metrics = PoolMetrics()
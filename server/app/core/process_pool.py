@@ -0,0 +1,55 @@
+"""
+A shared process pool for CPU-bound work that would otherwise stall the
+event loop, such as validating and normalizing import chunks.
+
+Workers are spawned rather than forked, so they never inherit the event
+loop or the Mongo client's threads. They start on first use.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+import asyncio
+import logging
+import multiprocessing
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+def get_process_pool() -> Optional[ProcessPoolExecutor]:
+    """The shared pool, or None when IMPORT_PROCESS_WORKERS is 0."""
+    global _pool
+    if _pool is None and settings.IMPORT_PROCESS_WORKERS > 0:
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.IMPORT_PROCESS_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        logger.info(f"Started process pool with {settings.IMPORT_PROCESS_WORKERS} workers")
+    return _pool
+
+def run_in_process(func: Callable[..., Any], *args: Any) -> "asyncio.Future[Any]":
+    """
+    Run a picklable top-level function in the process pool.
+
+    Work starts immediately, so several calls can be in flight while the
+    caller awaits earlier ones. Runs inline when no pool is configured.
+    """
+    loop = asyncio.get_running_loop()
+    pool = get_process_pool()
+    if pool is None:
+        future = loop.create_future()
+        try:
+            future.set_result(func(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+    return loop.run_in_executor(pool, func, *args)
+
+def shutdown_process_pool() -> None:
+    """Stop the pool's workers, waiting for chunks already submitted."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
@@ -0,0 +1,67 @@
+"""
+Fast JSON serialization for large responses.
+
+FastAPI normally runs every returned value through jsonable_encoder, a
+Python-level walk over each field, before json.dumps. Routes decorated with
+fast_json skip that walk: their result is rendered directly by orjson (when
+installed), which encodes datetimes natively and calls back only for
+ObjectIds and pydantic models. Without orjson the stdlib encoder is used with
+the same fallbacks, so responses are identical either way.
+"""
+
+from datetime import date, datetime
+from typing import Any
+import functools
+import json
+
+from bson import ObjectId
+from fastapi import Response
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # optional dependency, see the fast-json extra
+    orjson = None
+
+def _default(obj: Any) -> Any:
+    """Encode the values neither orjson nor json handle natively."""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        # Same aliases as FastAPI's encoder, e.g. "_id" for ScrapedJob.id
+        return obj.model_dump(by_alias=True)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps(content: Any) -> bytes:
+    """Serialize a response payload to JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content,
+        default=_default,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":")
+    ).encode("utf-8")
+
+class FastJSONResponse(Response):
+    """A JSON response rendered without jsonable_encoder."""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+def fast_json(func):
+    """Return the endpoint's result as a FastJSONResponse, bypassing response_model encoding."""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        result = await func(*args, **kwargs)
+        if isinstance(result, Response):
+            return result
+        return FastJSONResponse(result)
+
+    return wrapper
@@ -9,7 +9,7 @@ class PyObjectId(ObjectId):
         yield cls.validate
 
     @classmethod
-    def validate(cls, v):
+    def validate(cls, v, validation_info=None):
         if not ObjectId.is_valid(v):
             raise ValueError("Invalid ObjectId")
         return ObjectId(v)
@@ -70,6 +70,8 @@ class AnalyticsData(BaseModel):
     company_insights: List[CompanyInsights]
     dashboard_stats: DashboardStats
     calculated_at: datetime = Field(default_factory=datetime.utcnow)
+    # Snapshot version, assigned when the analytics are stored
+    version: Optional[int] = None
     
     class Config:
         populate_by_name = True
@@ -42,6 +42,9 @@ class ScrapedJob(BaseModel):
     scraped_at: str
     success: bool
     status: str = Field(default="NEW", description="Job status: NEW, ANALYZED, MATCHED")
+    role_category: List[str] = Field(default_factory=list, description="Role categories derived from the title")
+    salary_min: Optional[int] = Field(None, description="Annualized minimum salary parsed from data.salary")
+    salary_max: Optional[int] = Field(None, description="Annualized maximum salary parsed from data.salary")
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     
@@ -72,6 +75,48 @@ class ScrapedJob(BaseModel):
             }
         }
 
+class JobCardData(BaseModel):
+    company: str
+    date_posted: str
+    employment_type: str
+    job_link: str
+    location: str
+    salary: str
+    scraped_at: str
+    seniority: str
+    soft_skills: List[str]
+    tech_skills: List[str]
+    title: str
+    updated_at: str
+    status: str = "New"
+
+class JobCard(BaseModel):
+    """A job as shown on listing cards: everything except the description."""
+    id: Optional[PyObjectId] = Field(None, alias="_id")
+    data: JobCardData
+    status: str = "NEW"
+    role_category: List[str] = Field(default_factory=list)
+    salary_min: Optional[int] = None
+    salary_max: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    
+    class Config:
+        populate_by_name = True
+        arbitrary_types_allowed = True
+        json_encoders = {ObjectId: str}
+
+# Mongo projections behind the named list views; "full" returns whole documents
+JOB_VIEW_PROJECTIONS = {
+    "card": {"data.description": 0, "message": 0, "success": 0, "scraped_at": 0}
+}
+
+# Top-level and data.* fields a sparse fieldset may ask for
+JOB_FIELDS = [
+    "data", "message", "scraped_at", "success", "status", "role_category",
+    "salary_min", "salary_max", "created_at", "updated_at"
+] + [f"data.{field}" for field in JobData.model_fields]
+
 class JobInDB(ScrapedJob):
     pass
 
@@ -1,7 +1,12 @@
 from pydantic import BaseModel, Field, validator
 from typing import Optional, List
 from datetime import datetime
-import re
+from app.models.job import JobData, JobCreate
+from app.utils.salary import parse_salary_range
+from app.utils.skills import canonicalize_skills
+
+# Timestamp format the scraper uses for the nested job data
+SCRAPER_DATETIME_FORMAT = "%a, %d %b %Y %H:%M:%S GMT"
 
 class ScrapedJobData(BaseModel):
     """Schema for job data coming from the scraper"""
@@ -12,12 +17,12 @@ class ScrapedJobData(BaseModel):
     job_link: str
     location: str
     salary: str
-    scraped_at: str  # Will be converted to datetime
+    scraped_at: datetime  # Parsed from the scraper's string format
     seniority: str
     soft_skills: List[str] = Field(default_factory=list)
     tech_skills: List[str] = Field(default_factory=list)
     title: str
-    updated_at: str  # Will be converted to datetime
+    updated_at: datetime  # Parsed from the scraper's string format
 
     @validator('scraped_at', 'updated_at', pre=True)
     def parse_datetime_string(cls, v):
@@ -35,6 +40,11 @@ class ScrapedJobData(BaseModel):
                     return datetime.utcnow()
         return v
 
+    @validator('tech_skills', 'soft_skills')
+    def canonicalize_skill_names(cls, v):
+        """Resolve skill aliases to their canonical names"""
+        return canonicalize_skills(v)
+
     @validator('seniority')
     def normalize_seniority(cls, v):
         """Normalize seniority to match our enum"""
@@ -47,24 +57,8 @@ class ScrapedJobData(BaseModel):
         return 'mid'  # Default fallback
 
     def extract_salary_range(self) -> tuple[Optional[int], Optional[int]]:
-        """Extract numeric salary range from salary string"""
-        if not self.salary or self.salary.lower() in ['not specified', 'competitive']:
-            return None, None
-        
-        # Extract numbers from salary string
-        numbers = re.findall(r'[\d,]+', self.salary.replace(',', ''))
-        if numbers:
-            try:
-                # Convert first number found
-                salary_num = int(numbers[0])
-                # If it's likely monthly, return as min and estimate max
-                if salary_num < 10000:  # Likely monthly
-                    return salary_num, salary_num * 2
-                else:  # Likely annual
-                    return salary_num, salary_num + 20000
-            except ValueError:
-                pass
-        return None, None
+        """Extract the annualized numeric salary range from the salary string"""
+        return parse_salary_range(self.salary)
 
     def to_job_model_dict(self) -> dict:
         """Convert scraped data to JobModel format"""
@@ -90,12 +84,30 @@ class ScrapedJobData(BaseModel):
             # Type inferred from location in the model validator
         }
 
+    def to_job_data(self) -> JobData:
+        """Convert scraped data to the nested job data stored in the jobs collection"""
+        return JobData(
+            company=self.company,
+            date_posted=self.date_posted,
+            description=self.description,
+            employment_type=self.employment_type,
+            job_link=self.job_link,
+            location=self.location,
+            salary=self.salary,
+            scraped_at=self.scraped_at.strftime(SCRAPER_DATETIME_FORMAT),
+            seniority=self.seniority,
+            soft_skills=self.soft_skills,
+            tech_skills=self.tech_skills,
+            title=self.title,
+            updated_at=self.updated_at.strftime(SCRAPER_DATETIME_FORMAT)
+        )
+
 
 class ScrapedJobResponse(BaseModel):
     """Schema for the response from scraper"""
     data: ScrapedJobData
     message: str
-    scraped_at: str
+    scraped_at: datetime
     success: bool
 
     @validator('scraped_at', pre=True)
@@ -108,6 +120,15 @@ class ScrapedJobResponse(BaseModel):
                 return datetime.utcnow()
         return v
 
+    def to_job_create(self) -> JobCreate:
+        """Convert the scraper response to the document shape stored in the jobs collection"""
+        return JobCreate(
+            data=self.data.to_job_data(),
+            message=self.message,
+            scraped_at=self.scraped_at.isoformat(),
+            success=self.success
+        )
+
 
 class BulkScrapedJobsRequest(BaseModel):
     """Schema for bulk job import from scraper"""
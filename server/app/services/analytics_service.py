@@ -1,21 +1,44 @@
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from motor.motor_asyncio import AsyncIOMotorCollection
-from app.core.database import get_collection, JOBS_COLLECTION, ANALYTICS_COLLECTION
+from pymongo import ReturnDocument
+from app.core.config import settings
+from app.core.database import get_collection, JOBS_COLLECTION, ANALYTICS_COLLECTION, ANALYTICS_STATE_COLLECTION
+from app.core.cache import bump_generation
 from app.models.analytics import (
     AnalyticsData, SkillDemand, SeniorityDistribution, 
     SalaryByLevel, CompanyInsights, DashboardStats
 )
 from app.models.job import ScrapedJob
+from app.services.skills_cache_service import SkillsCacheService
+from app.services.daily_rollup_service import DailyRollupService, day_start, merge_days
+import asyncio
 import logging
 import re
 
 logger = logging.getLogger(__name__)
 
+# Recomputation in progress, shared by every concurrent generate_full_analytics call
+_full_analytics_task: Optional[asyncio.Task] = None
+
+# Document in the analytics state collection pointing at the current snapshot
+CURRENT_SNAPSHOT_ID = "current"
+
+def format_salary_range(count: int, min_total: float, max_total: float) -> str:
+    """Format summed salary bounds as an average range like "$60-85k"."""
+    if count <= 0:
+        return "N/A"
+    low = round(min_total / count / 1000)
+    high = round(max_total / count / 1000)
+    return f"${low}k" if low == high else f"${low}-{high}k"
+
 class AnalyticsService:
     def __init__(self):
         self.jobs_collection: AsyncIOMotorCollection = get_collection(JOBS_COLLECTION)
         self.analytics_collection: AsyncIOMotorCollection = get_collection(ANALYTICS_COLLECTION)
+        self.state_collection: AsyncIOMotorCollection = get_collection(ANALYTICS_STATE_COLLECTION)
+        self.skills_cache = SkillsCacheService()
+        self.daily_rollup = DailyRollupService()
     
     async def calculate_dashboard_stats(self) -> DashboardStats:
         """Calculate real-time dashboard statistics."""
@@ -61,37 +84,28 @@ class AnalyticsService:
     async def calculate_top_skills(self) -> List[SkillDemand]:
         """Calculate top skills in demand with scoring."""
         try:
-            # Aggregate skills from all jobs
-            pipeline = [
-                {"$unwind": "$data.tech_skills"},
-                {"$group": {
-                    "_id": "$data.tech_skills",
-                    "job_count": {"$sum": 1},
-                    "seniority_dist": {
-                        "$push": "$data.seniority"
-                    }
-                }},
-                {"$sort": {"job_count": -1}},
-                {"$limit": 20}
-            ]
+            # Read the maintained per-skill counters, falling back to
+            # aggregating skills from all jobs until the cache is built
+            skills_data = await self.skills_cache.get_top_skills("tech", 20)
             
-            skills_data = await self.jobs_collection.aggregate(pipeline).to_list(None)
+            if skills_data is None:
+                skills_data = await self.skills_cache.aggregate_top_skills("tech", 20)
             
             top_skills = []
             for skill_data in skills_data:
-                skill_name = skill_data["_id"]
+                skill_name = skill_data["skill"]
                 job_count = skill_data["job_count"]
                 
                 # Calculate seniority distribution for this skill
                 seniority_dist = {}
-                for level in skill_data["seniority_dist"]:
-                    level_lower = level.lower()
+                for level, count in skill_data["seniority_counts"].items():
+                    level_lower = (level or "").lower()
                     if "senior" in level_lower or "lead" in level_lower:
-                        seniority_dist["senior"] = seniority_dist.get("senior", 0) + 1
+                        seniority_dist["senior"] = seniority_dist.get("senior", 0) + count
                     elif "mid" in level_lower:
-                        seniority_dist["mid"] = seniority_dist.get("mid", 0) + 1
+                        seniority_dist["mid"] = seniority_dist.get("mid", 0) + count
                     else:
-                        seniority_dist["junior"] = seniority_dist.get("junior", 0) + 1
+                        seniority_dist["junior"] = seniority_dist.get("junior", 0) + count
                 
                 # Calculate demand score (0-100)
                 # Base score on job count, normalized to top skill
@@ -168,35 +182,80 @@ class AnalyticsService:
     async def calculate_salary_ranges_by_level(self) -> SalaryByLevel:
         """Calculate average salary ranges by seniority level."""
         try:
-            # This is a simplified calculation - in reality you'd parse salary strings
-            # and calculate actual ranges. For now, we'll use mock data based on job counts.
-            
-            # Get job counts by seniority
+            # Sum the normalized salary bounds per seniority so levels can be merged
             pipeline = [
+                {"$match": {"salary_min": {"$gte": 0}}},
                 {"$group": {
                     "_id": "$data.seniority",
-                    "count": {"$sum": 1}
+                    "count": {"$sum": 1},
+                    "salary_min_total": {"$sum": "$salary_min"},
+                    "salary_max_total": {"$sum": {"$ifNull": ["$salary_max", "$salary_min"]}}
                 }}
             ]
             
-            seniority_counts = await self.jobs_collection.aggregate(pipeline).to_list(None)
+            seniority_salaries = await self.jobs_collection.aggregate(pipeline).to_list(None)
             
-            # Mock salary ranges based on seniority distribution
-            # In a real system, you'd parse actual salary data
-            senior_salary = "$85-120k"
-            mid_salary = "$60-85k"
-            junior_salary = "$40-60k"
+            # Same level buckets as the seniority distribution
+            totals = {level: [0, 0, 0] for level in ["senior", "mid", "junior"]}
+            for item in seniority_salaries:
+                level = (item["_id"] or "").lower()
+                if "senior" in level or "lead" in level or "executive" in level:
+                    bucket = totals["senior"]
+                elif "mid" in level or "middle" in level:
+                    bucket = totals["mid"]
+                else:
+                    bucket = totals["junior"]
+                bucket[0] += item["count"]
+                bucket[1] += item["salary_min_total"]
+                bucket[2] += item["salary_max_total"]
             
             return SalaryByLevel(
-                senior=senior_salary,
-                mid=mid_salary,
-                junior=junior_salary
+                senior=format_salary_range(*totals["senior"]),
+                mid=format_salary_range(*totals["mid"]),
+                junior=format_salary_range(*totals["junior"])
             )
             
         except Exception as e:
             logger.error(f"Error calculating salary ranges: {e}")
             raise e
     
+    async def calculate_weekly_trends(self, weeks: int = 4) -> List[Dict]:
+        """Calculate weekly job trends from the per-day rollup, most recent week first."""
+        try:
+            # Weeks end at the start of tomorrow so today is included
+            period_end = day_start(datetime.utcnow()) + timedelta(days=1)
+            period_start = period_end - timedelta(weeks=weeks)
+            
+            rollup_days = await self.daily_rollup.get_days(period_start, period_end)
+            jobs_before = await self.daily_rollup.count_jobs_before(period_start)
+            
+            # Running total of jobs created up to the end of each week
+            weekly = []
+            active_jobs = jobs_before
+            for i in range(weeks):
+                week_start = period_start + timedelta(weeks=i)
+                week_end = week_start + timedelta(days=7)
+                week = merge_days([day for day in rollup_days if week_start <= day["date"] < week_end])
+                active_jobs += week["job_count"]
+                
+                top_skills = week["skills"].most_common(1)
+                weekly.append({
+                    "week_start": week_start.isoformat(),
+                    "week_end": week_end.isoformat(),
+                    "new_jobs": week["job_count"],
+                    "active_jobs": active_jobs,
+                    "top_skill": top_skills[0][0] if top_skills else None,
+                    "avg_salary": format_salary_range(
+                        week["salary_count"], week["salary_min_total"], week["salary_max_total"]
+                    )
+                })
+            
+            return list(reversed(weekly))
+            
+        except Exception as e:
+            logger.error(f"Error calculating weekly trends: {e}")
+            raise e
+    
     async def calculate_company_insights(self, limit: int = 10) -> List[CompanyInsights]:
         """Calculate insights about companies and their job postings."""
         try:
@@ -253,14 +312,45 @@ class AnalyticsService:
             raise e
     
     async def generate_full_analytics(self) -> AnalyticsData:
-        """Generate complete analytics data for the dashboard."""
+        """
+        Generate complete analytics data for the dashboard.
+
+        Calls made while a recomputation is running wait for it and share
+        its result instead of starting another one.
+        """
+        # A caller that goes away must not cancel the others' computation
+        return await asyncio.shield(self._start_full_analytics())
+    
+    def _start_full_analytics(self) -> asyncio.Task:
+        global _full_analytics_task
+        if _full_analytics_task is None or _full_analytics_task.done():
+            _full_analytics_task = asyncio.create_task(self._compute_full_analytics())
+        return _full_analytics_task
+    
+    def revalidate_analytics(self) -> None:
+        """Recompute the analytics in the background unless a recomputation is already running."""
+        def log_failure(task: asyncio.Task):
+            if not task.cancelled() and task.exception():
+                logger.error(f"Background analytics refresh failed: {task.exception()}")
+        
+        self._start_full_analytics().add_done_callback(log_failure)
+    
+    async def _compute_full_analytics(self) -> AnalyticsData:
         try:
-            # Calculate all analytics components
-            dashboard_stats = await self.calculate_dashboard_stats()
-            top_skills = await self.calculate_top_skills()
-            seniority_dist = await self.calculate_seniority_distribution()
-            salary_ranges = await self.calculate_salary_ranges_by_level()
-            company_insights = await self.calculate_company_insights()
+            # The components are independent, so run their queries concurrently
+            (
+                dashboard_stats,
+                top_skills,
+                seniority_dist,
+                salary_ranges,
+                company_insights
+            ) = await asyncio.gather(
+                self.calculate_dashboard_stats(),
+                self.calculate_top_skills(),
+                self.calculate_seniority_distribution(),
+                self.calculate_salary_ranges_by_level(),
+                self.calculate_company_insights()
+            )
             
             # Create analytics data object
             analytics_data = AnalyticsData(
@@ -282,14 +372,44 @@ class AnalyticsService:
             raise e
     
     async def store_analytics(self, analytics: AnalyticsData) -> str:
-        """Store analytics data in the database for caching."""
+        """
+        Store analytics data as a new snapshot version and make it current.
+
+        The snapshot is written before the "current" pointer is moved to it,
+        so readers always find a complete snapshot. A snapshot that finishes
+        after a newer one never replaces it. Only the newest
+        ANALYTICS_SNAPSHOTS_KEPT snapshots are kept.
+        """
         try:
-            # Remove old analytics data
-            await self.analytics_collection.delete_many({})
+            # Allocate the next version
+            state = await self.state_collection.find_one_and_update(
+                {"_id": CURRENT_SNAPSHOT_ID},
+                {"$inc": {"last_version": 1}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+            analytics.version = state["last_version"]
             
-            # Store new analytics data
+            # Store the snapshot, then point readers at it
             analytics_dict = analytics.dict(by_alias=True)
             result = await self.analytics_collection.insert_one(analytics_dict)
+            await self.state_collection.update_one(
+                {
+                    "_id": CURRENT_SNAPSHOT_ID,
+                    "$or": [
+                        {"version": {"$exists": False}},
+                        {"version": {"$lt": analytics.version}}
+                    ]
+                },
+                {"$set": {
+                    "version": analytics.version,
+                    "snapshot_id": result.inserted_id,
+                    "calculated_at": analytics.calculated_at
+                }}
+            )
+            bump_generation(ANALYTICS_COLLECTION)
+            
+            await self.prune_snapshots()
             
             return str(result.inserted_id)
             
@@ -297,22 +417,94 @@ class AnalyticsService:
             logger.error(f"Error storing analytics: {e}")
             raise e
     
-    async def get_cached_analytics(self) -> Optional[AnalyticsData]:
-        """Get cached analytics data if it exists and is recent."""
+    async def prune_snapshots(self, keep: int = None) -> int:
+        """
+        Delete all but the newest snapshots, plus any stored before snapshots
+        were versioned. The current snapshot is never deleted.
+        """
         try:
-            # Get most recent analytics data
-            analytics_doc = await self.analytics_collection.find_one(
-                {},
-                sort=[("calculated_at", -1)]
-            )
-            
-            if analytics_doc:
-                # Check if data is recent (less than 1 hour old)
-                calculated_at = analytics_doc["calculated_at"]
-                if datetime.utcnow() - calculated_at < timedelta(hours=1):
-                    return AnalyticsData(**analytics_doc)
+            keep = settings.ANALYTICS_SNAPSHOTS_KEPT if keep is None else keep
+            if keep < 1:
+                raise ValueError("At least one analytics snapshot must be kept")
+            
+            state = await self.state_collection.find_one({"_id": CURRENT_SNAPSHOT_ID}) or {}
+            oldest_kept = await self.analytics_collection.find(
+                {"version": {"$exists": True}},
+                {"version": 1}
+            ).sort("version", -1).skip(keep - 1).limit(1).to_list(1)
+            
+            stale = [{"version": {"$exists": False}}]
+            if oldest_kept:
+                stale.append({"version": {"$lt": oldest_kept[0]["version"]}})
+            query = {"$or": stale}
+            if state.get("snapshot_id"):
+                query["_id"] = {"$ne": state["snapshot_id"]}
+            result = await self.analytics_collection.delete_many(query)
+            return result.deleted_count
             
+        except Exception as e:
+            logger.error(f"Error pruning analytics snapshots: {e}")
+            raise e
+    
+    async def get_current_snapshot(self) -> Optional[AnalyticsData]:
+        """The snapshot the "current" pointer refers to, however old."""
+        state = await self.state_collection.find_one({"_id": CURRENT_SNAPSHOT_ID})
+        if not state or "snapshot_id" not in state:
             return None
+        
+        analytics_doc = await self.analytics_collection.find_one({"_id": state["snapshot_id"]})
+        return AnalyticsData(**analytics_doc) if analytics_doc else None
+    
+    async def get_snapshot(self, version: int) -> Optional[AnalyticsData]:
+        """A stored snapshot by version."""
+        try:
+            analytics_doc = await self.analytics_collection.find_one({"version": version})
+            return AnalyticsData(**analytics_doc) if analytics_doc else None
+            
+        except Exception as e:
+            logger.error(f"Error getting analytics snapshot {version}: {e}")
+            raise e
+    
+    async def list_snapshots(self) -> Dict:
+        """Versions of the stored snapshots, newest first, and the current version."""
+        try:
+            state = await self.state_collection.find_one({"_id": CURRENT_SNAPSHOT_ID}) or {}
+            snapshots = await self.analytics_collection.find(
+                {"version": {"$exists": True}},
+                {"version": 1, "calculated_at": 1}
+            ).sort("version", -1).to_list(None)
+            
+            return {
+                "current_version": state.get("version"),
+                "snapshots": [
+                    {"version": doc["version"], "id": str(doc["_id"]), "calculated_at": doc["calculated_at"]}
+                    for doc in snapshots
+                ]
+            }
+            
+        except Exception as e:
+            logger.error(f"Error listing analytics snapshots: {e}")
+            raise e
+    
+    def revalidate_if_stale(self, analytics: AnalyticsData) -> bool:
+        """
+        Start a background recomputation if the snapshot is older than
+        ANALYTICS_MAX_AGE_SECONDS. The stale snapshot can still be served
+        meanwhile (stale-while-revalidate). Returns whether it was stale.
+        """
+        age = datetime.utcnow() - analytics.calculated_at
+        if age <= timedelta(seconds=settings.ANALYTICS_MAX_AGE_SECONDS):
+            return False
+        self.revalidate_analytics()
+        return True
+    
+    async def get_cached_analytics(self) -> Optional[AnalyticsData]:
+        """Get the current analytics snapshot if there is one, revalidating it when stale."""
+        try:
+            analytics = await self.get_current_snapshot()
+            if analytics:
+                self.revalidate_if_stale(analytics)
+            return analytics
             
         except Exception as e:
             logger.error(f"Error getting cached analytics: {e}")
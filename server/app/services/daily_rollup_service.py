@@ -0,0 +1,218 @@
+from typing import List, Dict, Optional
+from collections import Counter
+from datetime import datetime
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import UpdateOne
+from app.core.database import get_collection, JOBS_COLLECTION, JOBS_DAILY_ROLLUP_COLLECTION
+from app.utils.mongo_keys import encode_key, decode_counts
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Counter maps kept on each day document, keyed by the job field they count
+DIMENSIONS = {
+    "locations": "location",
+    "seniorities": "seniority",
+    "statuses": None,
+    "skills": "tech_skills"
+}
+
+# Scalar counters kept on each day document
+COUNT_FIELDS = ["job_count", "salary_count", "salary_min_total", "salary_max_total"]
+
+META_ID = "meta"
+
+def day_start(value: datetime) -> datetime:
+    """Truncate a timestamp to the start of its (UTC) day."""
+    return datetime(value.year, value.month, value.day)
+
+def empty_counters() -> dict:
+    return {
+        **{field: 0 for field in COUNT_FIELDS},
+        **{dimension: Counter() for dimension in DIMENSIONS}
+    }
+
+class DailyRollupService:
+    """
+    Per-day job counters bucketed by the job's created_at.
+
+    The jobs_daily_rollup collection holds one kind="day" document per day
+    with a job_count, counter maps per location, seniority, status and tech
+    skill, and salary totals for averaging. A kind="meta" document marks a
+    completed rebuild; until then readers aggregate the jobs collection.
+    """
+
+    def __init__(self, db=None):
+        if db is not None:
+            self.collection: AsyncIOMotorCollection = db[JOBS_DAILY_ROLLUP_COLLECTION]
+            self.jobs_collection: AsyncIOMotorCollection = db[JOBS_COLLECTION]
+        else:
+            self.collection = get_collection(JOBS_DAILY_ROLLUP_COLLECTION)
+            self.jobs_collection = get_collection(JOBS_COLLECTION)
+
+    @staticmethod
+    def day_id(day: datetime) -> str:
+        return f"day:{day.strftime('%Y-%m-%d')}"
+
+    @staticmethod
+    def _accumulate(days: Dict[datetime, dict], job: dict, sign: int) -> None:
+        """Add (or with sign=-1 subtract) a job's contribution to its day."""
+        created_at = job.get("created_at")
+        if not isinstance(created_at, datetime):
+            return
+
+        day = days.setdefault(day_start(created_at), empty_counters())
+        data = job.get("data") or {}
+
+        day["job_count"] += sign
+        for dimension, field in DIMENSIONS.items():
+            value = job.get("status") if field is None else data.get(field)
+            values = set(value) if isinstance(value, list) else [value]
+            for item in values:
+                if isinstance(item, str) and item.strip():
+                    day[dimension][item] += sign
+
+        if job.get("salary_min") is not None:
+            day["salary_count"] += sign
+            day["salary_min_total"] += sign * job["salary_min"]
+            day["salary_max_total"] += sign * (job.get("salary_max") or job["salary_min"])
+
+    async def apply_job_changes(self, removed: List[dict], added: List[dict]) -> None:
+        """Apply the per-day deltas for jobs removed from and added to the corpus."""
+        try:
+            days: Dict[datetime, dict] = {}
+            for sign, jobs in ((-1, removed), (1, added)):
+                for job in jobs:
+                    self._accumulate(days, job, sign)
+
+            now = datetime.utcnow()
+            operations = []
+            for day, deltas in days.items():
+                inc = {field: deltas[field] for field in COUNT_FIELDS
+                       if deltas[field]}
+                for dimension in DIMENSIONS:
+                    inc.update({f"{dimension}.{encode_key(key)}": delta
+                                for key, delta in deltas[dimension].items() if delta})
+                if not inc:
+                    continue
+                operations.append(UpdateOne(
+                    {"_id": self.day_id(day)},
+                    {"$inc": inc, "$set": {"kind": "day", "date": day, "updated_at": now}},
+                    upsert=True
+                ))
+
+            if operations:
+                await self.collection.bulk_write(operations, ordered=False)
+
+        except Exception as e:
+            logger.error(f"Error applying daily rollup changes: {e}")
+            raise e
+
+    async def is_ready(self) -> bool:
+        """Whether the rollup covers the whole corpus."""
+        return await self.collection.find_one({"_id": META_ID}, {"_id": 1}) is not None
+
+    @staticmethod
+    def _format_day(day: datetime, doc: dict) -> dict:
+        result = {"date": day, **{field: doc.get(field, 0) for field in COUNT_FIELDS}}
+        for dimension in DIMENSIONS:
+            counts = doc.get(dimension)
+            if isinstance(counts, Counter):
+                counts = dict(counts)
+            else:
+                counts = decode_counts(counts)
+            # Counters that were decremented back to zero stay in the map
+            result[dimension] = {key: count for key, count in counts.items() if count > 0}
+        return result
+
+    async def get_days(self, start: datetime, end: Optional[datetime] = None) -> List[dict]:
+        """
+        Read the per-day counters for days in [start, end), oldest first.
+
+        Falls back to aggregating the jobs created in the range when the
+        rollup has not been built yet.
+        """
+        try:
+            start = day_start(start)
+            date_range = {"$gte": start}
+            if end is not None:
+                date_range["$lt"] = end
+
+            if await self.is_ready():
+                cursor = self.collection.find({"kind": "day", "date": date_range}).sort("date", 1)
+                return [self._format_day(doc["date"], doc) async for doc in cursor if doc.get("job_count", 0) > 0]
+
+            days: Dict[datetime, dict] = {}
+            async for job in self.jobs_collection.find({"created_at": date_range}, self._projection()):
+                self._accumulate(days, job, 1)
+            return [self._format_day(day, days[day]) for day in sorted(days)]
+
+        except Exception as e:
+            logger.error(f"Error reading daily rollup: {e}")
+            raise e
+
+    async def count_jobs_before(self, end: datetime) -> int:
+        """Number of jobs created before the given time."""
+        if not await self.is_ready():
+            return await self.jobs_collection.count_documents({"created_at": {"$lt": end}})
+
+        pipeline = [
+            {"$match": {"kind": "day", "date": {"$lt": end}}},
+            {"$group": {"_id": None, "total": {"$sum": "$job_count"}}}
+        ]
+        result = await self.collection.aggregate(pipeline).to_list(1)
+        return result[0]["total"] if result else 0
+
+    @staticmethod
+    def _projection() -> dict:
+        projection = {"created_at": 1, "status": 1, "salary_min": 1, "salary_max": 1}
+        projection.update({f"data.{field}": 1 for field in DIMENSIONS.values() if field})
+        return projection
+
+    async def rebuild(self, batch_size: int = 1000) -> int:
+        """Rebuild every day document from the jobs collection. Returns the number of jobs counted."""
+        try:
+            logger.info("Rebuilding daily rollup...")
+            await self.collection.delete_many({})
+
+            batch = []
+            total = 0
+            async for job in self.jobs_collection.find({}, self._projection()):
+                batch.append(job)
+                if len(batch) >= batch_size:
+                    await self.apply_job_changes([], batch)
+                    total += len(batch)
+                    batch = []
+            if batch:
+                await self.apply_job_changes([], batch)
+                total += len(batch)
+
+            await self.mark_ready()
+            logger.info(f"Daily rollup rebuilt from {total} jobs")
+            return total
+
+        except Exception as e:
+            logger.error(f"Error rebuilding daily rollup: {e}")
+            raise e
+
+    async def reset(self) -> None:
+        """Clear all day documents for an empty jobs collection."""
+        await self.collection.delete_many({})
+        await self.mark_ready()
+
+    async def mark_ready(self) -> None:
+        await self.collection.update_one(
+            {"_id": META_ID},
+            {"$set": {"kind": "meta", "built_at": datetime.utcnow()}},
+            upsert=True
+        )
+
+def merge_days(days: List[dict]) -> dict:
+    """Sum a list of day counters into a single period summary."""
+    merged = empty_counters()
+    for day in days:
+        for field in COUNT_FIELDS:
+            merged[field] += day[field]
+        for dimension in DIMENSIONS:
+            merged[dimension].update(day[dimension])
+    return merged
@@ -0,0 +1,196 @@
+from typing import List, Dict
+from collections import Counter
+from datetime import datetime
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import UpdateOne
+from app.core.database import get_collection, JOBS_COLLECTION, FILTER_OPTIONS_COLLECTION
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Filter dropdowns, keyed by the job data field whose distinct values they list
+FILTER_FIELDS = {
+    "companies": "company",
+    "locations": "location",
+    "seniorities": "seniority",
+    "employment_types": "employment_type",
+    "tech_skills": "tech_skills",
+    "soft_skills": "soft_skills"
+}
+
+STATUS_OPTIONS = ["NEW", "ANALYZED", "MATCHED"]
+
+META_ID = "meta"
+
+class FilterOptionsService:
+    """
+    Versioned dictionary of filter values with per-value job counts.
+
+    The filter_options collection holds one kind="value" document per
+    (filter, value) with a job_count, and a kind="meta" document whose
+    version is incremented whenever a write changes any count. The meta
+    document's built_at marks a completed rebuild; until then readers
+    aggregate the jobs collection.
+    """
+
+    def __init__(self, db=None):
+        if db is not None:
+            self.collection: AsyncIOMotorCollection = db[FILTER_OPTIONS_COLLECTION]
+            self.jobs_collection: AsyncIOMotorCollection = db[JOBS_COLLECTION]
+        else:
+            self.collection = get_collection(FILTER_OPTIONS_COLLECTION)
+            self.jobs_collection = get_collection(JOBS_COLLECTION)
+
+    @staticmethod
+    def value_id(filter_name: str, value: str) -> str:
+        return f"{filter_name}:{value}"
+
+    @staticmethod
+    def _job_values(job: dict):
+        """Yield (filter, value) pairs listed for a job document."""
+        data = job.get("data") or {}
+        for filter_name, field in FILTER_FIELDS.items():
+            value = data.get(field)
+            values = set(value) if isinstance(value, list) else [value]
+            for item in values:
+                if isinstance(item, str) and item.strip():
+                    yield filter_name, item
+
+    async def apply_job_changes(self, removed: List[dict], added: List[dict]) -> None:
+        """Apply the per-value count deltas and bump the dictionary version."""
+        try:
+            deltas = Counter()
+            for sign, jobs in ((-1, removed), (1, added)):
+                for job in jobs:
+                    for key in self._job_values(job):
+                        deltas[key] += sign
+
+            now = datetime.utcnow()
+            operations = []
+            touched_ids = []
+            for (filter_name, value), delta in deltas.items():
+                if not delta:
+                    continue
+                touched_ids.append(self.value_id(filter_name, value))
+                operations.append(UpdateOne(
+                    {"_id": self.value_id(filter_name, value)},
+                    {
+                        "$inc": {"job_count": delta},
+                        "$set": {"kind": "value", "filter": filter_name, "value": value, "updated_at": now}
+                    },
+                    upsert=True
+                ))
+
+            if not operations:
+                return
+
+            await self.collection.bulk_write(operations, ordered=False)
+            await self.collection.delete_many({"_id": {"$in": touched_ids}, "job_count": {"$lte": 0}})
+            await self.collection.update_one(
+                {"_id": META_ID},
+                {"$inc": {"version": 1}, "$set": {"kind": "meta", "updated_at": now}},
+                upsert=True
+            )
+
+        except Exception as e:
+            logger.error(f"Error applying filter options changes: {e}")
+            raise e
+
+    async def get_options(self) -> Dict:
+        """
+        Read the filter dictionary: sorted values and their job counts per filter.
+
+        Aggregates the jobs collection in a single $facet pass when the
+        dictionary has not been built yet.
+        """
+        try:
+            meta = await self.collection.find_one({"_id": META_ID})
+            counts: Dict[str, Dict[str, int]] = {filter_name: {} for filter_name in FILTER_FIELDS}
+
+            if meta and meta.get("built_at"):
+                version = meta.get("version", 0)
+                async for doc in self.collection.find({"kind": "value"}, {"filter": 1, "value": 1, "job_count": 1}):
+                    if doc["filter"] in counts:
+                        counts[doc["filter"]][doc["value"]] = doc["job_count"]
+            else:
+                version = None
+                for filter_name, values in (await self._aggregate_counts()).items():
+                    counts[filter_name] = values
+
+            options = {filter_name: sorted(values) for filter_name, values in counts.items()}
+            return {
+                **options,
+                "status_options": STATUS_OPTIONS,
+                "counts": {filter_name: {value: values[value] for value in options[filter_name]}
+                           for filter_name, values in counts.items()},
+                "version": version
+            }
+
+        except Exception as e:
+            logger.error(f"Error reading filter options: {e}")
+            raise e
+
+    async def _aggregate_counts(self) -> Dict[str, Dict[str, int]]:
+        """Count jobs per value of every filter field in one pass over the jobs collection."""
+        facets = {}
+        for filter_name, field in FILTER_FIELDS.items():
+            stages = [{"$unwind": f"$data.{field}"}] if field.endswith("_skills") else []
+            facets[filter_name] = stages + [
+                {"$group": {"_id": f"$data.{field}", "job_count": {"$sum": 1}}},
+                {"$match": {"_id": {"$type": "string", "$ne": ""}}}
+            ]
+
+        projection = {f"data.{field}": 1 for field in FILTER_FIELDS.values()}
+        pipeline = [{"$project": projection}, {"$facet": facets}]
+        result = await self.jobs_collection.aggregate(pipeline).to_list(1)
+        groups = result[0] if result else {}
+        return {
+            filter_name: {doc["_id"]: doc["job_count"] for doc in groups.get(filter_name, [])}
+            for filter_name in FILTER_FIELDS
+        }
+
+    async def rebuild(self) -> int:
+        """Rebuild the dictionary from the jobs collection. Returns the number of values stored."""
+        try:
+            logger.info("Rebuilding filter options...")
+            meta = await self.collection.find_one({"_id": META_ID}) or {}
+            counts = await self._aggregate_counts()
+
+            await self.collection.delete_many({"kind": "value"})
+            now = datetime.utcnow()
+            documents = [
+                {
+                    "_id": self.value_id(filter_name, value),
+                    "kind": "value",
+                    "filter": filter_name,
+                    "value": value,
+                    "job_count": job_count,
+                    "updated_at": now
+                }
+                for filter_name, values in counts.items()
+                for value, job_count in values.items()
+            ]
+            if documents:
+                await self.collection.insert_many(documents, ordered=False)
+
+            await self.mark_ready(meta.get("version", 0) + 1)
+            logger.info(f"Filter options rebuilt with {len(documents)} values")
+            return len(documents)
+
+        except Exception as e:
+            logger.error(f"Error rebuilding filter options: {e}")
+            raise e
+
+    async def reset(self) -> None:
+        """Clear all values for an empty jobs collection."""
+        meta = await self.collection.find_one({"_id": META_ID}) or {}
+        await self.collection.delete_many({"kind": "value"})
+        await self.mark_ready(meta.get("version", 0) + 1)
+
+    async def mark_ready(self, version: int) -> None:
+        now = datetime.utcnow()
+        await self.collection.update_one(
+            {"_id": META_ID},
+            {"$set": {"kind": "meta", "version": version, "built_at": now, "updated_at": now}},
+            upsert=True
+        )
@@ -0,0 +1,367 @@
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Tuple
+from collections import deque
+from datetime import datetime
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pydantic import ValidationError
+from bson import ObjectId
+from app.core.config import settings
+from app.core.database import get_collection, IMPORTS_COLLECTION
+from app.core.process_pool import run_in_process
+from app.models.job import JobCreate
+from app.schemas.scraped_job_schema import ScrapedJobResponse
+from app.services.job_service import JobService
+from app.services.seeder_service import SeederService
+from app.utils.ndjson import iter_ndjson_lines, MAX_LINE_BYTES
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Jobs validated and written together when ingesting an NDJSON stream
+STREAM_CHUNK_SIZE = 500
+
+# Jobs written per step of a background import; workers yield to request handlers in between
+BACKGROUND_CHUNK_SIZE = 500
+
+# Errors kept on an import's status document
+MAX_IMPORT_ERRORS = 100
+
+def _error_message(error: Exception) -> str:
+    if not isinstance(error, ValidationError):
+        return str(error)
+    messages = []
+    for item in error.errors():
+        location = ".".join(str(part) for part in item["loc"])
+        messages.append(f"{location}: {item['msg']}" if location else item["msg"])
+    return "; ".join(messages)
+
+def _scraped_job_to_create(scraped_job: ScrapedJobResponse) -> JobCreate:
+    if not scraped_job.success:
+        raise ValueError(f"Scraper marked as unsuccessful - {scraped_job.message}")
+    return scraped_job.to_job_create()
+
+def _scraped_line_to_create(line: bytes) -> JobCreate:
+    return _scraped_job_to_create(ScrapedJobResponse.model_validate_json(line))
+
+def _scraped_item_to_create(item: dict) -> JobCreate:
+    return _scraped_job_to_create(ScrapedJobResponse.model_validate(item))
+
+def _prepare_job(convert: Callable[[Any], JobCreate], item: Any) -> Tuple[Optional[dict], Optional[str]]:
+    try:
+        return JobService.prepare_new_job(convert(item)), None
+    except Exception as e:
+        return None, _error_message(e)
+
+# Validation and normalization stages. They run in the process pool, so they
+# are top-level functions taking and returning only picklable values: the
+# job documents built by JobService.prepare_new_job, or an error per item.
+
+def prepare_scraped_job_lines(
+    lines: List[Tuple[int, Optional[bytes]]]
+) -> List[Tuple[int, Optional[dict], Optional[str]]]:
+    """Validate and normalize NDJSON lines of scraper output. Returns (line_number, document, error) per line."""
+    results = []
+    for line_number, line in lines:
+        if line is None:
+            document, error = None, f"longer than {MAX_LINE_BYTES} bytes"
+        else:
+            document, error = _prepare_job(_scraped_line_to_create, line)
+        results.append((line_number, document, f"Line {line_number}: {error}" if error else None))
+    return results
+
+def prepare_scraped_jobs(items: List[dict]) -> List[Tuple[Optional[dict], Optional[str]]]:
+    """Validate and normalize scraper responses submitted as JSON objects."""
+    return [_prepare_job(_scraped_item_to_create, item) for item in items]
+
+def prepare_n8n_jobs(items: List[dict]) -> List[Tuple[Optional[dict], Optional[str]]]:
+    """Convert and normalize jobs in n8n scraper format."""
+    return [_prepare_job(SeederService.build_n8n_job, item) for item in items]
+
+# Background import sources and the stage preparing a chunk of their items
+IMPORT_SOURCES: Dict[str, Callable[[List[Any]], List[Tuple[Optional[dict], Optional[str]]]]] = {
+    "scraped-jobs": prepare_scraped_jobs,
+    "n8n": prepare_n8n_jobs
+}
+
+# Submitted imports waiting for a worker: (import_id, source, items)
+_queue: Optional[asyncio.Queue] = None
+_workers: List[asyncio.Task] = []
+# Imports of this process that are queued or running
+_pending_ids: set = set()
+
+class ImportService:
+    """
+    Ingestion of scraped jobs: chunked NDJSON streams, and background imports
+    drained from a bounded queue by a fixed pool of workers. Both validate
+    and normalize chunks in the process pool; only the writes run on the
+    event loop.
+
+    Each background import has a status document in the imports collection
+    with its counts, throughput and first errors.
+    """
+
+    def __init__(self, db=None):
+        if db is not None:
+            self.collection: AsyncIOMotorCollection = db[IMPORTS_COLLECTION]
+        else:
+            self.collection = get_collection(IMPORTS_COLLECTION)
+        self.job_service = JobService(db)
+
+    async def submit(self, source: str, items: List[Any]) -> str:
+        """
+        Record an import and queue it for the workers. Returns the import ID.
+
+        Raises asyncio.QueueFull when the workers are not running or the
+        queue is at capacity.
+        """
+        if _queue is None or _queue.full():
+            raise asyncio.QueueFull()
+        try:
+            now = datetime.utcnow()
+            import_doc = {
+                "source": source,
+                "status": "queued",
+                "total": len(items),
+                "processed": 0,
+                "created": 0,
+                "updated": 0,
+                "failed": 0,
+                "errors": [],
+                "jobs_per_second": None,
+                "submitted_at": now,
+                "started_at": None,
+                "finished_at": None,
+                "updated_at": now
+            }
+            result = await self.collection.insert_one(import_doc)
+            _queue.put_nowait((result.inserted_id, source, items))
+            _pending_ids.add(result.inserted_id)
+            logger.info(f"Queued {source} import {result.inserted_id} of {len(items)} jobs")
+            return str(result.inserted_id)
+
+        except asyncio.QueueFull:
+            await self.collection.delete_one({"_id": result.inserted_id})
+            raise
+        except Exception as e:
+            logger.error(f"Error submitting import: {e}")
+            raise e
+
+    @staticmethod
+    def _to_response(import_doc: dict) -> Dict:
+        import_doc["id"] = str(import_doc.pop("_id"))
+        total = import_doc.get("total") or 0
+        import_doc["progress"] = round(import_doc.get("processed", 0) / total * 100, 1) if total else 100.0
+        return import_doc
+
+    async def get_import(self, import_id: str) -> Optional[Dict]:
+        """Get the status of a background import."""
+        try:
+            if not ObjectId.is_valid(import_id):
+                return None
+            import_doc = await self.collection.find_one({"_id": ObjectId(import_id)})
+            return self._to_response(import_doc) if import_doc else None
+
+        except Exception as e:
+            logger.error(f"Error getting import {import_id}: {e}")
+            raise e
+
+    async def list_imports(self, limit: int = 20) -> List[Dict]:
+        """Get the most recently submitted imports, without their errors."""
+        try:
+            cursor = self.collection.find({}, {"errors": 0}).sort("submitted_at", -1).limit(limit)
+            return [self._to_response(import_doc) async for import_doc in cursor]
+
+        except Exception as e:
+            logger.error(f"Error listing imports: {e}")
+            raise e
+
+    async def run_import(self, import_id: ObjectId, source: str, items: List[Any]) -> None:
+        """Write a queued import chunk by chunk, recording progress after each chunk."""
+        prepare = IMPORT_SOURCES[source]
+        started = time.perf_counter()
+        processed = 0
+        await self.collection.update_one(
+            {"_id": import_id},
+            {"$set": {"status": "running", "started_at": datetime.utcnow(), "updated_at": datetime.utcnow()}}
+        )
+
+        try:
+            # The next chunk is prepared in the process pool while this one is written
+            next_prepared = run_in_process(prepare, items[:BACKGROUND_CHUNK_SIZE]) if items else None
+            for start in range(0, len(items), BACKGROUND_CHUNK_SIZE):
+                chunk = items[start:start + BACKGROUND_CHUNK_SIZE]
+                prepared = await next_prepared
+                following = start + BACKGROUND_CHUNK_SIZE
+                if following < len(items):
+                    next_prepared = run_in_process(prepare, items[following:following + BACKGROUND_CHUNK_SIZE])
+
+                documents, positions, errors = [], [], []
+                for position, (document, error) in enumerate(prepared, start + 1):
+                    if error:
+                        errors.append(f"Job {position}: {error}")
+                    else:
+                        documents.append(document)
+                        positions.append(position)
+
+                outcomes = await self.job_service.import_prepared_jobs(documents)
+                counts = {"created": 0, "updated": 0, "failed": len(errors)}
+                for position, outcome in zip(positions, outcomes):
+                    counts[outcome["action"]] += 1
+                    if outcome["action"] == "failed":
+                        errors.append(f"Job {position}: {outcome['error']}")
+
+                processed += len(chunk)
+                elapsed = time.perf_counter() - started
+                await self.collection.update_one(
+                    {"_id": import_id},
+                    {
+                        "$inc": {"processed": len(chunk), **counts},
+                        "$set": {
+                            "jobs_per_second": round(processed / elapsed, 1) if elapsed else None,
+                            "updated_at": datetime.utcnow()
+                        },
+                        "$push": {"errors": {"$each": errors, "$slice": MAX_IMPORT_ERRORS}}
+                    }
+                )
+                # Let request handlers run between chunks
+                await asyncio.sleep(0)
+
+            status, error = "completed", None
+        except Exception as e:
+            logger.error(f"Import {import_id} failed: {e}")
+            status, error = "failed", str(e)
+
+        await self.collection.update_one(
+            {"_id": import_id},
+            {"$set": {"status": status, "error": error, "finished_at": datetime.utcnow(), "updated_at": datetime.utcnow()}}
+        )
+        logger.info(f"Import {import_id} {status}: {processed} of {len(items)} jobs in {time.perf_counter() - started:.1f}s")
+
+    async def ingest_ndjson(
+        self,
+        chunks: AsyncIterator[bytes],
+        chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[Dict]:
+        """
+        Import scraped jobs from a stream of NDJSON bytes, one job per line.
+
+        Lines are validated and written chunk_size at a time as they arrive,
+        so memory stays bounded by a few chunks however long the stream is.
+        Validation and normalization run in the process pool, overlapping
+        with the writes of earlier chunks.
+        Yields a progress report after each chunk and a summary at the end.
+        """
+        started = time.perf_counter()
+        totals = {"lines": 0, "created": 0, "updated": 0, "failed": 0}
+        chunk_number = 0
+        batch: List[Tuple[int, Optional[bytes]]] = []
+        # Chunks being prepared in the process pool while earlier ones are written;
+        # bounded so a fast sender cannot queue up the whole body in memory
+        preparing: Deque[asyncio.Future] = deque()
+        max_preparing = max(settings.IMPORT_PROCESS_WORKERS, 1)
+
+        async for line_number, line in iter_ndjson_lines(chunks):
+            batch.append((line_number, line))
+            if len(batch) >= chunk_size:
+                preparing.append(run_in_process(prepare_scraped_job_lines, batch))
+                batch = []
+                if len(preparing) > max_preparing:
+                    chunk_number += 1
+                    yield await self._write_lines(chunk_number, await preparing.popleft(), totals)
+
+        if batch:
+            preparing.append(run_in_process(prepare_scraped_job_lines, batch))
+        while preparing:
+            chunk_number += 1
+            yield await self._write_lines(chunk_number, await preparing.popleft(), totals)
+
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"Stream import completed: {totals['created']} created, {totals['updated']} updated, "
+            f"{totals['failed']} failed in {elapsed:.1f}s"
+        )
+        yield {
+            "done": True,
+            "chunks": chunk_number,
+            **totals,
+            "elapsed_seconds": round(elapsed, 3),
+            "jobs_per_second": round((totals["created"] + totals["updated"]) / elapsed, 1) if elapsed else None
+        }
+
+    async def _write_lines(
+        self,
+        chunk_number: int,
+        parsed: List[Tuple[int, Optional[dict], Optional[str]]],
+        totals: Dict[str, int]
+    ) -> Dict:
+        """Write one prepared chunk of lines, returning its progress report."""
+        errors = [error for _, _, error in parsed if error]
+        valid = [(line_number, document) for line_number, document, _ in parsed if document is not None]
+
+        try:
+            outcomes = await self.job_service.import_prepared_jobs([document for _, document in valid])
+        except Exception as e:
+            logger.error(f"Failed to import chunk {chunk_number}: {str(e)}")
+            outcomes = [{"action": "failed", "job_id": None, "error": str(e)}] * len(valid)
+
+        counts = {"created": 0, "updated": 0, "failed": len(errors)}
+        for (line_number, _), outcome in zip(valid, outcomes):
+            if outcome["action"] == "failed":
+                errors.append(f"Line {line_number}: {outcome['error']}")
+                counts["failed"] += 1
+            else:
+                counts[outcome["action"]] += 1
+
+        totals["lines"] = parsed[-1][0]
+        for key, count in counts.items():
+            totals[key] += count
+
+        return {
+            "chunk": chunk_number,
+            "lines": totals["lines"],
+            **counts,
+            "errors": errors
+        }
+
+async def _import_worker(worker_number: int) -> None:
+    while True:
+        import_id, source, items = await _queue.get()
+        try:
+            await ImportService().run_import(import_id, source, items)
+        except Exception as e:
+            logger.error(f"Import worker {worker_number} error: {e}")
+        finally:
+            _queue.task_done()
+        # Not reached when the worker is cancelled mid-import, so
+        # stop_import_workers still finds the import and marks it failed
+        _pending_ids.discard(import_id)
+
+def start_import_workers(workers: int = settings.IMPORT_WORKERS, queue_size: int = settings.IMPORT_QUEUE_SIZE) -> None:
+    """Create the import queue and start its worker tasks on the running event loop."""
+    global _queue
+    if _workers:
+        return
+    _queue = asyncio.Queue(maxsize=queue_size)
+    for worker_number in range(workers):
+        _workers.append(asyncio.create_task(_import_worker(worker_number)))
+    logger.info(f"Started {workers} import workers")
+
+async def stop_import_workers() -> None:
+    """Cancel the import workers and mark the imports they had not finished as failed."""
+    global _queue
+    for task in _workers:
+        task.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _workers.clear()
+    _queue = None
+
+    if _pending_ids:
+        try:
+            await get_collection(IMPORTS_COLLECTION).update_many(
+                {"_id": {"$in": list(_pending_ids)}},
+                {"$set": {"status": "failed", "error": "Interrupted by server shutdown", "finished_at": datetime.utcnow()}}
+            )
+        except Exception as e:
+            logger.error(f"Error marking interrupted imports: {e}")
+        _pending_ids.clear()
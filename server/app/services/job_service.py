@@ -1,26 +1,83 @@
-from typing import List, Dict, Optional, Tuple
+from typing import AsyncIterator, List, Dict, Optional, Tuple, Type
 from datetime import datetime, timedelta
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from pydantic import BaseModel
 from app.core.database import get_collection, JOBS_COLLECTION
+from app.core.cache import bump_generation
+from app.core.serialization import dumps
 from app.models.job import ScrapedJob, JobCreate, JobUpdate
+from app.services.skills_cache_service import SkillsCacheService
+from app.services.daily_rollup_service import DailyRollupService
+from app.services.filter_options_service import FilterOptionsService
+from app.utils.job_fields import derive_job_fields, job_fingerprint, match_condition, SOURCE_FIELDS
+from app.utils.job_export import CSV_COLUMNS, EXPORT_CHUNK_SIZE, EXPORT_PROJECTION, csv_row
+from app.utils.skills import canonical_job_skills, canonicalize_skills, SKILL_FIELDS
+from app.utils.pagination import encode_cursor, decode_cursor, drop_field, field_value, keyset_filter
 from bson import ObjectId
+import csv
+import io
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Jobs written per bulk_write when importing scraped jobs
+IMPORT_CHUNK_SIZE = 1000
+
+# Server error code of a unique index violation
+DUPLICATE_KEY_ERROR = 11000
+
+# Fields an import overwrites on an already stored job, besides the derived fields
+IMPORT_UPDATE_FIELDS = ["data", "message", "success", "updated_at"]
+
 class JobService:
-    def __init__(self):
-        self.collection: AsyncIOMotorCollection = get_collection(JOBS_COLLECTION)
+    def __init__(self, db=None):
+        if db is not None:
+            self.collection: AsyncIOMotorCollection = db[JOBS_COLLECTION]
+        else:
+            self.collection = get_collection(JOBS_COLLECTION)
+        self.skills_cache = SkillsCacheService(db)
+        self.daily_rollup = DailyRollupService(db)
+        self.filter_options = FilterOptionsService(db)
+    
+    async def _on_jobs_changed(self, removed: List[dict], added: List[dict]) -> None:
+        """Keep the collections derived from jobs in step with a write."""
+        try:
+            maintainers = (
+                ("skills cache", self.skills_cache),
+                ("daily rollup", self.daily_rollup),
+                ("filter options", self.filter_options)
+            )
+            for name, maintainer in maintainers:
+                try:
+                    await maintainer.apply_job_changes(removed, added)
+                except Exception as e:
+                    # The write itself succeeded; a rebuild brings the counters back in line
+                    logger.error(f"Error maintaining {name}: {e}")
+        finally:
+            # Invalidate cached responses once the derived data is up to date
+            bump_generation(JOBS_COLLECTION)
+    
+    @staticmethod
+    def prepare_new_job(job: JobCreate) -> dict:
+        """Build the document stored for a new job: canonical skills, derived fields and timestamps."""
+        job_dict = job.dict(by_alias=True)
+        job_dict["data"].update(canonical_job_skills(job_dict["data"]))
+        job_dict.update(derive_job_fields(job_dict))
+        now = datetime.utcnow()
+        job_dict["created_at"] = now
+        job_dict["updated_at"] = now
+        return job_dict
     
     async def create_job(self, job: JobCreate) -> ScrapedJob:
         """Create a new job posting."""
         try:
-            job_dict = job.dict(by_alias=True)
-            job_dict["created_at"] = datetime.utcnow()
-            job_dict["updated_at"] = datetime.utcnow()
+            job_dict = self.prepare_new_job(job)
             
             result = await self.collection.insert_one(job_dict)
             job_dict["_id"] = result.inserted_id
+            await self._on_jobs_changed([], [job_dict])
             
             return ScrapedJob(**job_dict)
         except Exception as e:
@@ -41,6 +98,71 @@ class JobService:
             logger.error(f"Error getting job by ID: {e}")
             raise e
     
+    @staticmethod
+    def _to_jobs(documents: List[dict], model: Optional[Type[BaseModel]]) -> List:
+        """Build response models from stored documents, or keep the documents as-is."""
+        if model is None:
+            return documents
+        return [model(**job_dict) for job_dict in documents]
+    
+    @staticmethod
+    def build_filter_query(
+        search: Optional[str] = None,
+        company: Optional[str] = None,
+        location: Optional[str] = None,
+        seniority: Optional[str] = None,
+        employment_type: Optional[str] = None,
+        status: Optional[str] = None,
+        skills: Optional[List[str]] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        match: str = "contains"
+    ) -> Dict:
+        """
+        Build the Mongo filter shared by job listing and export.
+
+        match selects how company, location, seniority and employment type
+        compare: "exact" and "prefix" are index seeks, "contains" scans the
+        index keys. Matching is case-insensitive and user input is escaped.
+        """
+        filter_query = {}
+        
+        # Case-insensitive matches run against the indexed normalized.* copies
+        text_filters = {
+            "company": company,
+            "location": location,
+            "seniority": seniority,
+            "employment_type": employment_type
+        }
+        for field, value in text_filters.items():
+            if value:
+                filter_query[f"normalized.{field}"] = match_condition(value, match)
+        
+        if status:
+            filter_query["status"] = status
+        
+        # Stored skills are canonical, so aliases in the query must be too
+        skills = canonicalize_skills(skills)
+        if skills:
+            filter_query["$or"] = [
+                {"data.tech_skills": {"$in": skills}},
+                {"data.soft_skills": {"$in": skills}}
+            ]
+        
+        if date_from or date_to:
+            date_filter = {}
+            if date_from:
+                date_filter["$gte"] = date_from
+            if date_to:
+                date_filter["$lte"] = date_to
+            filter_query["created_at"] = date_filter
+        
+        # Text search across multiple fields
+        if search:
+            filter_query["$text"] = {"$search": search}
+        
+        return filter_query
+    
     async def get_jobs(
         self,
         skip: int = 0,
@@ -55,83 +177,176 @@ class JobService:
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None,
         sort_by: str = "created_at",
-        sort_order: int = -1
+        sort_order: int = -1,
+        match: str = "contains"
     ) -> Tuple[List[ScrapedJob], int]:
         """Get jobs with filtering, search, and pagination."""
+        jobs, total_count, _ = await self.get_jobs_page(
+            filters={
+                "search": search,
+                "company": company,
+                "location": location,
+                "seniority": seniority,
+                "employment_type": employment_type,
+                "status": status,
+                "skills": skills,
+                "date_from": date_from,
+                "date_to": date_to,
+                "match": match
+            },
+            skip=skip,
+            limit=limit,
+            sort_by=sort_by,
+            sort_order=sort_order
+        )
+        return jobs, total_count
+    
+    async def get_jobs_page(
+        self,
+        filters: Dict,
+        limit: int = 100,
+        skip: int = 0,
+        cursor: Optional[str] = None,
+        sort_by: str = "created_at",
+        sort_order: int = -1,
+        include_total: bool = True,
+        projection: Optional[Dict] = None,
+        model: Optional[Type[BaseModel]] = ScrapedJob
+    ) -> Tuple[List, Optional[int], Optional[str]]:
+        """
+        Get one page of jobs and the cursor of the next page.
+
+        With a cursor (from a previous page's next_cursor) the page starts
+        right after the last job returned, using an index range on
+        (sort_by, _id) instead of skipping, so every page costs the same.
+        Returns (jobs, total_count, next_cursor); total_count is None unless
+        include_total is set, and next_cursor is None on the last page.
+        A projection limits the fields returned; jobs are built as `model`, or
+        returned as plain documents when model is None.
+        """
         try:
-            # Build filter query
-            filter_query = {}
-            
-            if company:
-                filter_query["data.company"] = {"$regex": company, "$options": "i"}
-            
-            if location:
-                filter_query["data.location"] = {"$regex": location, "$options": "i"}
+            filter_query = self.build_filter_query(**filters)
             
-            if seniority:
-                filter_query["data.seniority"] = {"$regex": seniority, "$options": "i"}
+            query = filter_query
+            if cursor:
+                cursor_field, cursor_order, value, last_id = decode_cursor(cursor)
+                if (cursor_field, cursor_order) != (sort_by, sort_order):
+                    raise ValueError("Cursor does not match the requested sort")
+                keyset = keyset_filter(sort_by, sort_order, value, last_id)
+                query = {"$and": [filter_query, keyset]} if filter_query else keyset
+                skip = 0
             
-            if employment_type:
-                filter_query["data.employment_type"] = {"$regex": employment_type, "$options": "i"}
-            
-            if status:
-                filter_query["status"] = status
-            
-            if skills:
-                filter_query["$or"] = [
-                    {"data.tech_skills": {"$in": skills}},
-                    {"data.soft_skills": {"$in": skills}}
-                ]
-            
-            if date_from or date_to:
-                date_filter = {}
-                if date_from:
-                    date_filter["$gte"] = date_from
-                if date_to:
-                    date_filter["$lte"] = date_to
-                filter_query["created_at"] = date_filter
+            # Get total count
+            total_count = await self.collection.count_documents(filter_query) if include_total else None
             
-            # Text search across multiple fields
-            if search:
-                filter_query["$text"] = {"$search": search}
+            # _id breaks ties so the order, and therefore the cursor, is total
+            sort_query = [(sort_by, sort_order), ("_id", sort_order)]
             
-            # Get total count
-            total_count = await self.collection.count_documents(filter_query)
+            # The cursor needs the sort value of the last job, even when the
+            # projection leaves it out; it is dropped again before returning
+            sort_field_added = bool(projection) and all(projection.values()) and not any(
+                sort_by == field or sort_by.startswith(field + ".") for field in projection
+            )
+            if sort_field_added:
+                projection = {**projection, sort_by: 1}
             
-            # Build sort query
-            sort_query = [(sort_by, sort_order)]
+            # Fetch one extra job to learn whether another page follows
+            documents = await self.collection.find(query, projection).sort(sort_query).skip(skip).limit(limit + 1).to_list(limit + 1)
             
-            # Execute query with pagination
-            cursor = self.collection.find(filter_query).sort(sort_query).skip(skip).limit(limit)
-            jobs = []
+            next_cursor = None
+            if len(documents) > limit:
+                documents = documents[:limit]
+                last = documents[-1]
+                next_cursor = encode_cursor(sort_by, sort_order, field_value(last, sort_by), last["_id"])
             
-            async for job_dict in cursor:
-                jobs.append(ScrapedJob(**job_dict))
+            if sort_field_added:
+                for document in documents:
+                    drop_field(document, sort_by)
             
-            return jobs, total_count
+            return self._to_jobs(documents, model), total_count, next_cursor
             
         except Exception as e:
             logger.error(f"Error getting jobs: {e}")
             raise e
     
+    async def export_jobs(
+        self,
+        filters: Dict,
+        export_format: str = "ndjson",
+        sort_by: str = "created_at",
+        sort_order: int = -1,
+        batch_size: int = 500
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream every job matching the filters as NDJSON or CSV.
+
+        Jobs are read from a single cursor and yielded in chunks of about
+        EXPORT_CHUNK_SIZE bytes, so memory stays constant regardless of how
+        many jobs match.
+        """
+        try:
+            filter_query = self.build_filter_query(**filters)
+            cursor = self.collection.find(
+                filter_query, EXPORT_PROJECTION, batch_size=batch_size
+            ).sort([(sort_by, sort_order)])
+            
+            if export_format == "csv":
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                writer.writerow(CSV_COLUMNS)
+                async for job_dict in cursor:
+                    writer.writerow(csv_row(job_dict))
+                    if buffer.tell() >= EXPORT_CHUNK_SIZE:
+                        yield buffer.getvalue().encode("utf-8")
+                        buffer.seek(0)
+                        buffer.truncate()
+                if buffer.tell():
+                    yield buffer.getvalue().encode("utf-8")
+            else:
+                chunk = bytearray()
+                async for job_dict in cursor:
+                    chunk += dumps(job_dict) + b"\n"
+                    if len(chunk) >= EXPORT_CHUNK_SIZE:
+                        yield bytes(chunk)
+                        chunk = bytearray()
+                if chunk:
+                    yield bytes(chunk)
+            
+        except Exception as e:
+            logger.error(f"Error exporting jobs: {e}")
+            raise e
+    
     async def update_job(self, job_id: str, job_update: JobUpdate) -> Optional[ScrapedJob]:
-        """Update an existing job."""
+        """
+        Update an existing job.
+
+        Raises DuplicateKeyError when the new data gives the job the
+        fingerprint of another stored job.
+        """
         try:
             if not ObjectId.is_valid(job_id):
                 return None
             
             update_data = job_update.dict(exclude_unset=True)
+            if update_data.get("data"):
+                update_data["data"].update(canonical_job_skills(update_data["data"]))
+                update_data.update(derive_job_fields(update_data))
             update_data["updated_at"] = datetime.utcnow()
             
-            result = await self.collection.update_one(
+            previous = await self.collection.find_one_and_update(
                 {"_id": ObjectId(job_id)},
-                {"$set": update_data}
+                {"$set": update_data},
+                return_document=ReturnDocument.BEFORE
             )
+            if not previous:
+                return None
             
-            if result.modified_count > 0:
-                return await self.get_job_by_id(job_id)
-            return None
+            updated = await self.collection.find_one({"_id": ObjectId(job_id)})
+            await self._on_jobs_changed([previous], [updated])
+            return ScrapedJob(**updated)
             
+        except DuplicateKeyError:
+            raise
         except Exception as e:
             logger.error(f"Error updating job: {e}")
             raise e
@@ -151,12 +366,16 @@ class JobService:
                 "updated_at": datetime.utcnow()
             }
             
-            result = await self.collection.update_one(
+            previous = await self.collection.find_one_and_update(
                 {"_id": ObjectId(job_id)},
-                {"$set": update_data}
+                {"$set": update_data},
+                return_document=ReturnDocument.BEFORE
             )
+            if not previous:
+                return False
             
-            return result.modified_count > 0
+            await self._on_jobs_changed([previous], [{**previous, **update_data}])
+            return True
             
         except Exception as e:
             logger.error(f"Error updating job status: {e}")
@@ -168,44 +387,74 @@ class JobService:
             if not ObjectId.is_valid(job_id):
                 return False
             
-            result = await self.collection.delete_one({"_id": ObjectId(job_id)})
-            return result.deleted_count > 0
+            deleted = await self.collection.find_one_and_delete({"_id": ObjectId(job_id)})
+            if not deleted:
+                return False
+            
+            await self._on_jobs_changed([deleted], [])
+            return True
             
         except Exception as e:
             logger.error(f"Error deleting job: {e}")
             raise e
     
-    async def get_jobs_by_company(self, company: str, limit: int = 50) -> List[ScrapedJob]:
+    async def find_duplicate_job(
+        self,
+        company: str,
+        title: str,
+        job_link: Optional[str] = None
+    ) -> Optional[ScrapedJob]:
+        """Find the stored job with the same fingerprint (canonical link, else company and title)."""
+        try:
+            filter_query = {"fingerprint": job_fingerprint({"company": company, "title": title, "job_link": job_link})}
+            
+            job_dict = await self.collection.find_one(filter_query)
+            if job_dict:
+                return ScrapedJob(**job_dict)
+            return None
+            
+        except Exception as e:
+            logger.error(f"Error finding duplicate job: {e}")
+            raise e
+    
+    async def get_jobs_by_company(
+        self,
+        company: str,
+        limit: int = 50,
+        projection: Optional[Dict] = None,
+        model: Optional[Type[BaseModel]] = ScrapedJob,
+        match: str = "contains"
+    ) -> List:
         """Get all jobs from a specific company."""
         try:
             cursor = self.collection.find(
-                {"data.company": {"$regex": company, "$options": "i"}}
+                {"normalized.company": match_condition(company, match)},
+                projection
             ).sort("created_at", -1).limit(limit)
             
-            jobs = []
-            async for job_dict in cursor:
-                jobs.append(ScrapedJob(**job_dict))
-            
-            return jobs
+            return self._to_jobs(await cursor.to_list(limit), model)
             
         except Exception as e:
             logger.error(f"Error getting jobs by company: {e}")
             raise e
     
-    async def get_recent_jobs(self, days: int = 7, limit: int = 50) -> List[ScrapedJob]:
+    async def get_recent_jobs(
+        self,
+        days: int = 7,
+        limit: int = 50,
+        projection: Optional[Dict] = None,
+        model: Optional[Type[BaseModel]] = ScrapedJob
+    ) -> List:
         """Get recent jobs from the last N days."""
         try:
             date_from = datetime.utcnow() - timedelta(days=days)
             
             cursor = self.collection.find(
-                {"created_at": {"$gte": date_from}}
+                {"created_at": {"$gte": date_from}},
+                projection
             ).sort("created_at", -1).limit(limit)
             
-            jobs = []
-            async for job_dict in cursor:
-                jobs.append(ScrapedJob(**job_dict))
-            
-            return jobs
+            return self._to_jobs(await cursor.to_list(limit), model)
             
         except Exception as e:
             logger.error(f"Error getting recent jobs: {e}")
@@ -257,18 +506,274 @@ class JobService:
             raise e
     
     async def bulk_create_jobs(self, jobs: List[JobCreate]) -> List[str]:
-        """Create multiple jobs at once."""
+        """
+        Create multiple jobs at once.
+        
+        The insert is unordered, so one duplicate does not stop the rest of
+        the batch. The derived collections are updated for the jobs that
+        were written before a BulkWriteError is re-raised.
+        """
         try:
-            job_dicts = []
-            for job in jobs:
-                job_dict = job.dict(by_alias=True)
-                job_dict["created_at"] = datetime.utcnow()
-                job_dict["updated_at"] = datetime.utcnow()
-                job_dicts.append(job_dict)
-            
-            result = await self.collection.insert_many(job_dicts)
+            job_dicts = [self.prepare_new_job(job) for job in jobs]
+            
+            try:
+                result = await self.collection.insert_many(job_dicts, ordered=False)
+            except BulkWriteError as e:
+                failed = {error["index"] for error in e.details.get("writeErrors", [])}
+                inserted = [job_dict for index, job_dict in enumerate(job_dicts) if index not in failed]
+                await self._on_jobs_changed([], inserted)
+                raise
+            await self._on_jobs_changed([], job_dicts)
             return [str(id) for id in result.inserted_ids]
             
         except Exception as e:
             logger.error(f"Error bulk creating jobs: {e}")
-            raise e 
\ No newline at end of file
+            raise e 
+    
+    async def import_jobs(self, jobs: List[JobCreate], chunk_size: int = IMPORT_CHUNK_SIZE) -> List[Dict]:
+        """
+        Create or update scraped jobs, matching stored copies by fingerprint.
+        
+        Each chunk is written with one unordered bulk_write of upserts on the
+        unique fingerprint index. Jobs not found by the lookup are written
+        insert-only, so a copy inserted concurrently by another writer is
+        left as stored, then re-read and updated. Returns
+        one result per job, in input order: {"action": "created" | "updated" |
+        "failed", "job_id": ..., "error": ...}.
+        """
+        results: List[Optional[Dict]] = [None] * len(jobs)
+        prepared, indexes = [], []
+        for index, job in enumerate(jobs):
+            try:
+                prepared.append(self.prepare_new_job(job))
+                indexes.append(index)
+            except Exception as e:
+                results[index] = {"action": "failed", "job_id": None, "error": str(e)}
+        
+        for index, outcome in zip(indexes, await self.import_prepared_jobs(prepared, chunk_size)):
+            results[index] = outcome
+        return results
+    
+    async def import_prepared_jobs(self, job_dicts: List[dict], chunk_size: int = IMPORT_CHUNK_SIZE) -> List[Dict]:
+        """Like import_jobs, for documents already built by prepare_new_job (e.g. in a worker process)."""
+        results: List[Dict] = []
+        for start in range(0, len(job_dicts), chunk_size):
+            results.extend(await self._import_chunk(job_dicts[start:start + chunk_size]))
+        return results
+    
+    async def _import_chunk(self, job_dicts: List[dict]) -> List[Dict]:
+        try:
+            results: List[Optional[Dict]] = [None] * len(job_dicts)
+            prepared = dict(enumerate(job_dicts))
+            
+            # Repeats of a job within the chunk collapse into one upsert of its last copy
+            positions: Dict[str, List[int]] = {}
+            for index, job_dict in prepared.items():
+                positions.setdefault(job_dict["fingerprint"], []).append(index)
+            if not positions:
+                return results
+            
+            keys = list(positions)
+            existing: Dict[str, dict] = {}
+            async for doc in self.collection.find({"fingerprint": {"$in": keys}}):
+                existing[doc["fingerprint"]] = doc
+            
+            operations = []
+            updates_by_key: Dict[str, dict] = {}
+            for key in keys:
+                job_dict = prepared[positions[key][-1]]
+                # Re-imports refresh the scraped data; status and creation fields are kept
+                updates = {field: job_dict[field] for field in IMPORT_UPDATE_FIELDS}
+                updates.update(derive_job_fields(job_dict))
+                on_insert = {field: value for field, value in job_dict.items() if field not in updates}
+                updates_by_key[key] = updates
+                if key in existing:
+                    update = {"$set": updates, "$setOnInsert": on_insert}
+                else:
+                    # Leave a copy inserted by a concurrent writer untouched until it is re-read below
+                    update = {"$setOnInsert": {**on_insert, **updates}}
+                operations.append(UpdateOne({"fingerprint": key}, update, upsert=True))
+            
+            failed: Dict[int, str] = {}
+            try:
+                result = await self.collection.bulk_write(operations, ordered=False)
+                upserted = result.upserted_ids
+            except BulkWriteError as e:
+                upserted = {item["index"]: item["_id"] for item in e.details.get("upserted", [])}
+                failed = {error["index"]: error.get("errmsg", "Write failed") for error in e.details.get("writeErrors", [])}
+            
+            removed, added = [], []
+            for op_index, key in enumerate(keys):
+                indexes = positions[key]
+                if op_index in failed:
+                    for index in indexes:
+                        results[index] = {"action": "failed", "job_id": None, "error": failed[op_index]}
+                    continue
+                
+                previous = existing.get(key)
+                if op_index in upserted:
+                    job_id = upserted[op_index]
+                    added.append({**prepared[indexes[-1]], "_id": job_id})
+                    first_action = "created"
+                elif previous:
+                    job_id = previous["_id"]
+                    removed.append(previous)
+                    added.append({**previous, **updates_by_key[key]})
+                    first_action = "updated"
+                else:
+                    # Inserted by a concurrent writer after the lookup: update the copy it stored
+                    matched = await self.collection.find_one({"fingerprint": key})
+                    if matched is None:
+                        for index in indexes:
+                            results[index] = {"action": "failed", "job_id": None, "error": "Job was deleted during the import"}
+                        continue
+                    await self.collection.update_one({"_id": matched["_id"]}, {"$set": updates_by_key[key]})
+                    job_id = matched["_id"]
+                    removed.append(matched)
+                    added.append({**matched, **updates_by_key[key]})
+                    first_action = "updated"
+                
+                for position, index in enumerate(indexes):
+                    action = first_action if position == 0 else "updated"
+                    results[index] = {"action": action, "job_id": str(job_id) if job_id else None, "error": None}
+            
+            if added:
+                await self._on_jobs_changed(removed, added)
+            
+            logger.info(
+                f"Imported chunk of {len(job_dicts)} jobs: {len(upserted)} created, "
+                f"{len(keys) - len(upserted) - len(failed)} updated, {len(failed)} failed"
+            )
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error importing jobs: {e}")
+            raise e
+    
+    async def backfill_derived_fields(self, batch_size: int = 1000) -> int:
+        """
+        Recompute the derived fields of every stored job. Returns the number of jobs updated.
+
+        Jobs whose new fingerprint is already taken by another job are left
+        unchanged and logged; remove_duplicate_jobs deletes them.
+        """
+        try:
+            projection = {field: 1 for field in SOURCE_FIELDS}
+            operations = []
+            total = 0
+            duplicates = 0
+            
+            async def write(operations) -> None:
+                nonlocal total, duplicates
+                try:
+                    await self.collection.bulk_write(operations, ordered=False)
+                    total += len(operations)
+                except BulkWriteError as e:
+                    errors = e.details.get("writeErrors", [])
+                    if any(error.get("code") != DUPLICATE_KEY_ERROR for error in errors):
+                        raise
+                    total += len(operations) - len(errors)
+                    duplicates += len(errors)
+            
+            async for job_dict in self.collection.find({}, projection):
+                operations.append(UpdateOne(
+                    {"_id": job_dict["_id"]},
+                    {"$set": derive_job_fields(job_dict)}
+                ))
+                if len(operations) >= batch_size:
+                    await write(operations)
+                    operations = []
+            
+            if operations:
+                await write(operations)
+            
+            if duplicates:
+                logger.warning(f"Skipped {duplicates} jobs duplicating another job's fingerprint; remove duplicates first")
+            bump_generation(JOBS_COLLECTION)
+            return total
+            
+        except Exception as e:
+            logger.error(f"Error backfilling derived job fields: {e}")
+            raise e
+    
+    async def canonicalize_stored_skills(self, batch_size: int = 1000) -> int:
+        """
+        Rewrite stored skill lists with their canonical names. Returns the number of jobs updated.
+
+        The skill counters are rebuilt afterwards, since renamed skills move
+        between buckets.
+        """
+        try:
+            projection = {f"data.{field}": 1 for field in SKILL_FIELDS}
+            operations = []
+            total = 0
+            
+            async for job_dict in self.collection.find({}, projection):
+                data = job_dict.get("data") or {}
+                canonical = canonical_job_skills(data)
+                changes = {
+                    f"data.{field}": skills for field, skills in canonical.items()
+                    if skills != data.get(field)
+                }
+                if not changes:
+                    continue
+                operations.append(UpdateOne({"_id": job_dict["_id"]}, {"$set": changes}))
+                if len(operations) >= batch_size:
+                    await self.collection.bulk_write(operations, ordered=False)
+                    total += len(operations)
+                    operations = []
+            
+            if operations:
+                await self.collection.bulk_write(operations, ordered=False)
+                total += len(operations)
+            
+            if total:
+                await self.skills_cache.rebuild()
+                await self.daily_rollup.rebuild()
+                await self.filter_options.rebuild()
+                bump_generation(JOBS_COLLECTION)
+            return total
+            
+        except Exception as e:
+            logger.error(f"Error canonicalizing stored skills: {e}")
+            raise e
+    
+    async def remove_duplicate_jobs(self) -> int:
+        """
+        Delete all but the most recently updated job of each fingerprint, so
+        the unique fingerprint index can be built. Returns the number deleted.
+        
+        Fingerprints are computed from each job's data rather than read from
+        the stored field, so this also works before they are backfilled.
+        """
+        try:
+            projection = {**{field: 1 for field in SOURCE_FIELDS}, "updated_at": 1}
+            # fingerprint -> (updated_at, _id) of the copy kept so far
+            newest: Dict[str, Tuple[datetime, ObjectId]] = {}
+            duplicate_ids = []
+            async for job_dict in self.collection.find({}, projection):
+                key = job_fingerprint(job_dict.get("data") or {})
+                candidate = (job_dict.get("updated_at") or datetime.min, job_dict["_id"])
+                kept = newest.get(key)
+                if kept is None:
+                    newest[key] = candidate
+                elif candidate > kept:
+                    duplicate_ids.append(kept[1])
+                    newest[key] = candidate
+                else:
+                    duplicate_ids.append(candidate[1])
+            
+            if not duplicate_ids:
+                return 0
+            
+            result = await self.collection.delete_many({"_id": {"$in": duplicate_ids}})
+            await self.skills_cache.rebuild()
+            await self.daily_rollup.rebuild()
+            await self.filter_options.rebuild()
+            bump_generation(JOBS_COLLECTION)
+            logger.info(f"Removed {result.deleted_count} duplicate jobs")
+            return result.deleted_count
+            
+        except Exception as e:
+            logger.error(f"Error removing duplicate jobs: {e}")
+            raise e
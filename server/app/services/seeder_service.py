@@ -1,7 +1,10 @@
 from typing import List
 from datetime import datetime, timedelta
+from app.core.cache import bump_generation
+from app.core.database import JOBS_COLLECTION
 from app.services.job_service import JobService
 from app.models.job import JobCreate, JobData
+from bson import ObjectId
 import logging
 import random
 
@@ -99,7 +102,8 @@ class SeederService:
                     date_posted=f"{days_ago} days ago",
                     description=f"We are looking for a {seniority.lower()} {title.lower()} to join our dynamic team at {company}. This is an exciting opportunity to work on cutting-edge projects and grow your career.",
                     employment_type=employment_type,
-                    job_link=f"https://example.com/jobs/{i+1}",
+                    # Unique per job, so repeated seeding never collides on the fingerprint
+                    job_link=f"https://example.com/jobs/{ObjectId()}",
                     location=location,
                     salary=random.choice(salary_ranges),
                     scraped_at=created_date.strftime("%a, %d %b %Y %H:%M:%S GMT"),
@@ -131,6 +135,39 @@ class SeederService:
             logger.error(f"Error seeding sample jobs: {e}")
             raise e
     
+    @staticmethod
+    def build_n8n_job(job_data: dict) -> JobCreate:
+        """Convert one job in n8n scraper format, filling defaults for missing fields."""
+        if "data" not in job_data:
+            raise ValueError("Missing 'data' field")
+        n8n_job_data = job_data["data"]
+        
+        # Create JobData object
+        job_data_obj = JobData(
+            company=n8n_job_data.get("company", "Unknown Company"),
+            date_posted=n8n_job_data.get("date_posted", "Not specified"),
+            description=n8n_job_data.get("description", ""),
+            employment_type=n8n_job_data.get("employment_type", "Full-time"),
+            job_link=n8n_job_data.get("job_link", ""),
+            location=n8n_job_data.get("location", "Remote"),
+            salary=n8n_job_data.get("salary", "Not specified"),
+            scraped_at=n8n_job_data.get("scraped_at", ""),
+            seniority=n8n_job_data.get("seniority", "Mid"),
+            soft_skills=n8n_job_data.get("soft_skills", []),
+            tech_skills=n8n_job_data.get("tech_skills", []),
+            title=n8n_job_data.get("title", "Job Title"),
+            updated_at=n8n_job_data.get("updated_at", ""),
+            status=n8n_job_data.get("status", "New")
+        )
+        
+        # Create JobCreate object
+        return JobCreate(
+            data=job_data_obj,
+            message=job_data.get("message", "Job created successfully"),
+            scraped_at=job_data.get("scraped_at", ""),
+            success=job_data.get("success", True)
+        )
+    
     async def seed_n8n_format_jobs(self, jobs_data: List[dict]) -> List[str]:
         """Seed jobs from n8n scraper format."""
         try:
@@ -140,45 +177,15 @@ class SeederService:
             jobs_to_create = []
             for job_data in jobs_data:
                 try:
-                    # Extract the job data from n8n format
-                    if "data" in job_data:
-                        n8n_job_data = job_data["data"]
-                        
-                        # Create JobData object
-                        job_data_obj = JobData(
-                            company=n8n_job_data.get("company", "Unknown Company"),
-                            date_posted=n8n_job_data.get("date_posted", "Not specified"),
-                            description=n8n_job_data.get("description", ""),
-                            employment_type=n8n_job_data.get("employment_type", "Full-time"),
-                            job_link=n8n_job_data.get("job_link", ""),
-                            location=n8n_job_data.get("location", "Remote"),
-                            salary=n8n_job_data.get("salary", "Not specified"),
-                            scraped_at=n8n_job_data.get("scraped_at", ""),
-                            seniority=n8n_job_data.get("seniority", "Mid"),
-                            soft_skills=n8n_job_data.get("soft_skills", []),
-                            tech_skills=n8n_job_data.get("tech_skills", []),
-                            title=n8n_job_data.get("title", "Job Title"),
-                            updated_at=n8n_job_data.get("updated_at", ""),
-                            status=n8n_job_data.get("status", "New")
-                        )
-                        
-                        # Create JobCreate object
-                        job = JobCreate(
-                            data=job_data_obj,
-                            message=job_data.get("message", "Job created successfully"),
-                            scraped_at=job_data.get("scraped_at", ""),
-                            success=job_data.get("success", True)
-                        )
-                        
-                        jobs_to_create.append(job)
-                        
+                    jobs_to_create.append(self.build_n8n_job(job_data))
                 except Exception as e:
                     logger.warning(f"Failed to process job data: {e}")
                     continue
             
             if jobs_to_create:
-                # Bulk create jobs
-                job_ids = await self.job_service.bulk_create_jobs(jobs_to_create)
+                # Upsert by fingerprint, so seeding the same jobs again updates them
+                results = await self.job_service.import_jobs(jobs_to_create)
+                job_ids = [result["job_id"] for result in results if result["action"] != "failed"]
                 logger.info(f"Successfully seeded {len(job_ids)} jobs from n8n format")
                 return job_ids
             else:
@@ -197,6 +204,10 @@ class SeederService:
             # Get the collection and delete all documents
             collection = self.job_service.collection
             result = await collection.delete_many({})
+            await self.job_service.skills_cache.reset()
+            await self.job_service.daily_rollup.reset()
+            await self.job_service.filter_options.reset()
+            bump_generation(JOBS_COLLECTION)
             
             logger.info(f"Cleared {result.deleted_count} jobs from database")
             return True
@@ -0,0 +1,295 @@
+from typing import List, Dict, Optional, Iterable
+from collections import Counter, defaultdict
+from datetime import datetime
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import UpdateOne
+from app.core.database import get_collection, JOBS_COLLECTION, SKILLS_CACHE_COLLECTION
+from app.utils.mongo_keys import encode_key, decode_counts
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Skill arrays on a job document, keyed by the skill type stored in the cache
+SKILL_FIELDS = {"tech": "tech_skills", "soft": "soft_skills"}
+
+META_ID = "meta"
+
+class SkillsCacheService:
+    """
+    Incrementally maintained per-skill counters.
+
+    The skills_cache collection holds three kinds of documents:
+      - kind="skill":   one per (skill_type, skill) with job_count, a per-seniority
+                        counter map and the number of distinct companies
+      - kind="company": one per (skill_type, skill, company) with a job_count,
+                        used to keep company_count exact across deletes
+      - kind="meta":    written once a full rebuild has completed; until then the
+                        counters may be partial and readers fall back to the jobs
+                        collection
+    """
+
+    def __init__(self, db=None):
+        if db is not None:
+            self.collection: AsyncIOMotorCollection = db[SKILLS_CACHE_COLLECTION]
+            self.jobs_collection: AsyncIOMotorCollection = db[JOBS_COLLECTION]
+        else:
+            self.collection = get_collection(SKILLS_CACHE_COLLECTION)
+            self.jobs_collection = get_collection(JOBS_COLLECTION)
+
+    @staticmethod
+    def skill_id(skill_type: str, skill: str) -> str:
+        return f"skill:{skill_type}:{skill}"
+
+    @staticmethod
+    def company_id(skill_type: str, skill: str, company: str) -> str:
+        return f"company:{skill_type}:{skill}:{company}"
+
+    @staticmethod
+    def _job_skills(job: dict) -> Iterable[tuple]:
+        """Yield (skill_type, skill) pairs counted for a job document."""
+        data = job.get("data") or {}
+        for skill_type, field in SKILL_FIELDS.items():
+            skills = {s for s in data.get(field) or [] if isinstance(s, str) and s.strip()}
+            for skill in skills:
+                yield skill_type, skill
+
+    async def apply_job_changes(self, removed: List[dict], added: List[dict]) -> None:
+        """Apply the counter deltas for jobs removed from and added to the corpus."""
+        try:
+            job_deltas = Counter()
+            seniority_deltas: Dict[tuple, Counter] = defaultdict(Counter)
+            company_deltas = Counter()
+
+            for sign, jobs in ((-1, removed), (1, added)):
+                for job in jobs:
+                    data = job.get("data") or {}
+                    seniority = data.get("seniority")
+                    company = data.get("company")
+                    for key in self._job_skills(job):
+                        job_deltas[key] += sign
+                        if seniority:
+                            seniority_deltas[key][seniority] += sign
+                        if company:
+                            company_deltas[key + (company,)] += sign
+
+            now = datetime.utcnow()
+            operations = []
+            touched_ids = []
+            touched_skills = set()
+
+            for key in set(job_deltas) | set(seniority_deltas):
+                skill_type, skill = key
+                inc = {f"seniority.{encode_key(level)}": delta
+                       for level, delta in seniority_deltas[key].items() if delta}
+                if job_deltas[key]:
+                    inc["job_count"] = job_deltas[key]
+                if not inc:
+                    continue
+                touched_ids.append(self.skill_id(skill_type, skill))
+                operations.append(UpdateOne(
+                    {"_id": self.skill_id(skill_type, skill)},
+                    {
+                        "$inc": inc,
+                        "$set": {"kind": "skill", "skill_type": skill_type, "skill": skill, "updated_at": now}
+                    },
+                    upsert=True
+                ))
+
+            for (skill_type, skill, company), delta in company_deltas.items():
+                if not delta:
+                    continue
+                touched_skills.add((skill_type, skill))
+                touched_ids.append(self.company_id(skill_type, skill, company))
+                operations.append(UpdateOne(
+                    {"_id": self.company_id(skill_type, skill, company)},
+                    {
+                        "$inc": {"job_count": delta},
+                        "$set": {
+                            "kind": "company",
+                            "skill_id": self.skill_id(skill_type, skill),
+                            "company": company,
+                            "updated_at": now
+                        }
+                    },
+                    upsert=True
+                ))
+
+            if not operations:
+                return
+
+            await self.collection.bulk_write(operations, ordered=False)
+
+            # Drop emptied counters, then refresh the distinct-company counts of
+            # the skills whose company membership may have changed
+            await self.collection.delete_many({"_id": {"$in": touched_ids}, "job_count": {"$lte": 0}})
+            if touched_skills:
+                await self._refresh_company_counts([self.skill_id(*key) for key in touched_skills])
+
+        except Exception as e:
+            logger.error(f"Error applying skills cache changes: {e}")
+            raise e
+
+    async def _refresh_company_counts(self, skill_ids: List[str]) -> None:
+        """Recompute company_count for the given skill documents."""
+        pipeline = [
+            {"$match": {"kind": "company", "skill_id": {"$in": skill_ids}}},
+            {"$group": {"_id": "$skill_id", "company_count": {"$sum": 1}}}
+        ]
+        counts = {doc["_id"]: doc["company_count"]
+                  for doc in await self.collection.aggregate(pipeline).to_list(None)}
+
+        operations = [
+            UpdateOne({"_id": skill_id, "kind": "skill"}, {"$set": {"company_count": counts.get(skill_id, 0)}})
+            for skill_id in skill_ids
+        ]
+        await self.collection.bulk_write(operations, ordered=False)
+
+    async def is_ready(self) -> bool:
+        """Whether the counters cover the whole corpus."""
+        return await self.collection.find_one({"_id": META_ID}, {"_id": 1}) is not None
+
+    async def get_top_skills(self, skill_type: str = "tech", limit: int = 10) -> Optional[List[Dict]]:
+        """
+        Read the top skills by job count from the counters.
+
+        Returns None when the cache has not been built yet so callers can fall
+        back to aggregating the jobs collection.
+        """
+        try:
+            if not await self.is_ready():
+                return None
+
+            cursor = self.collection.find(
+                {"kind": "skill", "skill_type": skill_type},
+                {"skill": 1, "job_count": 1, "company_count": 1, "seniority": 1}
+            ).sort("job_count", -1).limit(limit)
+
+            skills = []
+            async for doc in cursor:
+                skills.append({
+                    "skill": doc["skill"],
+                    "job_count": doc["job_count"],
+                    "company_count": doc.get("company_count", 0),
+                    "seniority_counts": decode_counts(doc.get("seniority"))
+                })
+            return skills
+
+        except Exception as e:
+            logger.error(f"Error reading top skills from cache: {e}")
+            return None
+
+    @staticmethod
+    def build_top_skills_pipeline(skill_type: str, limit: int, match_filter: Optional[dict] = None) -> list:
+        """
+        Build a top-k skills pipeline whose per-skill state stays constant in size.
+
+        Jobs are counted per (skill, company, seniority) first; the (skill,
+        company) regroup yields the distinct-company count and the final
+        per-skill group only carries one counter per seniority level.
+        """
+        return [
+            {"$match": match_filter or {}},
+            {"$project": {
+                "skill": f"$data.{SKILL_FIELDS[skill_type]}",
+                "company": "$data.company",
+                "seniority": "$data.seniority"
+            }},
+            {"$unwind": "$skill"},
+            {"$match": {"skill": {"$type": "string", "$ne": ""}}},
+            {"$group": {
+                "_id": {"skill": "$skill", "company": "$company", "seniority": "$seniority"},
+                "job_count": {"$sum": 1}
+            }},
+            # One document per (skill, company), with its few seniority counters
+            {"$group": {
+                "_id": {"skill": "$_id.skill", "company": "$_id.company"},
+                "seniorities": {"$push": {"level": "$_id.seniority", "job_count": "$job_count"}}
+            }},
+            {"$unwind": {"path": "$seniorities", "includeArrayIndex": "position"}},
+            {"$group": {
+                "_id": {"skill": "$_id.skill", "level": "$seniorities.level"},
+                "job_count": {"$sum": "$seniorities.job_count"},
+                # Count each (skill, company) document once, on its first counter,
+                # skipping jobs without a company like the maintained counters do
+                "company_count": {"$sum": {"$cond": [
+                    {"$and": [{"$eq": ["$position", 0]}, {"$gt": ["$_id.company", None]}, {"$ne": ["$_id.company", ""]}]},
+                    1,
+                    0
+                ]}}
+            }},
+            {"$group": {
+                "_id": "$_id.skill",
+                "job_count": {"$sum": "$job_count"},
+                "company_count": {"$sum": "$company_count"},
+                "seniorities": {"$push": {"level": "$_id.level", "job_count": "$job_count"}}
+            }},
+            {"$sort": {"job_count": -1, "_id": 1}},
+            {"$limit": limit}
+        ]
+
+    async def aggregate_top_skills(
+        self,
+        skill_type: str = "tech",
+        limit: int = 10,
+        match_filter: Optional[dict] = None
+    ) -> List[Dict]:
+        """Aggregate the top skills from the jobs collection in the same shape as get_top_skills."""
+        try:
+            pipeline = self.build_top_skills_pipeline(skill_type, limit, match_filter)
+            cursor = self.jobs_collection.aggregate(pipeline, allowDiskUse=True)
+
+            skills = []
+            async for doc in cursor:
+                skills.append({
+                    "skill": doc["_id"],
+                    "job_count": doc["job_count"],
+                    "company_count": doc["company_count"],
+                    "seniority_counts": {
+                        item["level"]: item["job_count"]
+                        for item in doc["seniorities"] if item.get("level")
+                    }
+                })
+            return skills
+
+        except Exception as e:
+            logger.error(f"Error aggregating top skills: {e}")
+            raise e
+
+    async def rebuild(self, batch_size: int = 1000) -> int:
+        """Rebuild every counter from the jobs collection. Returns the number of jobs counted."""
+        try:
+            logger.info("Rebuilding skills cache...")
+            await self.collection.delete_many({})
+
+            projection = {"data.tech_skills": 1, "data.soft_skills": 1, "data.seniority": 1, "data.company": 1}
+            batch = []
+            total = 0
+            async for job in self.jobs_collection.find({}, projection):
+                batch.append(job)
+                if len(batch) >= batch_size:
+                    await self.apply_job_changes([], batch)
+                    total += len(batch)
+                    batch = []
+            if batch:
+                await self.apply_job_changes([], batch)
+                total += len(batch)
+
+            await self.mark_ready()
+            logger.info(f"Skills cache rebuilt from {total} jobs")
+            return total
+
+        except Exception as e:
+            logger.error(f"Error rebuilding skills cache: {e}")
+            raise e
+
+    async def reset(self) -> None:
+        """Clear all counters for an empty jobs collection."""
+        await self.collection.delete_many({})
+        await self.mark_ready()
+
+    async def mark_ready(self) -> None:
+        await self.collection.update_one(
+            {"_id": META_ID},
+            {"$set": {"kind": "meta", "built_at": datetime.utcnow()}},
+            upsert=True
+        )
@@ -0,0 +1,402 @@
+import copy
+import re
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+from pymongo import DeleteOne, InsertOne, UpdateOne
+
+# A job as the scraper posts it
+SCRAPED_JOB = {
+    "data": {
+        "company": "Gamma",
+        "date_posted": "Not specified",
+        "description": "Full-stack role",
+        "employment_type": "Full-time",
+        "job_link": "https://gamma.app/docs/full-stack-developer",
+        "location": "Remote",
+        "salary": "$2,500+",
+        "scraped_at": "Sun, 17 Aug 2025 00:02:43 GMT",
+        "seniority": "Mid",
+        "soft_skills": ["communication"],
+        "tech_skills": ["React.js", "NodeJS"],
+        "title": "Full Stack Developer",
+        "updated_at": "Sun, 17 Aug 2025 00:02:43 GMT"
+    },
+    "message": "Job scraped",
+    "scraped_at": "2025-08-17T00:02:43.608904",
+    "success": True
+}
+
+# Sentinel for a path that is absent from a document
+MISSING = object()
+
+def get_path(document, path):
+    value = document
+    for part in path.split("."):
+        if isinstance(value, dict) and part in value:
+            value = value[part]
+        else:
+            return MISSING
+    return value
+
+def set_path(document, path, value):
+    *parents, last = path.split(".")
+    for part in parents:
+        document = document.setdefault(part, {})
+    document[last] = value
+
+def unset_path(document, path):
+    *parents, last = path.split(".")
+    for part in parents:
+        document = document.get(part)
+        if not isinstance(document, dict):
+            return
+    document.pop(last, None)
+
+def sort_key(value):
+    """Order values like BSON: missing and null first, then numbers, strings and dates."""
+    if value is MISSING or value is None:
+        return (0, 0)
+    if isinstance(value, (int, float)):
+        return (1, value)
+    if isinstance(value, str):
+        return (2, value)
+    if isinstance(value, datetime):
+        return (3, value)
+    return (4, str(value))
+
+def compare(left, right):
+    left, right = sort_key(left), sort_key(right)
+    return (left > right) - (left < right)
+
+def matches_condition(value, condition):
+    if isinstance(condition, dict) and condition and all(key.startswith("$") for key in condition):
+        return all(matches_operator(value, operator, operand) for operator, operand in condition.items())
+    if isinstance(value, list) and not isinstance(condition, list):
+        return condition in value
+    return value == condition or (value is MISSING and condition is None)
+
+def matches_operator(value, operator, operand):
+    if operator == "$exists":
+        return (value is not MISSING) == bool(operand)
+    if operator == "$ne":
+        return not matches_condition(value, operand)
+    if operator == "$nin":
+        return not matches_operator(value, "$in", operand)
+    candidates = value if isinstance(value, list) else [value]
+    if operator == "$in":
+        return any(candidate in operand for candidate in candidates)
+    if operator == "$regex":
+        return any(isinstance(candidate, str) and re.search(operand, candidate) for candidate in candidates)
+    if operator == "$type":
+        return any(isinstance(candidate, str) for candidate in candidates) if operand == "string" else False
+    checks = {
+        "$gt": lambda order: order > 0,
+        "$gte": lambda order: order >= 0,
+        "$lt": lambda order: order < 0,
+        "$lte": lambda order: order <= 0
+    }
+    # Range operators only compare values of the same type, as MongoDB does
+    return any(
+        candidate is not MISSING and sort_key(candidate)[0] == sort_key(operand)[0]
+        and checks[operator](compare(candidate, operand))
+        for candidate in candidates
+    )
+
+def matches(document, query):
+    for key, condition in query.items():
+        if key == "$or":
+            if not any(matches(document, clause) for clause in condition):
+                return False
+        elif key == "$and":
+            if not all(matches(document, clause) for clause in condition):
+                return False
+        elif not matches_condition(get_path(document, key), condition):
+            return False
+    return True
+
+def project(document, projection):
+    if not projection:
+        return copy.deepcopy(document)
+    included = {field for field, flag in projection.items() if flag and field != "_id"}
+    if included:
+        result = {"_id": document["_id"]} if projection.get("_id", 1) and "_id" in document else {}
+        for field in included:
+            value = get_path(document, field)
+            if value is not MISSING:
+                set_path(result, field, copy.deepcopy(value))
+        return result
+    result = copy.deepcopy(document)
+    for field in projection:
+        unset_path(result, field)
+    return result
+
+def evaluate(expression, document):
+    """Evaluate the aggregation expressions the services use."""
+    if isinstance(expression, str) and expression.startswith("$"):
+        value = get_path(document, expression[1:])
+        return None if value is MISSING else value
+    if isinstance(expression, list):
+        return [evaluate(item, document) for item in expression]
+    if not isinstance(expression, dict):
+        return expression
+    if len(expression) == 1 and next(iter(expression)).startswith("$"):
+        operator, operands = next(iter(expression.items()))
+        if operator == "$cond":
+            condition, then, otherwise = operands if isinstance(operands, list) else (
+                operands["if"], operands["then"], operands["else"])
+            return evaluate(then if evaluate(condition, document) else otherwise, document)
+        values = evaluate(operands, document)
+        if operator == "$and":
+            return all(values)
+        if operator == "$or":
+            return any(values)
+        comparisons = {
+            "$eq": lambda order: order == 0,
+            "$ne": lambda order: order != 0,
+            "$gt": lambda order: order > 0,
+            "$gte": lambda order: order >= 0,
+            "$lt": lambda order: order < 0,
+            "$lte": lambda order: order <= 0
+        }
+        return comparisons[operator](compare(*values))
+    return {key: evaluate(value, document) for key, value in expression.items()}
+
+def freeze(value):
+    if isinstance(value, dict):
+        return tuple((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+def sort_documents(documents, specification):
+    documents = list(documents)
+    for field, direction in reversed(list(specification.items())):
+        documents.sort(key=lambda document: sort_key(get_path(document, field)), reverse=direction < 0)
+    return documents
+
+def group(documents, specification):
+    groups = {}
+    for document in documents:
+        key = evaluate(specification["_id"], document)
+        state = groups.setdefault(freeze(key), {"_id": key})
+        for field, accumulator in specification.items():
+            if field == "_id":
+                continue
+            operator, operand = next(iter(accumulator.items()))
+            value = evaluate(operand, document)
+            if operator == "$sum":
+                state[field] = state.get(field, 0) + (value if isinstance(value, (int, float)) else 0)
+            elif operator == "$push":
+                state.setdefault(field, []).append(value)
+            elif operator == "$addToSet":
+                values = state.setdefault(field, [])
+                if value not in values:
+                    values.append(value)
+            elif operator in ("$min", "$max"):
+                current = state.get(field)
+                if value is not None and (current is None or (compare(value, current) < 0) == (operator == "$min")):
+                    state[field] = value
+                else:
+                    state.setdefault(field, current)
+            elif operator == "$avg":
+                totals = state.setdefault(f"__{field}", [0, 0])
+                if isinstance(value, (int, float)):
+                    totals[0] += value
+                    totals[1] += 1
+                state[field] = totals[0] / totals[1] if totals[1] else None
+    return [{key: value for key, value in state.items() if not key.startswith("__")} for state in groups.values()]
+
+def unwind(documents, specification):
+    if isinstance(specification, str):
+        specification = {"path": specification}
+    path = specification["path"][1:]
+    index_field = specification.get("includeArrayIndex")
+    result = []
+    for document in documents:
+        values = get_path(document, path)
+        if not isinstance(values, list):
+            values = [] if values in (MISSING, None) else [values]
+        for position, value in enumerate(values):
+            unwound = copy.deepcopy(document)
+            set_path(unwound, path, value)
+            if index_field:
+                unwound[index_field] = position
+            result.append(unwound)
+    return result
+
+def project_stage(document, specification):
+    result = {"_id": document["_id"]} if "_id" in document and specification.get("_id", 1) else {}
+    for field, value in specification.items():
+        if field == "_id":
+            continue
+        if isinstance(value, (bool, int)):
+            value = get_path(document, field) if value else MISSING
+        else:
+            value = evaluate(value, document)
+        if value is not MISSING:
+            set_path(result, field, copy.deepcopy(value))
+    return result
+
+def run_pipeline(documents, pipeline):
+    documents = [copy.deepcopy(document) for document in documents]
+    for stage in pipeline:
+        name, specification = next(iter(stage.items()))
+        if name == "$match":
+            documents = [document for document in documents if matches(document, specification)]
+        elif name == "$project":
+            documents = [project_stage(document, specification) for document in documents]
+        elif name == "$unwind":
+            documents = unwind(documents, specification)
+        elif name == "$group":
+            documents = group(documents, specification)
+        elif name == "$sort":
+            documents = sort_documents(documents, specification)
+        elif name == "$skip":
+            documents = documents[specification:]
+        elif name == "$limit":
+            documents = documents[:specification]
+        elif name == "$facet":
+            documents = [{field: run_pipeline(documents, stages) for field, stages in specification.items()}]
+        else:
+            raise NotImplementedError(name)
+    return documents
+
+class Result:
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+class FakeCursor:
+    """An in-memory cursor supporting the chaining and iteration the services use."""
+
+    def __init__(self, documents):
+        self.documents = documents
+
+    def sort(self, key, direction=None):
+        specification = dict(key) if isinstance(key, list) else {key: direction or 1}
+        self.documents = sort_documents(self.documents, specification)
+        return self
+
+    def skip(self, count):
+        self.documents = self.documents[count:]
+        return self
+
+    def limit(self, count):
+        if count:
+            self.documents = self.documents[:count]
+        return self
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for document in self.documents:
+            yield document
+
+    async def to_list(self, length=None):
+        return self.documents[:length] if length else list(self.documents)
+
+class FakeCollection:
+    """
+    An in-memory stand-in for the Motor collection methods the services call.
+
+    Queries support equality, $in, $nin, $ne, $exists, $regex, $type "string" and the
+    range operators on dotted paths; aggregations support the stages and
+    expressions used by the maintained counters and their baselines.
+    """
+
+    def __init__(self):
+        self.documents = []
+        self.find_calls = []
+
+    def _find(self, query):
+        return [document for document in self.documents if matches(document, query or {})]
+
+    def find(self, query=None, projection=None, **kwargs):
+        self.find_calls.append((query, projection))
+        return FakeCursor([project(document, projection) for document in self._find(query)])
+
+    async def find_one(self, query=None, projection=None):
+        found = self._find(query)
+        return project(found[0], projection) if found else None
+
+    async def count_documents(self, query):
+        return len(self._find(query))
+
+    async def insert_one(self, document):
+        document.setdefault("_id", ObjectId())
+        self.documents.append(copy.deepcopy(document))
+        return Result(inserted_id=document["_id"])
+
+    async def insert_many(self, documents, ordered=True):
+        return Result(inserted_ids=[(await self.insert_one(document)).inserted_id for document in documents])
+
+    def _apply_update(self, document, update, inserting):
+        for path, value in update.get("$set", {}).items():
+            set_path(document, path, copy.deepcopy(value))
+        if inserting:
+            for path, value in update.get("$setOnInsert", {}).items():
+                set_path(document, path, copy.deepcopy(value))
+        for path, delta in update.get("$inc", {}).items():
+            current = get_path(document, path)
+            set_path(document, path, (0 if current is MISSING else current) + delta)
+        for path in update.get("$unset", {}):
+            unset_path(document, path)
+
+    async def update_one(self, query, update, upsert=False):
+        found = self._find(query)
+        if found:
+            self._apply_update(found[0], update, inserting=False)
+            return Result(matched_count=1, upserted_id=None)
+        if not upsert:
+            return Result(matched_count=0, upserted_id=None)
+        document = {key: value for key, value in query.items() if not isinstance(value, dict) and not key.startswith("$")}
+        document.setdefault("_id", ObjectId())
+        self._apply_update(document, update, inserting=True)
+        self.documents.append(document)
+        return Result(matched_count=0, upserted_id=document["_id"])
+
+    async def delete_one(self, query):
+        found = self._find(query)[:1]
+        self.documents = [document for document in self.documents if not any(document is item for item in found)]
+        return Result(deleted_count=len(found))
+
+    async def delete_many(self, query):
+        found = self._find(query)
+        self.documents = [document for document in self.documents if not matches(document, query)]
+        return Result(deleted_count=len(found))
+
+    async def bulk_write(self, operations, ordered=True):
+        for operation in operations:
+            if isinstance(operation, UpdateOne):
+                await self.update_one(operation._filter, operation._doc, upsert=bool(operation._upsert))
+            elif isinstance(operation, InsertOne):
+                await self.insert_one(operation._doc)
+            elif isinstance(operation, DeleteOne):
+                await self.delete_one(operation._filter)
+            else:
+                raise NotImplementedError(type(operation).__name__)
+        return Result()
+
+    def aggregate(self, pipeline, **kwargs):
+        return FakeCursor(run_pipeline(self.documents, pipeline))
+
+class FakeDatabase:
+    """Collections created on first access, like a Motor database."""
+
+    def __init__(self):
+        self.collections = {}
+
+    def __getitem__(self, name):
+        return self.collections.setdefault(name, FakeCollection())
+
+@pytest.fixture
+def scraped_job():
+    """A fresh copy of SCRAPED_JOB that a test may modify."""
+    return copy.deepcopy(SCRAPED_JOB)
+
+@pytest.fixture
+def fake_db():
+    """An empty in-memory database for services that accept a db argument."""
+    return FakeDatabase()
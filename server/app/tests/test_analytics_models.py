@@ -0,0 +1,12 @@
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from bson import ObjectId
+
+from app.models.analytics import PyObjectId
+
+def test_object_id_validated_with_validation_info():
+    """Test stored snapshot ids validate when pydantic passes validation info"""
+    object_id = ObjectId()
+    assert PyObjectId.validate(str(object_id), None) == object_id
@@ -0,0 +1,43 @@
+import asyncio
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.services.analytics_service import AnalyticsService
+
+def test_concurrent_refreshes_share_one_computation():
+    """Test concurrent generate_full_analytics calls run a single recomputation"""
+    service = AnalyticsService.__new__(AnalyticsService)
+    runs = []
+
+    async def compute():
+        runs.append(1)
+        await asyncio.sleep(0.01)
+        return len(runs)
+
+    service._compute_full_analytics = compute
+
+    async def refresh_storm():
+        first = await asyncio.gather(*[service.generate_full_analytics() for _ in range(10)])
+        second = await service.generate_full_analytics()
+        return first, second
+
+    first, second = asyncio.run(refresh_storm())
+    assert first == [1] * 10
+    assert second == 2
+
+def test_stale_snapshot_revalidated():
+    """Test only snapshots older than the max age start a background refresh"""
+    from datetime import datetime, timedelta
+    from types import SimpleNamespace
+    from app.core.config import settings
+
+    service = AnalyticsService.__new__(AnalyticsService)
+    refreshes = []
+    service.revalidate_analytics = lambda: refreshes.append(1)
+
+    fresh = SimpleNamespace(calculated_at=datetime.utcnow())
+    stale = SimpleNamespace(calculated_at=datetime.utcnow() - timedelta(seconds=settings.ANALYTICS_MAX_AGE_SECONDS + 1))
+    assert service.revalidate_if_stale(fresh) is False
+    assert service.revalidate_if_stale(stale) is True
+    assert refreshes == [1]
@@ -0,0 +1,69 @@
+import asyncio
+import time
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.core.cache import ResponseCache, cached_response, bump_generation, response_cache, request_coalescer
+
+def test_lru_eviction():
+    """Test least recently used entries are evicted first"""
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", (0,), 1)
+    cache.set("b", (0,), 2)
+    cache.get("a", (0,))
+    cache.set("c", (0,), 3)
+    assert cache.get("a", (0,)) == (True, 1)
+    assert cache.get("b", (0,)) == (False, None)
+
+def test_generation_mismatch_is_a_miss():
+    """Test entries go stale when the generation changes"""
+    cache = ResponseCache()
+    cache.set("a", (1,), "value")
+    assert cache.get("a", (2,)) == (False, None)
+
+def test_entries_expire_after_ttl():
+    """Test entries are recomputed once their TTL has passed even without writes"""
+    cache = ResponseCache(ttl_seconds=0.01)
+    cache.set("a", (0,), "value")
+    assert cache.get("a", (0,)) == (True, "value")
+    time.sleep(0.02)
+    assert cache.get("a", (0,)) == (False, None)
+
+def test_cached_response_invalidated_by_write():
+    """Test decorated endpoints recompute only after a generation bump"""
+    calls = []
+
+    @cached_response("test.route", params=("limit",), collections=("test_collection",))
+    async def endpoint(limit: int = 8, service=None):
+        calls.append(limit)
+        return {"limit": limit}
+
+    response_cache.clear()
+    asyncio.run(endpoint(limit=5, service=object()))
+    asyncio.run(endpoint(limit=5, service=object()))
+    assert calls == [5]
+
+    bump_generation("test_collection")
+    asyncio.run(endpoint(limit=5, service=object()))
+    assert calls == [5, 5]
+
+def test_concurrent_misses_coalesced():
+    """Test identical concurrent requests share one execution and are counted"""
+    calls = []
+
+    @cached_response("test.coalesced", params=("limit",), collections=("test_collection",), coalesce=True)
+    async def endpoint(limit: int = 8):
+        calls.append(limit)
+        await asyncio.sleep(0.01)
+        return {"limit": limit}
+
+    async def burst():
+        return await asyncio.gather(*[endpoint(limit=limit) for limit in [8, 8, 8, 3]])
+
+    response_cache.clear()
+    results = asyncio.run(burst())
+    assert [result["limit"] for result in results] == [8, 8, 8, 3]
+    assert sorted(calls) == [3, 8]
+    assert request_coalescer.stats()["routes"]["test.coalesced"] == {"executed": 2, "coalesced": 2}
+    assert request_coalescer.stats()["in_flight"] == 0
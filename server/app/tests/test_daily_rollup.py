@@ -0,0 +1,89 @@
+import asyncio
+import copy
+import sys
+import os
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.controllers.dashboard_controller import get_hiring_trends
+from app.core.database import JOBS_COLLECTION
+from app.services.analytics_service import AnalyticsService
+from app.services.daily_rollup_service import DailyRollupService, day_start
+
+def _job(days_ago, location, seniority, skills, status="NEW", salary=None):
+    job = {
+        "created_at": datetime.utcnow() - timedelta(days=days_ago),
+        "status": status,
+        "data": {"location": location, "seniority": seniority, "tech_skills": skills}
+    }
+    if salary:
+        job["salary_min"], job["salary_max"] = salary
+    return job
+
+def _day(service, job):
+    day_id = service.day_id(day_start(job["created_at"]))
+    return asyncio.run(service.collection.find_one({"_id": day_id}))
+
+def test_deltas_update_day_counters(fake_db):
+    """Test create, delete and status-change deltas on the day a job was created"""
+    service = DailyRollupService(fake_db)
+    first = _job(2, "Remote", "Mid", ["Python"], salary=(60000, 80000))
+    second = _job(2, "Berlin", "Senior", ["Python", "Go"])
+
+    asyncio.run(service.apply_job_changes([], [first, second]))
+    day = _day(service, first)
+    assert day["job_count"] == 2
+    assert day["locations"] == {"Remote": 1, "Berlin": 1}
+    assert day["skills"] == {"Python": 2, "Go": 1}
+    assert day["statuses"] == {"NEW": 2}
+    assert (day["salary_count"], day["salary_min_total"], day["salary_max_total"]) == (1, 60000, 80000)
+
+    analyzed = {**copy.deepcopy(first), "status": "ANALYZED"}
+    asyncio.run(service.apply_job_changes([first], [analyzed]))
+    day = _day(service, first)
+    assert day["job_count"] == 2
+    assert day["statuses"] == {"NEW": 1, "ANALYZED": 1}
+    assert day["salary_count"] == 1
+
+    asyncio.run(service.apply_job_changes([analyzed], []))
+    day = _day(service, first)
+    assert day["job_count"] == 1
+    assert day["salary_count"] == 0
+    assert service._format_day(day["date"], day)["locations"] == {"Berlin": 1}
+
+def test_readers_match_jobs_aggregation(fake_db):
+    """Test trends and weekly trends read the same numbers from the rollup as from the jobs"""
+    service = DailyRollupService(fake_db)
+    jobs = [
+        _job(0, "Remote", "Mid", ["Python"], salary=(60000, 80000)),
+        _job(3, "Berlin", "Senior", ["Python", "Go"]),
+        _job(3, "Remote", "Junior", ["React"], salary=(40000, 50000)),
+        _job(12, "Remote", "Mid", ["Go"]),
+        _job(45, "Paris", "Senior", ["Python"])
+    ]
+    asyncio.run(service.apply_job_changes([], jobs))
+    # A status change and a deletion applied as deltas
+    analyzed = {**copy.deepcopy(jobs[1]), "status": "ANALYZED"}
+    asyncio.run(service.apply_job_changes([jobs[1], jobs[3]], [analyzed]))
+    stored = [jobs[0], analyzed, jobs[2], jobs[4]]
+    asyncio.run(fake_db[JOBS_COLLECTION].insert_many(copy.deepcopy(stored)))
+
+    analytics = AnalyticsService.__new__(AnalyticsService)
+    analytics.daily_rollup = service
+
+    def read():
+        return (
+            asyncio.run(get_hiring_trends.__wrapped__(days=30, daily_rollup=service)),
+            asyncio.run(analytics.calculate_weekly_trends(weeks=4))
+        )
+
+    baseline = read()
+    asyncio.run(service.mark_ready())
+    assert asyncio.run(service.is_ready())
+    assert read() == baseline
+
+    trends, weekly = baseline
+    assert sum(day["job_count"] for day in trends["daily_jobs"]) == 3
+    assert trends["location_trends"][0] == {"_id": "Remote", "job_count": 2}
+    assert weekly[0]["new_jobs"] == 3
+    assert weekly[0]["active_jobs"] == 4
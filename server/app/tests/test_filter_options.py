@@ -0,0 +1,64 @@
+import asyncio
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.controllers import job_controller
+from app.core.config import settings
+from app.services.filter_options_service import FilterOptionsService
+from app.services.job_service import JobService
+
+OPTIONS_URL = f"{settings.API_V1_STR}/jobs/filters/options"
+
+def _job(company, location, skills):
+    return {"data": {
+        "company": company,
+        "location": location,
+        "seniority": "Mid",
+        "employment_type": "Full-time",
+        "tech_skills": skills,
+        "soft_skills": []
+    }}
+
+def _client(fake_db):
+    app = FastAPI()
+    app.include_router(job_controller.router, prefix=settings.API_V1_STR)
+    app.dependency_overrides[job_controller.get_filter_options_service] = lambda: FilterOptionsService(fake_db)
+    return TestClient(app)
+
+def test_delete_removes_option_at_zero(fake_db):
+    """Test an option disappears once the last job listing it is deleted"""
+    service = FilterOptionsService(fake_db)
+    first = _job("Acme", "Remote", ["Python", "Go"])
+    second = _job("Globex", "Remote", ["Python"])
+    asyncio.run(service.mark_ready(0))
+    asyncio.run(service.apply_job_changes([], [first, second]))
+
+    asyncio.run(service.apply_job_changes([first], []))
+    options = asyncio.run(service.get_options())
+    assert options["companies"] == ["Globex"]
+    assert options["tech_skills"] == ["Python"]
+    assert options["counts"]["locations"] == {"Remote": 1}
+    assert asyncio.run(service.collection.find_one({"_id": service.value_id("companies", "Acme")})) is None
+
+def test_writes_change_version_and_etag(fake_db):
+    """Test a job write bumps the dictionary version and the endpoint's ETag"""
+    jobs = JobService(fake_db)
+    asyncio.run(jobs.filter_options.mark_ready(0))
+    client = _client(fake_db)
+    job = _job("Acme", "Remote", ["Python"])
+
+    asyncio.run(jobs._on_jobs_changed([], [job]))
+    response = client.get(OPTIONS_URL)
+    etag = response.headers["etag"]
+    assert response.json()["version"] == 1
+    assert client.get(OPTIONS_URL, headers={"If-None-Match": etag}).status_code == 304
+
+    asyncio.run(jobs._on_jobs_changed([job], []))
+    response = client.get(OPTIONS_URL, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["version"] == 2
+    assert response.json()["companies"] == []
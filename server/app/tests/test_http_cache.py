@@ -0,0 +1,65 @@
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.core.cache import bump_generation
+from app.core.config import settings
+from app.core.database import JOBS_COLLECTION
+from app.core.http_cache import ConditionalGetMiddleware
+
+calls = []
+
+app = FastAPI()
+app.add_middleware(ConditionalGetMiddleware)
+
+@app.get(f"{settings.API_V1_STR}/jobs/")
+async def list_jobs():
+    calls.append(1)
+    return {"jobs": []}
+
+client = TestClient(app)
+
+def test_unchanged_request_is_not_modified():
+    """Test a matching If-None-Match gets a 304 without running the endpoint"""
+    response = client.get(f"{settings.API_V1_STR}/jobs/")
+    etag = response.headers["etag"]
+    calls.clear()
+
+    response = client.get(f"{settings.API_V1_STR}/jobs/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert calls == []
+
+def test_write_changes_etag():
+    """Test a collection write invalidates the previous ETag"""
+    etag = client.get(f"{settings.API_V1_STR}/jobs/").headers["etag"]
+    bump_generation(JOBS_COLLECTION)
+
+    response = client.get(f"{settings.API_V1_STR}/jobs/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+def test_if_modified_since_alone_is_not_validated():
+    """Test requests without an ETag are always answered in full"""
+    calls.clear()
+    response = client.get(
+        f"{settings.API_V1_STR}/jobs/",
+        headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"}
+    )
+    assert response.status_code == 200
+    assert "last-modified" not in response.headers
+    assert calls == [1]
+
+def test_not_modified_carries_cors_headers():
+    """Test the app's 304s pass through the CORS middleware"""
+    from main import app as main_app
+    from app.core.http_cache import collection_etag
+
+    origin = settings.BACKEND_CORS_ORIGINS[0]
+    response = TestClient(main_app).get(
+        f"{settings.API_V1_STR}/jobs/",
+        headers={"If-None-Match": collection_etag((JOBS_COLLECTION,)), "Origin": origin}
+    )
+    assert response.status_code == 304
+    assert response.headers["access-control-allow-origin"] == origin
@@ -0,0 +1,64 @@
+import asyncio
+import json
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.services.import_service import prepare_scraped_job_lines
+
+def test_prepare_scraped_job_lines(scraped_job):
+    """Test valid lines become normalized documents and invalid lines report errors"""
+    unsuccessful = {**scraped_job, "success": False}
+    lines = [
+        (1, json.dumps(scraped_job).encode()),
+        (2, b"{not json"),
+        (3, json.dumps(unsuccessful).encode()),
+        (4, None)
+    ]
+    results = prepare_scraped_job_lines(lines)
+
+    line_number, document, error = results[0]
+    assert (line_number, error) == (1, None)
+    assert document["data"]["tech_skills"] == ["React", "Node.js"]
+    assert document["salary_min"] == 30000
+    assert document["fingerprint"]
+
+    assert [line_number for line_number, _, _ in results] == [1, 2, 3, 4]
+    assert all(document is None and error.startswith(f"Line {line_number}:") for line_number, document, error in results[1:])
+
+def test_import_interrupted_by_shutdown_marked_failed(monkeypatch):
+    """Test an import still running when the workers stop is marked failed"""
+    from bson import ObjectId
+    from app.services import import_service
+
+    updates = []
+
+    class FakeImports:
+        async def update_many(self, query, update):
+            updates.append((query, update))
+
+    async def run_import(self, import_id, source, items):
+        started.set()
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(import_service.ImportService, "__init__", lambda self, db=None: None)
+    monkeypatch.setattr(import_service.ImportService, "run_import", run_import)
+    monkeypatch.setattr(import_service, "get_collection", lambda name: FakeImports())
+
+    async def shutdown_mid_import():
+        import_service.start_import_workers(workers=1, queue_size=1)
+        import_id = ObjectId()
+        import_service._pending_ids.add(import_id)
+        import_service._queue.put_nowait((import_id, "scraped_jobs", []))
+        await started.wait()
+        await import_service.stop_import_workers()
+        return import_id
+
+    started = asyncio.Event()
+    import_id = asyncio.run(shutdown_mid_import())
+
+    assert len(updates) == 1
+    query, update = updates[0]
+    assert query == {"_id": {"$in": [import_id]}}
+    assert update["$set"]["status"] == "failed"
+    assert not import_service._pending_ids
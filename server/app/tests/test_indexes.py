@@ -0,0 +1,19 @@
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from app.core.database import INDEX_SPECS, missing_indexes
+
+def test_missing_indexes_by_name():
+    """Test only declared indexes absent from the collection are returned"""
+    declared = [IndexModel([("created_at", DESCENDING)]), IndexModel([("salary_min", ASCENDING)])]
+    missing = missing_indexes(declared, ["_id_", "created_at_-1"])
+    assert [index.document["name"] for index in missing] == ["salary_min_1"]
+
+def test_declared_index_names_unique():
+    """Test no collection declares the same index twice"""
+    for declared in INDEX_SPECS.values():
+        names = [index.document["name"] for index in declared]
+        assert len(names) == len(set(names))
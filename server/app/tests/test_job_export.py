@@ -0,0 +1,82 @@
+import asyncio
+import csv
+import io
+import json
+import sys
+import os
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from bson import ObjectId
+from app.core.database import JOBS_COLLECTION
+from app.services.job_service import JobService
+from app.utils.job_export import CSV_COLUMNS, EXPORT_CHUNK_SIZE
+from app.utils.job_fields import derive_job_fields
+
+def _job(number, company="Acme", description="Backend role"):
+    job = {
+        "_id": ObjectId(),
+        "data": {
+            "title": f"Backend Engineer {number}",
+            "company": company,
+            "location": "Remote",
+            "seniority": "Mid",
+            "employment_type": "Full-time",
+            "salary": "$100k - $120k",
+            "tech_skills": ["Python", "Go"],
+            "soft_skills": [],
+            "job_link": f"https://jobs.example.com/{number}",
+            "date_posted": "Not specified",
+            "description": description
+        },
+        "status": "NEW",
+        "created_at": datetime(2025, 8, 1) + timedelta(hours=number),
+        "updated_at": datetime(2025, 8, 1) + timedelta(hours=number)
+    }
+    job.update(derive_job_fields(job))
+    return job
+
+def _export(fake_db, jobs, filters=None, export_format="ndjson"):
+    asyncio.run(fake_db[JOBS_COLLECTION].insert_many(jobs))
+    service = JobService(fake_db)
+
+    async def collect():
+        return [chunk async for chunk in service.export_jobs(filters or {}, export_format=export_format)]
+    return asyncio.run(collect())
+
+def test_ndjson_export_filters_and_omits_internal_fields(fake_db):
+    """Test NDJSON export applies the filters and leaves out lookup fields"""
+    jobs = [_job(1), _job(2, company="Globex"), _job(3)]
+    chunks = _export(fake_db, jobs, {"company": "acme"})
+
+    records = [json.loads(line) for line in b"".join(chunks).decode("utf-8").splitlines()]
+    assert [record["data"]["title"] for record in records] == ["Backend Engineer 3", "Backend Engineer 1"]
+    for record in records:
+        assert "normalized" not in record
+        assert "fingerprint" not in record
+        assert record["salary_min"] == 100000
+
+def test_csv_export_rows(fake_db):
+    """Test CSV export writes the header and one flat row per job"""
+    jobs = [_job(1), _job(2)]
+    chunks = _export(fake_db, jobs, export_format="csv")
+
+    rows = list(csv.reader(io.StringIO(b"".join(chunks).decode("utf-8"))))
+    assert rows[0] == CSV_COLUMNS
+    assert len(rows) == 3
+    row = dict(zip(CSV_COLUMNS, rows[1]))
+    assert row["id"] == str(jobs[1]["_id"])
+    assert row["tech_skills"] == "Python; Go"
+    assert row["created_at"] == jobs[1]["created_at"].isoformat()
+
+def test_export_chunks_hold_whole_records(fake_db):
+    """Test large exports are split into chunks of about EXPORT_CHUNK_SIZE on record boundaries"""
+    jobs = [_job(number, description="x" * 10000) for number in range(20)]
+
+    for export_format in ("ndjson", "csv"):
+        fake_db[JOBS_COLLECTION].documents.clear()
+        chunks = _export(fake_db, jobs, export_format=export_format)
+        assert len(chunks) > 1
+        assert all(len(chunk) >= EXPORT_CHUNK_SIZE for chunk in chunks[:-1])
+        assert all(chunk.endswith(b"\n") for chunk in chunks)
+        assert len(b"".join(chunks).splitlines()) == 20 + (export_format == "csv")
@@ -0,0 +1,33 @@
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.utils.job_fields import normalize_text, match_condition, job_fingerprint
+
+def test_normalize_text():
+    """Test values are case-folded with whitespace collapsed"""
+    assert normalize_text("  Acme   Corp ") == "acme corp"
+    assert normalize_text(None) is None
+
+def test_match_condition_modes():
+    """Test each match mode builds a case-insensitive condition"""
+    assert match_condition("ACME", "exact") == "acme"
+    assert match_condition("Acme", "prefix") == {"$regex": "^acme"}
+    assert match_condition("Acme", "contains") == {"$regex": "acme"}
+
+def test_match_condition_escapes_input():
+    """Test regex metacharacters in user input are matched literally"""
+    assert match_condition("C++ (Remote)", "contains") == {"$regex": r"c\+\+\ \(remote\)"}
+
+def test_job_fingerprint_canonical_link():
+    """Test links differing only in tracking, scheme or trailing slash share a fingerprint"""
+    a = job_fingerprint({"job_link": "https://www.Example.com/jobs/42/?utm_source=x&b=2&a=1"})
+    b = job_fingerprint({"job_link": "http://example.com/jobs/42?a=1&b=2"})
+    assert a == b
+    assert a != job_fingerprint({"job_link": "https://example.com/jobs/43"})
+
+def test_job_fingerprint_company_title_fallback():
+    """Test jobs without a usable link are identified by company and title"""
+    a = job_fingerprint({"company": "Acme", "title": "Backend  Engineer", "job_link": ""})
+    b = job_fingerprint({"company": "ACME", "title": "backend engineer", "job_link": "Not specified"})
+    assert a == b
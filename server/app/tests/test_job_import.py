@@ -0,0 +1,197 @@
+import asyncio
+import copy
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from app.controllers import job_controller
+from app.models.job import JobCreate
+from app.services.import_service import prepare_scraped_jobs
+from app.services.job_service import JobService, DUPLICATE_KEY_ERROR
+
+class FakeJobs:
+    """
+    Stores jobs by fingerprint and rejects upserts of jobs titled "Invalid".
+
+    Jobs passed as concurrent are hidden from the lookup, as if another
+    writer inserted them between the lookup and the bulk write.
+    """
+
+    def __init__(self, stored, concurrent=()):
+        self.stored = {doc["fingerprint"]: doc for doc in [*stored, *concurrent]}
+        self.hidden = {doc["fingerprint"] for doc in concurrent}
+
+    async def _iterate(self, docs):
+        for doc in docs:
+            yield doc
+
+    def find(self, query):
+        keys = query["fingerprint"]["$in"]
+        return self._iterate([self.stored[key] for key in keys if key in self.stored and key not in self.hidden])
+
+    async def find_one(self, query):
+        return copy.deepcopy(self.stored.get(query["fingerprint"]))
+
+    async def update_one(self, query, update):
+        for doc in self.stored.values():
+            if doc["_id"] == query["_id"]:
+                doc.update(update["$set"])
+
+    async def bulk_write(self, operations, ordered=True):
+        upserted, errors = [], []
+        for index, operation in enumerate(operations):
+            key = operation._filter["fingerprint"]
+            update = operation._doc
+            fields = {**update.get("$setOnInsert", {}), **update.get("$set", {})}
+            if fields["data"]["title"] == "Invalid":
+                errors.append({"index": index, "code": 121, "errmsg": "Document failed validation"})
+            elif key in self.stored:
+                self.stored[key].update(update.get("$set", {}))
+            else:
+                self.stored[key] = {"_id": ObjectId(), **fields}
+                upserted.append({"index": index, "_id": self.stored[key]["_id"]})
+        details = {"writeErrors": errors, "upserted": upserted}
+        if errors:
+            raise BulkWriteError(details)
+
+        class Result:
+            upserted_ids = {item["index"]: item["_id"] for item in upserted}
+        return Result()
+
+def _job(scraped_job, link, title="Full Stack Developer"):
+    job = copy.deepcopy(scraped_job)
+    job["data"]["job_link"] = link
+    job["data"]["title"] = title
+    return job
+
+def _service(collection):
+    service = JobService.__new__(JobService)
+    service.collection = collection
+    service.changes = []
+
+    async def on_jobs_changed(removed, added):
+        service.changes.append((removed, added))
+
+    service._on_jobs_changed = on_jobs_changed
+    return service
+
+def test_import_chunk_results_in_input_order(scraped_job):
+    """Test new, existing, repeated and rejected jobs each get their own action and id"""
+    documents = [document for document, _ in prepare_scraped_jobs([
+        _job(scraped_job, "https://gamma.app/jobs/new"),
+        _job(scraped_job, "https://gamma.app/jobs/existing"),
+        _job(scraped_job, "https://gamma.app/jobs/other"),
+        _job(scraped_job, "https://gamma.app/jobs/new?utm_source=feed"),
+        _job(scraped_job, "https://gamma.app/jobs/invalid", title="Invalid")
+    ])]
+    existing_id = ObjectId()
+    stored = {**copy.deepcopy(documents[1]), "_id": existing_id, "status": "ANALYZED"}
+
+    service = _service(FakeJobs([stored]))
+
+    results = asyncio.run(service.import_prepared_jobs(documents))
+    actions = [result["action"] for result in results]
+    assert actions == ["created", "updated", "created", "updated", "failed"]
+
+    new_id = str(service.collection.stored[documents[0]["fingerprint"]]["_id"])
+    other_id = str(service.collection.stored[documents[2]["fingerprint"]]["_id"])
+    assert [result["job_id"] for result in results] == [new_id, str(existing_id), other_id, new_id, None]
+    assert results[4]["error"] == "Document failed validation"
+    assert new_id != other_id
+
+    # The stored job keeps its status; the maintainers see one removal and three additions
+    assert service.collection.stored[documents[1]["fingerprint"]]["status"] == "ANALYZED"
+    removed, added = service.changes[0]
+    assert [doc["_id"] for doc in removed] == [existing_id]
+    assert len(added) == 3
+
+def test_import_updates_job_inserted_concurrently(scraped_job):
+    """Test a job inserted by another writer after the lookup is updated and its counters replaced"""
+    document, _ = prepare_scraped_jobs([scraped_job])[0]
+    concurrent_id = ObjectId()
+    concurrent = {**copy.deepcopy(document), "_id": concurrent_id, "status": "ANALYZED"}
+    concurrent["data"]["description"] = "Inserted by another writer"
+    service = _service(FakeJobs([], concurrent=[copy.deepcopy(concurrent)]))
+
+    results = asyncio.run(service.import_prepared_jobs([document]))
+    assert results == [{"action": "updated", "job_id": str(concurrent_id), "error": None}]
+
+    stored = service.collection.stored[document["fingerprint"]]
+    assert stored["data"]["description"] == "Full-stack role"
+    assert stored["status"] == "ANALYZED"
+
+    # The copy the other writer counted is swapped for the updated one
+    removed, added = service.changes[0]
+    assert removed == [concurrent]
+    assert added[0]["_id"] == concurrent_id
+    assert added[0]["data"]["description"] == "Full-stack role"
+
+class FakeInsertJobs:
+    """Rejects inserts of job links already stored, like the unique fingerprint index."""
+
+    def __init__(self, links):
+        self.links = set(links)
+
+    async def insert_one(self, document):
+        if document["data"]["job_link"] in self.links:
+            raise DuplicateKeyError("E11000 duplicate key error", code=DUPLICATE_KEY_ERROR)
+        self.links.add(document["data"]["job_link"])
+
+        class Result:
+            inserted_id = document["_id"]
+        return Result()
+
+    async def insert_many(self, documents, ordered=True):
+        inserted, errors = [], []
+        for index, document in enumerate(documents):
+            if document["data"]["job_link"] in self.links:
+                errors.append({"index": index, "code": DUPLICATE_KEY_ERROR, "errmsg": "E11000 duplicate key error"})
+                if ordered:
+                    break
+                continue
+            self.links.add(document["data"]["job_link"])
+            inserted.append(document["_id"])
+        if errors:
+            raise BulkWriteError({"writeErrors": errors, "nInserted": len(inserted)})
+
+        class Result:
+            inserted_ids = inserted
+        return Result()
+
+def test_create_duplicate_job_is_conflict(scraped_job):
+    """Test creating a job that duplicates a stored one returns 409 without touching the maintainers"""
+    service = _service(FakeInsertJobs(["https://gamma.app/jobs/1"]))
+
+    with pytest.raises(HTTPException) as raised:
+        asyncio.run(job_controller.create_job(JobCreate(**_job(scraped_job, "https://gamma.app/jobs/1")), service))
+    assert raised.value.status_code == 409
+    assert service.changes == []
+
+def test_bulk_create_keeps_going_past_duplicates(scraped_job):
+    """Test a bulk create writes every new job, maintains them and reports the duplicate indexes"""
+    service = _service(FakeInsertJobs(["https://gamma.app/jobs/2"]))
+    jobs = [JobCreate(**_job(scraped_job, f"https://gamma.app/jobs/{number}")) for number in (1, 2, 3, 2)]
+
+    with pytest.raises(HTTPException) as raised:
+        asyncio.run(job_controller.bulk_create_jobs(jobs, service))
+    assert raised.value.status_code == 409
+    assert raised.value.detail["duplicate_indexes"] == [1, 3]
+    assert raised.value.detail["created"] == 2
+
+    removed, added = service.changes[0]
+    assert removed == []
+    assert [doc["data"]["job_link"] for doc in added] == ["https://gamma.app/jobs/1", "https://gamma.app/jobs/3"]
+
+def test_bulk_create_without_duplicates(scraped_job):
+    """Test a bulk create without conflicts returns every id and maintains every job"""
+    service = _service(FakeInsertJobs([]))
+    jobs = [JobCreate(**_job(scraped_job, f"https://gamma.app/jobs/{number}")) for number in (1, 2)]
+
+    job_ids = asyncio.run(job_controller.bulk_create_jobs(jobs, service))
+    assert job_ids == [str(job.id) for job in jobs]
+    assert len(service.changes[0][1]) == 2
@@ -0,0 +1,39 @@
+from types import SimpleNamespace
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from pymongo.monitoring import ConnectionCheckOutFailedReason
+
+from app.core.mongo_pool import PoolMetrics, client_options
+from app.core.config import settings
+
+def test_pool_metrics_track_checkouts():
+    """Test checkouts, in-use connections and timed-out waits are counted"""
+    metrics = PoolMetrics()
+    event = SimpleNamespace(reason=ConnectionCheckOutFailedReason.TIMEOUT)
+    metrics.connection_created(event)
+    for _ in range(2):
+        metrics.connection_check_out_started(event)
+        metrics.connection_checked_out(event)
+    metrics.connection_checked_in(event)
+    metrics.connection_check_out_started(event)
+    metrics.connection_check_out_failed(event)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["checkouts"] == 2
+    assert snapshot["in_use"] == 1
+    assert snapshot["open_connections"] == 1
+    assert snapshot["checkout_timeouts"] == 1
+    assert snapshot["checkouts_in_progress"] == 0
+    assert snapshot["max_checkouts_in_progress"] == 1
+
+def test_client_options_from_settings(monkeypatch):
+    """Test pool options come from settings and blank compressors are left out"""
+    monkeypatch.setattr(settings, "MONGODB_MAX_POOL_SIZE", 7)
+    monkeypatch.setattr(settings, "MONGODB_COMPRESSORS", "")
+    assert client_options()["maxPoolSize"] == 7
+    assert "compressors" not in client_options()
+
+    monkeypatch.setattr(settings, "MONGODB_COMPRESSORS", " zstd, zlib ")
+    assert client_options()["compressors"] == "zstd,zlib"
@@ -0,0 +1,23 @@
+import asyncio
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.utils.ndjson import iter_ndjson_lines
+
+async def _stream(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+async def _collect(chunks, **kwargs):
+    return [item async for item in iter_ndjson_lines(chunks, **kwargs)]
+
+def test_lines_split_across_chunks():
+    """Test lines are reassembled across chunk boundaries and blank lines skipped"""
+    lines = asyncio.run(_collect(_stream(b'{"a":', b'1}\n\n{"b"', b':2}')))
+    assert lines == [(1, b'{"a":1}'), (3, b'{"b":2}')]
+
+def test_oversized_line_skipped():
+    """Test lines over the limit are reported without being buffered"""
+    lines = asyncio.run(_collect(_stream(b"ok\n", b"x" * 8, b"x" * 8, b"\nnext\n"), max_line_bytes=10))
+    assert lines == [(1, b"ok"), (2, None), (3, b"next")]
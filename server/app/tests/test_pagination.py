@@ -0,0 +1,71 @@
+import asyncio
+import sys
+import os
+from datetime import datetime
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import pytest
+from bson import ObjectId
+from app.utils.pagination import encode_cursor, decode_cursor, drop_field
+
+def test_cursor_round_trip():
+    """Test cursors preserve the sort position, including datetimes"""
+    last_id = ObjectId()
+    created_at = datetime(2025, 8, 17, 0, 2, 43, 608000)
+    cursor = encode_cursor("created_at", -1, created_at, last_id)
+    assert decode_cursor(cursor) == ("created_at", -1, created_at, last_id)
+
+def test_invalid_cursor():
+    """Test malformed cursors are rejected"""
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+def test_drop_field_removes_emptied_parents():
+    """Test dropping a dotted path keeps siblings and removes emptied parents"""
+    document = {"_id": 1, "data": {"title": "Dev", "company": "Acme"}, "meta": {"x": 1}}
+    drop_field(document, "data.company")
+    drop_field(document, "meta.x")
+    drop_field(document, "missing.field")
+    assert document == {"_id": 1, "data": {"title": "Dev"}}
+
+def test_page_omits_sort_field_not_requested():
+    """Test the sort field added for the cursor is not returned to the client"""
+    from app.services.job_service import JobService
+
+    stored = [
+        {"_id": ObjectId(), "created_at": datetime(2025, 8, day), "data": {"title": f"Job {day}"}}
+        for day in (3, 2, 1)
+    ]
+
+    class FakeCursor:
+        def __init__(self, projection):
+            self.projection = projection
+
+        def sort(self, *args):
+            return self
+
+        def skip(self, count):
+            return self
+
+        def limit(self, count):
+            return self
+
+        async def to_list(self, length):
+            fields = [field.split(".")[0] for field in self.projection]
+            return [
+                {"_id": job["_id"], **{field: job[field] for field in fields if field in job}}
+                for job in stored[:length]
+            ]
+
+    class FakeJobs:
+        def find(self, query, projection):
+            return FakeCursor(projection)
+
+    service = JobService.__new__(JobService)
+    service.collection = FakeJobs()
+
+    jobs, _, next_cursor = asyncio.run(service.get_jobs_page(
+        {}, limit=2, include_total=False, projection={"data.title": 1}, model=None
+    ))
+    assert [set(job) for job in jobs] == [{"_id", "data"}, {"_id", "data"}]
+    assert decode_cursor(next_cursor)[2] == datetime(2025, 8, 2)
@@ -0,0 +1,21 @@
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.utils.roles import classify_role
+
+def test_abbreviations_match_whole_words():
+    """Test short keywords do not match inside longer words"""
+    assert classify_role("Development Lead") == ["Other"]
+    assert classify_role("Build and Release Coordinator") == ["Other"]
+    assert classify_role("HTML Email Specialist") == ["Other"]
+    assert classify_role("Detail Oriented Assistant") == ["Other"]
+    assert classify_role("Senior UI/UX Designer") == ["Designer"]
+    assert classify_role("AI Researcher") == ["Data"]
+    assert classify_role("Technical PM") == ["Product"]
+
+def test_keywords_match_word_starts():
+    """Test longer keywords still match plurals and derived words"""
+    assert classify_role("Engineering Manager") == ["Developer", "Product"]
+    assert classify_role("Backend Developer") == ["Developer"]
+    assert classify_role(None) == ["Other"]
@@ -0,0 +1,20 @@
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.utils.salary import parse_salary_range
+
+def test_parse_salary_range():
+    """Test salary ranges and k suffixes are parsed"""
+    assert parse_salary_range("$40k - $60k") == (40000, 60000)
+    assert parse_salary_range("$3-5k per month") == (36000, 60000)
+
+def test_parse_salary_period_annualized():
+    """Test hourly and monthly salaries are annualized"""
+    assert parse_salary_range("$45/hr") == (93600, 93600)
+    assert parse_salary_range("$2,500+") == (30000, 30000)
+
+def test_parse_salary_unusable():
+    """Test salaries without amounts yield no range"""
+    assert parse_salary_range("Competitive") == (None, None)
+    assert parse_salary_range(None) == (None, None)
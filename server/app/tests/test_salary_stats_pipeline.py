@@ -0,0 +1,14 @@
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.services.dashboard_service import DashboardService
+
+def test_histograms_limited_to_top_groups():
+    """Test histogram buckets are only computed for the groups the stats kept"""
+    stats = DashboardService.build_salary_stats_pipeline("data.location", 2)
+    assert stats[-1] == {"$limit": 2}
+
+    histogram = DashboardService.build_salary_histogram_pipeline("data.location", ["Remote", None], 10000, 300000)
+    assert histogram[0] == {"$match": {"data.location": {"$in": ["Remote", None]}}}
+    assert histogram[-1]["$group"]["_id"] == "$_id.group"
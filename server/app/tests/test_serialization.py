@@ -0,0 +1,19 @@
+import json
+import sys
+import os
+from datetime import datetime
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from app.core.serialization import dumps
+from app.models.analytics import SalaryByLevel
+
+def test_dumps_matches_default_encoder():
+    """Test the fast path encodes ObjectIds, datetimes and models like FastAPI"""
+    content = {
+        "_id": ObjectId(),
+        "created_at": datetime(2025, 8, 17, 0, 2, 43, 608904),
+        "salary_ranges": SalaryByLevel(senior="$85-120k", mid="$60-85k", junior="N/A")
+    }
+    assert json.loads(dumps(content)) == jsonable_encoder(content, custom_encoder={ObjectId: str})
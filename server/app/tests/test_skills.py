@@ -0,0 +1,31 @@
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.services.job_service import JobService
+from app.utils.skills import canonical_skill, canonicalize_skills
+
+def test_canonical_skill_aliases():
+    """Test spelling variants resolve to one canonical skill"""
+    for variant in ["React", "React.js", "reactjs", " ReactJS "]:
+        assert canonical_skill(variant) == "React"
+    assert canonical_skill("NodeJS") == "Node.js"
+    assert canonical_skill("golang") == "Go"
+    assert canonical_skill("problem-solving") == "Problem Solving"
+
+def test_canonical_skill_unknown():
+    """Test skills outside the taxonomy are kept as written"""
+    assert canonical_skill("  Apache   Kafka ") == "Apache Kafka"
+    assert canonical_skill("") is None
+
+def test_canonicalize_skills_deduplicates():
+    """Test aliases of the same skill collapse into one entry"""
+    assert canonicalize_skills(["React.js", "Node.js", "react", "NodeJS", ""]) == ["React", "Node.js"]
+
+def test_filter_query_canonicalizes_skills():
+    """Test skill aliases in a job filter match the canonical names stored on jobs"""
+    query = JobService.build_filter_query(skills=["React.js", "reactjs", "golang"])
+    assert query["$or"] == [
+        {"data.tech_skills": {"$in": ["React", "Go"]}},
+        {"data.soft_skills": {"$in": ["React", "Go"]}}
+    ]
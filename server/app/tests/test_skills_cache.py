@@ -0,0 +1,77 @@
+import asyncio
+import copy
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.core.database import JOBS_COLLECTION
+from app.services.skills_cache_service import SkillsCacheService
+
+def _job(tech_skills, company, seniority, soft_skills=()):
+    return {"data": {
+        "tech_skills": list(tech_skills),
+        "soft_skills": list(soft_skills),
+        "company": company,
+        "seniority": seniority
+    }}
+
+def _skill(service, skill, skill_type="tech"):
+    return asyncio.run(service.collection.find_one({"_id": service.skill_id(skill_type, skill)}))
+
+def test_deltas_keep_counters_exact(fake_db):
+    """Test add, remove and update deltas, including two jobs sharing a company"""
+    service = SkillsCacheService(fake_db)
+    first = _job(["Python", "Go"], "Acme", "Mid")
+    second = _job(["Python"], "Acme", "Senior")
+
+    asyncio.run(service.apply_job_changes([], [first, second]))
+    python = _skill(service, "Python")
+    assert python["job_count"] == 2
+    assert python["seniority"] == {"Mid": 1, "Senior": 1}
+    assert python["company_count"] == 1
+    assert _skill(service, "Go")["job_count"] == 1
+
+    # The company stays counted while another job still lists it
+    asyncio.run(service.apply_job_changes([first], []))
+    python = _skill(service, "Python")
+    assert python["job_count"] == 1
+    assert python["seniority"]["Senior"] == 1
+    assert python["company_count"] == 1
+    assert _skill(service, "Go") is None
+    assert asyncio.run(service.collection.find_one({"_id": service.company_id("tech", "Go", "Acme")})) is None
+
+    # Moving the remaining job to another company swaps the company documents
+    moved = copy.deepcopy(second)
+    moved["data"]["company"] = "Globex"
+    asyncio.run(service.apply_job_changes([second], [moved]))
+    assert _skill(service, "Python")["company_count"] == 1
+    assert asyncio.run(service.collection.find_one({"_id": service.company_id("tech", "Python", "Acme")})) is None
+    assert asyncio.run(service.collection.find_one({"_id": service.company_id("tech", "Python", "Globex")})) is not None
+
+    asyncio.run(service.apply_job_changes([moved], []))
+    assert asyncio.run(service.collection.count_documents({})) == 0
+
+def test_maintained_counters_match_aggregation(fake_db):
+    """Test get_top_skills returns what aggregate_top_skills computes from the same jobs"""
+    service = SkillsCacheService(fake_db)
+    jobs = [
+        _job(["Python", "Go"], "Acme", "Mid", ["Communication"]),
+        _job(["Python", "React"], "Acme", "Senior", ["Communication", "Leadership"]),
+        _job(["Python"], "Globex", "Senior"),
+        _job(["React"], "", "Junior", ["Leadership"]),
+        _job(["Go", "Rust"], "Initech", "Mid")
+    ]
+    asyncio.run(service.mark_ready())
+    asyncio.run(service.apply_job_changes([], jobs))
+
+    # Remove one job and update another, then store the resulting corpus
+    updated = copy.deepcopy(jobs[1])
+    updated["data"]["tech_skills"] = ["Python", "Rust"]
+    updated["data"]["seniority"] = "Lead"
+    asyncio.run(service.apply_job_changes([jobs[0], jobs[1]], [updated]))
+    asyncio.run(fake_db[JOBS_COLLECTION].insert_many([updated, *copy.deepcopy(jobs[2:])]))
+
+    for skill_type in ("tech", "soft"):
+        maintained = asyncio.run(service.get_top_skills(skill_type, limit=20))
+        aggregated = asyncio.run(service.aggregate_top_skills(skill_type, limit=20))
+        assert sorted(maintained, key=lambda item: item["skill"]) == sorted(aggregated, key=lambda item: item["skill"])
@@ -1,26 +1,9 @@
-"""Database utility functions."""
+"""Database utility functions.
 
-import motor.motor_asyncio
-from app.core.config import settings
+Kept for existing imports; the application has a single MongoDB client,
+owned by app.core.database.
+"""
 
-# Database connection
-client = None
-database = None
+from app.core.database import get_database, close_mongo_connection as close_database_connection
 
-
-async def get_database():
-    """Get database instance for dependency injection."""
-    global client, database
-    
-    if database is None:
-        client = motor.motor_asyncio.AsyncIOMotorClient(settings.MONGODB_URL)
-        database = client[settings.MONGODB_DB]
-    
-    return database
-
-
-async def close_database_connection():
-    """Close database connection."""
-    global client
-    if client:
-        client.close()
+__all__ = ["get_database", "close_database_connection"]
@@ -0,0 +1,51 @@
+"""Flat row layout for job exports."""
+
+from datetime import datetime
+from typing import Any, Dict, List
+
+# Target size of each chunk written to an export stream
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+# Lookup fields kept on stored jobs for indexing and deduplication only
+EXPORT_PROJECTION = {"normalized": 0, "fingerprint": 0}
+
+CSV_COLUMNS = [
+    "id", "title", "company", "location", "seniority", "employment_type",
+    "salary", "salary_min", "salary_max", "status", "role_category",
+    "tech_skills", "soft_skills", "job_link", "date_posted", "description",
+    "created_at", "updated_at"
+]
+
+def _cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        return "; ".join(str(item) for item in value)
+    return value
+
+def csv_row(job: Dict[str, Any]) -> List[Any]:
+    """Flatten a stored job document into the CSV_COLUMNS order."""
+    data = job.get("data") or {}
+    values = {
+        "id": str(job.get("_id", "")),
+        "title": data.get("title"),
+        "company": data.get("company"),
+        "location": data.get("location"),
+        "seniority": data.get("seniority"),
+        "employment_type": data.get("employment_type"),
+        "salary": data.get("salary"),
+        "salary_min": job.get("salary_min"),
+        "salary_max": job.get("salary_max"),
+        "status": job.get("status"),
+        "role_category": job.get("role_category"),
+        "tech_skills": data.get("tech_skills"),
+        "soft_skills": data.get("soft_skills"),
+        "job_link": data.get("job_link"),
+        "date_posted": data.get("date_posted"),
+        "description": data.get("description"),
+        "created_at": job.get("created_at"),
+        "updated_at": job.get("updated_at")
+    }
+    return [_cell(values[column]) for column in CSV_COLUMNS]
@@ -0,0 +1,91 @@
+"""Fields derived from a job's scraped data once, at write time."""
+
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+import hashlib
+import re
+from app.utils.roles import classify_role
+from app.utils.salary import parse_salary_range
+
+# Scraped fields the derived fields are computed from
+SOURCE_FIELDS = [
+    "data.title", "data.salary", "data.company", "data.location",
+    "data.seniority", "data.employment_type", "data.job_link"
+]
+
+# data.* fields with a case-folded copy under normalized.* for indexed matching
+NORMALIZED_FIELDS = ["company", "location", "seniority", "employment_type"]
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+def normalize_text(value: Optional[str]) -> Optional[str]:
+    """Case-fold a value and collapse its whitespace, for matching filters."""
+    if not isinstance(value, str):
+        return None
+    return _WHITESPACE_PATTERN.sub(" ", value).strip().casefold()
+
+def match_condition(value: str, match: str = "contains") -> Any:
+    """
+    Build the condition matching a user-supplied value against a normalized
+    field with the "exact", "prefix" or "contains" mode.
+
+    The value is normalized the same way as the stored field, so exact and
+    anchored prefix matches stay case-insensitive while remaining index seeks.
+    """
+    normalized = normalize_text(value) or ""
+    if match == "exact":
+        return normalized
+    if match == "prefix":
+        return {"$regex": f"^{re.escape(normalized)}"}
+    if match == "contains":
+        return {"$regex": re.escape(normalized)}
+    raise ValueError(f"Invalid match mode: {match}")
+
+# Query parameters that only record where a link was shared or clicked
+_TRACKING_PARAMS = {"ref", "source", "trk", "gclid", "fbclid"}
+
+def canonical_job_link(link: Optional[str]) -> Optional[str]:
+    """
+    Reduce a job link to the parts that identify the posting: host without
+    "www.", path without trailing slash, and sorted non-tracking query
+    parameters. Returns None for values that are not URLs.
+    """
+    if not isinstance(link, str) or not link.strip():
+        return None
+    parts = urlsplit(link.strip())
+    if not parts.netloc:
+        return None
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in _TRACKING_PARAMS
+    ))
+    return f"{host}{parts.path.rstrip('/')}" + (f"?{query}" if query else "")
+
+def job_fingerprint(data: Dict[str, Any]) -> str:
+    """
+    The dedup key of a job: a hash of its canonical link, or of its
+    normalized company and title when it has no usable link.
+    """
+    link = canonical_job_link(data.get("job_link"))
+    if link:
+        source = f"link:{link}"
+    else:
+        source = f"company:{normalize_text(data.get('company')) or ''}|title:{normalize_text(data.get('title')) or ''}"
+    return hashlib.sha1(source.encode("utf-8")).hexdigest()
+
+def derive_job_fields(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Compute the indexed top-level fields stored alongside a job's data."""
+    data = job.get("data") or {}
+    salary_min, salary_max = parse_salary_range(data.get("salary"))
+    return {
+        "role_category": classify_role(data.get("title")),
+        # Annualized salary range parsed from the free-text salary
+        "salary_min": salary_min,
+        "salary_max": salary_max,
+        "normalized": {field: normalize_text(data.get(field)) for field in NORMALIZED_FIELDS},
+        # Unique identity of the posting, used to deduplicate imports
+        "fingerprint": job_fingerprint(data)
+    }
@@ -0,0 +1,21 @@
+"""Helpers for using free-text values as MongoDB field names."""
+
+# MongoDB field names may not contain "." or start with "$", so scraped values
+# such as "St. Louis" are stored with the full-width lookalikes instead.
+_ENCODINGS = ((".", "．"), ("$", "＄"))
+
+def encode_key(value: str) -> str:
+    """Encode a value so it can be used as a document field name."""
+    for raw, encoded in _ENCODINGS:
+        value = value.replace(raw, encoded)
+    return value
+
+def decode_key(key: str) -> str:
+    """Reverse encode_key."""
+    for raw, encoded in _ENCODINGS:
+        key = key.replace(encoded, raw)
+    return key
+
+def decode_counts(counts: dict) -> dict:
+    """Decode the keys of a counter map, dropping non-positive entries."""
+    return {decode_key(key): count for key, count in (counts or {}).items() if count > 0}
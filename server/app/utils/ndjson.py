@@ -0,0 +1,43 @@
+"""Incremental splitting of NDJSON request bodies."""
+
+from typing import AsyncIterator, Optional, Tuple
+
+# Longest line accepted from an NDJSON body; longer lines are reported and skipped
+MAX_LINE_BYTES = 1024 * 1024
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterator[bytes],
+    max_line_bytes: int = MAX_LINE_BYTES
+) -> AsyncIterator[Tuple[int, Optional[bytes]]]:
+    """
+    Yield (line_number, line) for every non-blank line of a byte stream,
+    holding at most one line in memory. Lines over max_line_bytes are
+    yielded as (line_number, None) without being buffered.
+    """
+    buffer = b""
+    line_number = 0
+    oversized = False
+
+    async for chunk in chunks:
+        lines = (buffer + chunk).split(b"\n")
+        buffer = lines.pop()
+        for line in lines:
+            line_number += 1
+            if oversized:
+                # The tail of a line whose start was already dropped
+                oversized = False
+                yield line_number, None
+            elif len(line) > max_line_bytes:
+                yield line_number, None
+            elif line.strip():
+                yield line_number, line
+
+        if len(buffer) > max_line_bytes:
+            # Drop the rest of this line as it arrives
+            oversized = True
+            buffer = b""
+
+    if oversized or len(buffer) > max_line_bytes:
+        yield line_number + 1, None
+    elif buffer.strip():
+        yield line_number + 1, buffer
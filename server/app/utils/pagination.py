@@ -0,0 +1,72 @@
+"""Opaque keyset cursors for paginating sorted job listings."""
+
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+import base64
+import json
+
+from bson import ObjectId
+
+def encode_cursor(sort_field: str, sort_order: int, value: Any, last_id: ObjectId) -> str:
+    """Encode the position after a document as an opaque, URL-safe cursor."""
+    payload = {"f": sort_field, "o": sort_order, "id": str(last_id), "v": value}
+    if isinstance(value, datetime):
+        payload["v"] = value.isoformat()
+        payload["t"] = "datetime"
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[str, int, Any, ObjectId]:
+    """Decode a cursor into (sort_field, sort_order, value, last_id). Raises ValueError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        value = payload["v"]
+        if payload.get("t") == "datetime":
+            value = datetime.fromisoformat(value)
+        return payload["f"], int(payload["o"]), value, ObjectId(payload["id"])
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+
+def field_value(document: Dict[str, Any], path: str) -> Any:
+    """Read a dotted field path such as "data.company" from a document."""
+    value: Optional[Any] = document
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+def drop_field(document: Dict[str, Any], path: str) -> None:
+    """Remove a dotted field path from a document, and any parents it leaves empty."""
+    parent, _, leaf = path.rpartition(".")
+    container = field_value(document, parent) if parent else document
+    if not isinstance(container, dict):
+        return
+    container.pop(leaf, None)
+    if parent and not container:
+        drop_field(document, parent)
+
+def keyset_filter(sort_field: str, sort_order: int, value: Any, last_id: ObjectId) -> Dict[str, Any]:
+    """
+    Match the documents that come after (value, last_id) in the
+    [(sort_field, sort_order), ("_id", sort_order)] order.
+
+    Missing and null values sort before everything else, so they come first
+    when ascending and last when descending.
+    """
+    op = "$gt" if sort_order == 1 else "$lt"
+
+    if value is None:
+        after_nulls = [{sort_field: None, "_id": {op: last_id}}]
+        if sort_order == 1:
+            after_nulls.append({sort_field: {"$ne": None}})
+        return {"$or": after_nulls}
+
+    conditions = [
+        {sort_field: {op: value}},
+        {sort_field: value, "_id": {op: last_id}}
+    ]
+    if sort_order == -1:
+        conditions.append({sort_field: None})
+    return {"$or": conditions}
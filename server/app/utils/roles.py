@@ -0,0 +1,42 @@
+"""Role category classification for job titles."""
+
+from typing import List, Optional
+import re
+
+# Keywords matched against the lower-cased job title, in priority order.
+# Keywords match at the start of a word ("engineering", "designers"), and
+# abbreviations of up to three letters only as whole words, so "ui" does
+# not match "build" nor "pm" "development"
+ROLE_PATTERNS = {
+    "Developer": ["developer", "engineer", "programmer", "backend", "frontend", "full stack"],
+    "Designer": ["designer", "ui", "ux"],
+    "Data": ["data", "analyst", "scientist", "ml", "ai"],
+    "DevOps": ["devops", "sre", "infrastructure", "cloud"],
+    "Product": ["product", "manager", "pm"],
+    "Marketing": ["marketing", "growth", "content"],
+    "Sales": ["sales", "business", "account"]
+}
+
+OTHER_CATEGORY = "Other"
+
+ROLE_CATEGORIES = list(ROLE_PATTERNS.keys()) + [OTHER_CATEGORY]
+
+ABBREVIATION_MAX_LENGTH = 3
+
+def _keyword_pattern(keyword: str) -> str:
+    pattern = r"\b" + re.escape(keyword)
+    return pattern + r"\b" if len(keyword) <= ABBREVIATION_MAX_LENGTH else pattern
+
+_ROLE_REGEXES = {
+    category: re.compile("|".join(_keyword_pattern(keyword) for keyword in keywords))
+    for category, keywords in ROLE_PATTERNS.items()
+}
+
+def classify_role(title: Optional[str]) -> List[str]:
+    """Return every role category whose keywords appear in the title, or ["Other"]."""
+    title_lower = (title or "").lower()
+    categories = [
+        category for category, regex in _ROLE_REGEXES.items()
+        if regex.search(title_lower)
+    ]
+    return categories or [OTHER_CATEGORY]
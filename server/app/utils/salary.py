@@ -0,0 +1,90 @@
+"""Normalization of free-text salaries into annualized numeric ranges."""
+
+from typing import Optional, Tuple
+import re
+
+# Multipliers from a pay period to a year
+PERIOD_MULTIPLIERS = {
+    "hour": 2080,
+    "day": 260,
+    "week": 52,
+    "month": 12,
+    "year": 1
+}
+
+_PERIOD_PATTERNS = [
+    ("hour", re.compile(r"(/\s*h(ou)?r\b|per\s+hour|hourly|an?\s+hour)", re.I)),
+    ("day", re.compile(r"(/\s*day\b|per\s+day|daily|a\s+day)", re.I)),
+    ("week", re.compile(r"(/\s*w(ee)?k\b|per\s+week|weekly|a\s+week)", re.I)),
+    ("month", re.compile(r"(/\s*mo(nth)?\b|per\s+month|monthly|a\s+month|\bpm\b)", re.I)),
+    ("year", re.compile(r"(/\s*y(ea)?r\b|per\s+(year|annum)|annual(ly)?|yearly|a\s+year|\bp\.?a\.?\b)", re.I))
+]
+
+# An amount with optional thousands separators, decimals and a k/m suffix
+_AMOUNT_PATTERN = re.compile(r"(\d[\d,]*(?:\.\d+)*)\s*([km])?(?![a-z])", re.I)
+_DOT_THOUSANDS_PATTERN = re.compile(r"^\d{1,3}(\.\d{3})+$")
+
+# Without an explicit period, amounts below these are read as hourly/monthly pay
+HOURLY_THRESHOLD = 200
+MONTHLY_THRESHOLD = 20000
+
+# Annualized amounts outside this range are treated as parsing noise
+MIN_ANNUAL_SALARY = 1000
+MAX_ANNUAL_SALARY = 5000000
+
+def _detect_period(text: str) -> Optional[str]:
+    for period, pattern in _PERIOD_PATTERNS:
+        if pattern.search(text):
+            return period
+    return None
+
+def _parse_amounts(text: str) -> list:
+    amounts = []
+    for number, suffix in _AMOUNT_PATTERN.findall(text):
+        if _DOT_THOUSANDS_PATTERN.match(number):
+            # European style "60.000"
+            number = number.replace(".", "")
+        try:
+            value = float(number.replace(",", ""))
+        except ValueError:
+            continue
+        amounts.append((value, suffix.lower()))
+
+    # "3-5k" shares the suffix of its upper bound
+    if len(amounts) >= 2 and amounts[1][1] and not amounts[0][1] and amounts[0][0] < 1000:
+        amounts[0] = (amounts[0][0], amounts[1][1])
+
+    multipliers = {"": 1, "k": 1000, "m": 1000000}
+    return [value * multipliers[suffix] for value, suffix in amounts]
+
+def parse_salary_range(salary: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Parse a salary string into an annualized (min, max) range.
+
+    Handles ranges ("$40k - $60k"), open-ended values ("$2,500+"), k/m
+    suffixes and explicit pay periods ("$45/hr", "$5,000 per month"). When no
+    period is given, small amounts are read as hourly or monthly pay. A single
+    value yields min == max. Returns (None, None) when nothing usable is found.
+    """
+    if not salary or salary.strip().lower() in ["not specified", "competitive", "negotiable"]:
+        return None, None
+
+    amounts = _parse_amounts(salary)[:2]
+    if not amounts:
+        return None, None
+
+    period = _detect_period(salary)
+    if period is None:
+        largest = max(amounts)
+        if largest < HOURLY_THRESHOLD:
+            period = "hour"
+        elif largest < MONTHLY_THRESHOLD:
+            period = "month"
+        else:
+            period = "year"
+
+    annual = sorted(int(round(amount * PERIOD_MULTIPLIERS[period])) for amount in amounts)
+    if annual[0] < MIN_ANNUAL_SALARY or annual[-1] > MAX_ANNUAL_SALARY:
+        return None, None
+
+    return annual[0], annual[-1]
@@ -0,0 +1,133 @@
+"""Canonical skill taxonomy and alias resolution for scraped skills."""
+
+from typing import Any, Dict, Iterable, List, Optional
+import re
+
+# Job data fields holding skill lists
+SKILL_FIELDS = ["tech_skills", "soft_skills"]
+
+# Canonical skill name -> other spellings seen in scraped postings.
+# Spellings that only differ in case, spaces, dots, dashes or underscores
+# ("React.js" / "reactjs", "Problem-solving") resolve without an alias.
+SKILL_TAXONOMY = {
+    # Languages
+    "JavaScript": ["JS", "ES6", "ECMAScript"],
+    "TypeScript": ["TS"],
+    "Python": ["Python3"],
+    "Java": [],
+    "C++": ["CPP"],
+    "C#": ["CSharp", "C Sharp"],
+    "Go": ["Golang"],
+    "R": [],
+    "PHP": [],
+    "Ruby": [],
+    "Rust": [],
+    "Kotlin": [],
+    "Swift": [],
+    "SQL": [],
+    "HTML": ["HTML5"],
+    "CSS": ["CSS3"],
+    "Shell Scripting": ["Bash", "Shell", "Bash Scripting"],
+    # Frameworks and libraries
+    "React": ["React.js", "ReactJS"],
+    "React Native": [],
+    "Next.js": ["Next", "NextJS"],
+    "Node.js": ["Node", "NodeJS"],
+    "Nest.js": ["NestJS"],
+    "Express.js": ["Express", "ExpressJS"],
+    "Vue.js": ["Vue", "VueJS"],
+    "Angular": ["AngularJS", "Angular.js"],
+    "Django": [],
+    "Flask": [],
+    "FastAPI": [],
+    "Spring Boot": [],
+    "Laravel": [],
+    "Ruby on Rails": ["Rails", "RoR"],
+    "TensorFlow": [],
+    "PyTorch": ["Torch"],
+    # Data stores
+    "MongoDB": ["Mongo"],
+    "PostgreSQL": ["Postgres", "PSQL"],
+    "MySQL": [],
+    "Redis": [],
+    "Elasticsearch": ["Elastic"],
+    # Cloud and infrastructure
+    "AWS": ["Amazon Web Services"],
+    "Azure": ["Microsoft Azure"],
+    "Google Cloud": ["GCP", "Google Cloud Platform"],
+    "Docker": [],
+    "Kubernetes": ["K8s"],
+    "Terraform": [],
+    "Linux": [],
+    "Git": [],
+    "CI/CD": ["CICD", "CI CD", "CI/CD Pipelines", "Continuous Integration"],
+    "Jenkins": [],
+    "GitHub Actions": [],
+    # Practices
+    "REST APIs": ["REST", "REST API", "RESTful", "RESTful APIs", "RESTful API"],
+    "GraphQL": [],
+    "Microservices": ["Microservice", "Microservices Architecture"],
+    "Machine Learning": ["ML"],
+    "Data Analysis": ["Data Analytics"],
+    "Statistics": [],
+    # Soft skills
+    "Communication": ["Communication Skills"],
+    "Leadership": [],
+    "Teamwork": ["Team Player"],
+    "Problem Solving": ["Problem Solving Skills"],
+    "Critical Thinking": [],
+    "Adaptability": [],
+    "Time Management": [],
+    "Creativity": [],
+    "Analytical Skills": ["Analytical Thinking"],
+    "Customer Focus": [],
+    "Collaboration": [],
+    "Innovation": [],
+    "Strategic Thinking": [],
+    "Decision Making": [],
+    "Conflict Resolution": []
+}
+
+_KEY_IGNORED = re.compile(r"[\s._\-]+")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+def _skill_key(name: str) -> str:
+    return _KEY_IGNORED.sub("", name).casefold()
+
+# Lookup key of every canonical name and alias -> canonical name
+_ALIAS_INDEX = {
+    _skill_key(alias): canonical
+    for canonical, aliases in SKILL_TAXONOMY.items()
+    for alias in [canonical, *aliases]
+}
+
+def canonical_skill(name: Any) -> Optional[str]:
+    """
+    Resolve a scraped skill to its canonical name.
+
+    Skills outside the taxonomy are kept with their whitespace tidied;
+    blank and non-string values yield None.
+    """
+    if not isinstance(name, str):
+        return None
+    cleaned = _WHITESPACE_PATTERN.sub(" ", name).strip()
+    if not cleaned:
+        return None
+    return _ALIAS_INDEX.get(_skill_key(cleaned), cleaned)
+
+def canonicalize_skills(skills: Optional[Iterable[Any]]) -> List[str]:
+    """Canonicalize a skill list, dropping blanks and duplicates but keeping order."""
+    result: List[str] = []
+    for skill in skills or []:
+        canonical = canonical_skill(skill)
+        if canonical and canonical not in result:
+            result.append(canonical)
+    return result
+
+def canonical_job_skills(data: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Canonical versions of the skill lists present in a job's data."""
+    return {
+        field: canonicalize_skills(data[field])
+        for field in SKILL_FIELDS
+        if isinstance(data.get(field), list)
+    }
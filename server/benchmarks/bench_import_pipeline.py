@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark: the validation and normalization stage of a scraped-job import.
+
+Prepares NDJSON lines of scraper output in chunks (pydantic validation,
+date parsing, skill canonicalization, salary/role/fingerprint derivation)
+either inline on the event loop or in the process pool, as the import
+pipeline does. A ticker coroutine measures how late the event loop wakes
+up meanwhile, i.e. the latency every other request would see. No database
+writes are involved.
+
+Usage:
+    python benchmarks/bench_import_pipeline.py [--jobs 20000] [--chunk 500] [--workers 2]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.core import process_pool
+from app.core.config import settings
+from app.services.import_service import prepare_scraped_job_lines
+
+TICK_SECONDS = 0.001
+
+def make_lines(count: int) -> list:
+    """Build numbered NDJSON lines of realistic scraper responses."""
+    description = "We are looking for a highly skilled engineer to join our remote team. " * 30
+    lines = []
+    for i in range(count):
+        lines.append((i + 1, json.dumps({
+            "data": {
+                "company": f"Company {i % 50}",
+                "date_posted": "Not specified",
+                "description": description,
+                "employment_type": "Full-time",
+                "job_link": f"https://example.com/jobs/{i}?utm_source=feed",
+                "location": "Remote",
+                "salary": ["$40k - $60k", "$2,500+", "$45/hr", "Competitive"][i % 4],
+                "scraped_at": "Sun, 17 Aug 2025 00:02:43 GMT",
+                "seniority": ["Junior", "Mid", "Senior"][i % 3],
+                "soft_skills": ["communication", "teamwork", "problem-solving"],
+                "tech_skills": ["Python", "FastAPI", "MongoDB", "React.js", "NodeJS", "k8s"],
+                "title": f"Senior Backend Engineer {i}",
+                "updated_at": "Sun, 17 Aug 2025 00:02:43 GMT"
+            },
+            "message": "Job scraped",
+            "scraped_at": "2025-08-17T00:02:43.608904",
+            "success": True
+        }).encode("utf-8")))
+    return lines
+
+async def measure(lines: list, chunk_size: int, in_flight: int) -> dict:
+    """Prepare every chunk, keeping up to in_flight chunks submitted, while sampling loop lag."""
+    lags = []
+    running = True
+
+    async def ticker():
+        while running:
+            start = time.perf_counter()
+            await asyncio.sleep(TICK_SECONDS)
+            lags.append(time.perf_counter() - start - TICK_SECONDS)
+
+    ticker_task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    prepared = 0
+    pending = []
+    for start in range(0, len(lines), chunk_size):
+        pending.append(process_pool.run_in_process(prepare_scraped_job_lines, lines[start:start + chunk_size]))
+        if len(pending) >= in_flight:
+            prepared += sum(1 for _, document, _ in await pending.pop(0) if document)
+        # Chunks arrive from the network one at a time
+        await asyncio.sleep(0)
+    for future in pending:
+        prepared += sum(1 for _, document, _ in await future if document)
+    elapsed = time.perf_counter() - started
+
+    running = False
+    await ticker_task
+    lags.sort()
+    return {
+        "prepared": prepared,
+        "elapsed": elapsed,
+        "max_lag": lags[-1] if lags else 0.0,
+        "p99_lag": lags[int(len(lags) * 0.99) - 1] if lags else 0.0,
+        "median_lag": statistics.median(lags) if lags else 0.0
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=20000)
+    parser.add_argument("--chunk", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=settings.IMPORT_PROCESS_WORKERS or 2)
+    args = parser.parse_args()
+
+    lines = make_lines(args.jobs)
+    print(f"{args.jobs} jobs in chunks of {args.chunk}, {os.cpu_count()} CPUs")
+
+    settings.IMPORT_PROCESS_WORKERS = 0
+    inline = asyncio.run(measure(lines, args.chunk, in_flight=1))
+
+    settings.IMPORT_PROCESS_WORKERS = args.workers
+    # Start the workers and import the app in them before timing
+    asyncio.run(measure(lines[:args.chunk * args.workers], args.chunk, in_flight=args.workers))
+    pooled = asyncio.run(measure(lines, args.chunk, in_flight=args.workers))
+    process_pool.shutdown_process_pool()
+
+    assert inline["prepared"] == pooled["prepared"] == args.jobs
+    for name, result in [("inline (event loop)", inline), (f"process pool ({args.workers})", pooled)]:
+        print(
+            f"  {name:<22} {result['elapsed']:7.2f} s  {args.jobs / result['elapsed']:8.0f} jobs/s  "
+            f"loop lag median {result['median_lag'] * 1000:6.2f} ms, p99 {result['p99_lag'] * 1000:7.2f} ms, "
+            f"max {result['max_lag'] * 1000:7.2f} ms"
+        )
+
+if __name__ == "__main__":
+    main()
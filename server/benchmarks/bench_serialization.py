@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark: serializing a 1000-job /jobs/ page.
+
+Compares FastAPI's default path (jsonable_encoder + JSONResponse) with the
+fast_json path (app.core.serialization), with and without orjson.
+
+Usage:
+    python benchmarks/bench_serialization.py [--jobs 1000] [--repeat 20]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core import serialization
+from app.models.job import ScrapedJob
+
+def make_page(count: int) -> dict:
+    """Build a /jobs/ response page of realistic ScrapedJob models."""
+    now = datetime.utcnow()
+    description = "We are looking for a highly skilled engineer to join our remote team. " * 30
+    jobs = []
+    for i in range(count):
+        jobs.append(ScrapedJob(
+            _id=ObjectId(),
+            data={
+                "company": f"Company {i % 50}",
+                "date_posted": "Not specified",
+                "description": description,
+                "employment_type": "Full-time",
+                "job_link": f"https://example.com/jobs/{i}",
+                "location": "Remote",
+                "salary": "$40k - $60k",
+                "scraped_at": "Sun, 17 Aug 2025 00:02:43 GMT",
+                "seniority": ["Junior", "Mid", "Senior"][i % 3],
+                "soft_skills": ["communication", "teamwork", "problem-solving"],
+                "tech_skills": ["Python", "FastAPI", "MongoDB", "React.js", "Docker"],
+                "title": f"Software Engineer {i}",
+                "updated_at": "Sun, 17 Aug 2025 00:02:43 GMT"
+            },
+            message="Job imported",
+            scraped_at=now.isoformat(),
+            success=True,
+            role_category=["Developer"],
+            salary_min=40000,
+            salary_max=60000,
+            created_at=now - timedelta(minutes=i),
+            updated_at=now
+        ))
+    return {"jobs": jobs, "total_count": count, "skip": 0, "limit": count, "has_more": False}
+
+def default_path(page: dict) -> bytes:
+    return JSONResponse(jsonable_encoder(page)).body
+
+def fast_path(page: dict) -> bytes:
+    return serialization.FastJSONResponse(page).body
+
+def fast_path_stdlib(page: dict) -> bytes:
+    orjson, serialization.orjson = serialization.orjson, None
+    try:
+        return serialization.FastJSONResponse(page).body
+    finally:
+        serialization.orjson = orjson
+
+def measure(func, page: dict, repeat: int) -> float:
+    func(page)  # warm up
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(page)
+        timings.append(time.perf_counter() - start)
+    return sorted(timings)[len(timings) // 2]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    page = make_page(args.jobs)
+    expected = json.loads(default_path(page))
+
+    paths = [("jsonable_encoder + json", default_path)]
+    if serialization.orjson is not None:
+        paths.append(("fast_json (orjson)", fast_path))
+    else:
+        print("orjson is not installed; only the stdlib fallback is measured")
+    paths.append(("fast_json (stdlib)", fast_path_stdlib))
+
+    baseline = None
+    print(f"{args.jobs} jobs per page, median of {args.repeat} runs")
+    for name, func in paths:
+        assert json.loads(func(page)) == expected, f"{name} output differs from the default path"
+        median = measure(func, page, args.repeat)
+        baseline = baseline or median
+        size = len(func(page))
+        print(f"  {name:<26} {median * 1000:8.2f} ms  {baseline / median:5.1f}x  ({size / 1024:.0f} KiB)")
+
+if __name__ == "__main__":
+    main()
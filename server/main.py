@@ -1,8 +1,22 @@
+import logging
+import time
+
+# Measured before the app's imports, for the cold-start time reported by /health
+APP_IMPORT_STARTED = time.perf_counter()
+
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
-from app.core.database import connect_to_mongo, close_mongo_connection
-from app.controllers import auth_controller, job_controller, analytics_controller, scraped_jobs_controller, seeder_controller, dashboard_controller
+from app.core.database import connect_to_mongo, close_mongo_connection, index_status
+from app.core.mongo_pool import pool_metrics
+from app.core.cache import response_cache, request_coalescer
+from app.core.http_cache import ConditionalGetMiddleware
+from app.core.process_pool import shutdown_process_pool
+from app.services.import_service import start_import_workers, stop_import_workers
+from app.controllers import auth_controller, job_controller, analytics_controller, scraped_jobs_controller, seeder_controller, dashboard_controller, import_controller
+
+logger = logging.getLogger(__name__)
 
 # Create FastAPI app
 app = FastAPI(
@@ -11,6 +25,14 @@ app = FastAPI(
     description="RemotelyX API - Job Market Analytics for Recruiters"
 )
 
+# Set once startup has finished, cleared when shutdown begins
+app.state.ready = False
+app.state.startup_seconds = None
+
+# Answer unchanged read requests with 304 Not Modified. Added before CORS
+# so the CORS middleware wraps it and its 304s carry CORS headers too
+app.add_middleware(ConditionalGetMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -27,15 +49,28 @@ app.include_router(analytics_controller.router, prefix=settings.API_V1_STR)
 app.include_router(scraped_jobs_controller.router)
 app.include_router(seeder_controller.router, prefix=settings.API_V1_STR)
 app.include_router(dashboard_controller.router, prefix=settings.API_V1_STR)
+app.include_router(import_controller.router, prefix=settings.API_V1_STR)
 
 # Startup event
 @app.on_event("startup")
 async def startup_event():
-    await connect_to_mongo()
+    started = time.perf_counter()
+    # Missing indexes are built in the background so startup does not wait for them
+    await connect_to_mongo(background_indexes=True)
+    start_import_workers()
+    app.state.startup_seconds = time.perf_counter() - APP_IMPORT_STARTED
+    app.state.ready = True
+    logger.info(
+        f"Ready in {app.state.startup_seconds:.2f}s since app import "
+        f"({time.perf_counter() - started:.2f}s in startup)"
+    )
 
 # Shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
+    app.state.ready = False
+    await stop_import_workers()
+    shutdown_process_pool()
     await close_mongo_connection()
 
 # Root endpoint
@@ -51,4 +86,25 @@ async def root():
 # Health check endpoint
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "service": "RemotelyX API"}
+    """Liveness plus readiness; answers 503 until startup has finished."""
+    startup_seconds = app.state.startup_seconds
+    return JSONResponse(
+        status_code=200 if app.state.ready else 503,
+        content={
+            "status": "healthy" if app.state.ready else "unavailable",
+            "service": "RemotelyX API",
+            "ready": app.state.ready,
+            "startup_seconds": round(startup_seconds, 3) if startup_seconds is not None else None,
+            "indexes": index_status()
+        }
+    )
+
+# MongoDB connection pool metrics
+@app.get("/health/db")
+async def database_pool_metrics():
+    return {"pool": pool_metrics.snapshot()}
+
+# Response cache hits and requests coalesced per route
+@app.get("/health/cache")
+async def response_cache_metrics():
+    return {"cache": response_cache.stats(), "coalescing": request_coalescer.stats()}
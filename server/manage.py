@@ -8,6 +8,11 @@ Usage:
     python manage.py reset            # Reset database (drop all collections)
     python manage.py status           # Show migration and seed status
     python manage.py setup            # Run migrations + seeds (full setup)
+    python manage.py rebuild-skills   # Rebuild the skills_cache counters from the jobs collection
+    python manage.py rebuild-rollup   # Rebuild the jobs_daily_rollup counters from the jobs collection
+    python manage.py rebuild-filters  # Rebuild the filter_options dictionary from the jobs collection
+    python manage.py backfill-fields  # Recompute derived job fields (role_category, ...)
+    python manage.py canonicalize-skills  # Rewrite stored skills with their canonical names
 """
 
 import asyncio
@@ -120,8 +125,79 @@ async def setup_database():
     print()
     await run_seeds()
     print()
+    await rebuild_skills_cache()
+    print()
+    await rebuild_daily_rollup()
+    print()
+    await rebuild_filter_options()
+    print()
     print("🎉 Database setup completed successfully!")
 
+async def rebuild_skills_cache():
+    """Rebuild the per-skill counters from the jobs collection"""
+    try:
+        from app.services.skills_cache_service import SkillsCacheService
+        
+        print("🔄 Rebuilding skills cache...")
+        total = await SkillsCacheService().rebuild()
+        print(f"✅ Skills cache rebuilt from {total} jobs!")
+        
+    except Exception as e:
+        print(f"❌ Skills cache rebuild failed: {str(e)}")
+        sys.exit(1)
+
+async def rebuild_daily_rollup():
+    """Rebuild the per-day job counters from the jobs collection"""
+    try:
+        from app.services.daily_rollup_service import DailyRollupService
+        
+        print("🔄 Rebuilding daily rollup...")
+        total = await DailyRollupService().rebuild()
+        print(f"✅ Daily rollup rebuilt from {total} jobs!")
+        
+    except Exception as e:
+        print(f"❌ Daily rollup rebuild failed: {str(e)}")
+        sys.exit(1)
+
+async def rebuild_filter_options():
+    """Rebuild the filter dictionary from the jobs collection"""
+    try:
+        from app.services.filter_options_service import FilterOptionsService
+        
+        print("🔄 Rebuilding filter options...")
+        total = await FilterOptionsService().rebuild()
+        print(f"✅ Filter options rebuilt with {total} values!")
+        
+    except Exception as e:
+        print(f"❌ Filter options rebuild failed: {str(e)}")
+        sys.exit(1)
+
+async def backfill_job_fields():
+    """Recompute the derived fields stored on every job"""
+    try:
+        from app.services.job_service import JobService
+        
+        print("🔄 Backfilling derived job fields...")
+        total = await JobService().backfill_derived_fields()
+        print(f"✅ Backfilled {total} jobs!")
+        
+    except Exception as e:
+        print(f"❌ Backfill failed: {str(e)}")
+        sys.exit(1)
+
+async def canonicalize_skills():
+    """Rewrite the stored skill lists with their canonical names"""
+    try:
+        from app.services.job_service import JobService
+        
+        print("🔄 Canonicalizing stored skills...")
+        total = await JobService().canonicalize_stored_skills()
+        print(f"✅ Canonicalized skills of {total} jobs!")
+        
+    except Exception as e:
+        print(f"❌ Skill canonicalization failed: {str(e)}")
+        sys.exit(1)
+
 def print_usage():
     """Print usage information"""
     print(__doc__)
@@ -153,6 +229,16 @@ async def main():
             await show_status()
         elif command == "setup":
             await setup_database()
+        elif command == "rebuild-skills":
+            await rebuild_skills_cache()
+        elif command == "rebuild-rollup":
+            await rebuild_daily_rollup()
+        elif command == "rebuild-filters":
+            await rebuild_filter_options()
+        elif command == "backfill-fields":
+            await backfill_job_fields()
+        elif command == "canonicalize-skills":
+            await canonicalize_skills()
         else:
             print(f"❌ Unknown command: {command}")
             print_usage()
@@ -82,7 +82,12 @@ class MigrationManager:
 			"003_create_activity_logs_collection",
 			"004_create_indexes",
 			"005_add_user_roles_index",
-			"006_add_scraped_job_fields"
+			"006_add_scraped_job_fields",
+			"007_add_role_category",
+			"008_add_salary_fields",
+			"009_add_normalized_fields",
+			"010_canonicalize_skills",
+			"011_add_fingerprint_index"
 		]
 		
 	def get_migration_function(self, migration_name: str):
@@ -93,7 +98,12 @@ class MigrationManager:
 			"003_create_activity_logs_collection": self._create_activity_logs_collection,
 			"004_create_indexes": self._create_indexes,
 			"005_add_user_roles_index": self._add_user_roles_index,
-			"006_add_scraped_job_fields": self._add_scraped_job_fields
+			"006_add_scraped_job_fields": self._add_scraped_job_fields,
+			"007_add_role_category": self._add_role_category,
+			"008_add_salary_fields": self._add_salary_fields,
+			"009_add_normalized_fields": self._add_normalized_fields,
+			"010_canonicalize_skills": self._canonicalize_skills,
+			"011_add_fingerprint_index": self._add_fingerprint_index
 		}
 		return migration_functions.get(migration_name)
 		
@@ -235,4 +245,53 @@ class MigrationManager:
 			await jobs_collection.create_index("tech_skills")
 			await jobs_collection.create_index("employment_type")
 		except Exception as e:
-			logger.warning(f"Index creation warning: {e}") 
\ No newline at end of file
+			logger.warning(f"Index creation warning: {e}") 
+
+	async def _add_role_category(self):
+		"""Classify existing jobs into the indexed role_category field"""
+		from app.services.job_service import JobService
+
+		jobs_collection = get_collection("jobs")
+		await jobs_collection.create_index("role_category")
+		job_service = JobService()
+		# The backfill also writes fingerprints, which must not collide
+		# once the unique fingerprint index exists
+		await job_service.remove_duplicate_jobs()
+		await job_service.backfill_derived_fields()
+
+	async def _add_salary_fields(self):
+		"""Parse existing salaries into the indexed salary_min/salary_max fields"""
+		from app.services.job_service import JobService
+
+		jobs_collection = get_collection("jobs")
+		await jobs_collection.create_index("salary_min")
+		await JobService().backfill_derived_fields()
+
+	async def _add_normalized_fields(self):
+		"""Store case-folded filter fields under normalized.* and index them"""
+		from app.services.job_service import JobService
+		from app.utils.job_fields import NORMALIZED_FIELDS
+
+		jobs_collection = get_collection("jobs")
+		for field in NORMALIZED_FIELDS:
+			await jobs_collection.create_index(f"normalized.{field}")
+		await JobService().backfill_derived_fields()
+
+	async def _canonicalize_skills(self):
+		"""Resolve stored skill aliases to their canonical names"""
+		from app.services.job_service import JobService
+
+		await JobService().canonicalize_stored_skills()
+
+	async def _add_fingerprint_index(self):
+		"""Fingerprint existing jobs, drop duplicates and add the unique fingerprint index"""
+		from app.services.job_service import JobService
+
+		job_service = JobService()
+		await job_service.remove_duplicate_jobs()
+		await job_service.backfill_derived_fields()
+		await job_service.collection.create_index(
+			"fingerprint",
+			unique=True,
+			partialFilterExpression={"fingerprint": {"$type": "string"}}
+		)